@@ -1,10 +1,8 @@
 import streamlit as st
-import geopandas as gpd
-import pandas as pd
-import folium
-import json
-from streamlit_folium import st_folium
-from branca.colormap import linear, LinearColormap
+from utils.precarga import iniciar_precarga, mostrar_precarga
+
+# Rellena las cachés en segundo plano mientras se lee la portada
+iniciar_precarga()
 
 # --- UI ---
 st.title("🗺️ Análisis poblacional de España")
@@ -12,6 +10,8 @@ st.markdown(
     ":blue-badge[Carles Carbonell Sales] :green-badge[:material/home: UPV] :orange-badge[:material/star: MUIARFID] :gray-badge[📊 VD] :red-badge[🗺️ España]"
 )
 
+mostrar_precarga()
+
 st.image("images/image1.jpg","")
 
 st.header("Descripción del proyecto:")
@@ -1,50 +1,25 @@
 import streamlit as st
-import geopandas as gpd
 import pandas as pd
-import folium
-import json
 import altair as alt
-from streamlit_folium import st_folium
-from branca.colormap import linear, LinearColormap
-from datetime import datetime
-
-def limpiar_indices(df):
-    df.columns.values[0] = 'Provincia'
-    df['Provincia'] = df['Provincia'].str.replace(r'^\d+\s*', '', regex=True).str.strip()
-    df.set_index('Provincia', inplace=True)
-    df.index = df.index.str[3:]
-    df.index = df.index.map(lambda x: '/'.join(x.split('/')[::-1]) if '/' in x else x)
-    df.index = df.index.map(lambda x: ' '.join(x.split(', ')[::-1]) if ', ' in x else x)
-    return df
-
-month_map = {
-    'enero': '01', 'febrero': '02', 'marzo': '03', 'abril': '04',
-    'mayo': '05', 'junio': '06', 'julio': '07', 'agosto': '08',
-    'septiembre': '09', 'octubre': '10', 'noviembre': '11', 'diciembre': '12'
-}
-
-def parse_fecha(fecha_str):
-    try:
-        partes = fecha_str.lower().split(' de ')
-        if len(partes) == 3:
-            dia = partes[0].zfill(2)         
-            mes_nombre = partes[1].strip()    
-            año = partes[2].strip()          
-            mes_num = month_map.get(mes_nombre)
-            if mes_num:
-                return datetime.strptime(f"{año}-{mes_num}-{dia}", "%Y-%m-%d")
-    except:
-        pass
-    return pd.NaT
+import streamlit.components.v1 as components
+from utils.artefactos import GRAFICOS, version_tabla
+from utils.clasificacion import METODOS
+from utils.datos import cargar_tabla
+from utils.fechas import fechas_columnas
+from utils.geometria import geometria_provincias
+from utils.mapas import mapa_periodo, mapa_temporal, periodos_mapa
+from utils.municipios import mostrar_mapa_municipal
+from utils.provincias import provincias_sin_datos
+from utils.precarga import iniciar_precarga
+from utils.rendimiento import iniciar_panel, mostrar_panel
+
+iniciar_precarga()
+iniciar_panel()
 
 # --- Cargar datos ---
-provincias = gpd.read_file('datasets/recintos_provinciales_inspire_peninbal_etrs89.shp').to_crs("EPSG:4326")
-provincias = provincias[['NAMEUNIT', 'geometry']].rename(columns={'NAMEUNIT': 'Provincia'})
-gdf = gpd.GeoDataFrame(provincias, crs="EPSG:4326")
-
-pob_homb_df = limpiar_indices(pd.read_excel('datasets/PobHomb.xlsx', skiprows=6))
-pob_muj_df = limpiar_indices(pd.read_excel('datasets/PobMuj.xlsx', skiprows=6))
-pob_tot_df = limpiar_indices(pd.read_excel('datasets/PobTot.xlsx', skiprows=6))
+pob_homb_df = cargar_tabla('PobHomb')
+pob_muj_df = cargar_tabla('PobMuj')
+pob_tot_df = cargar_tabla('PobTot')
 
 # --- UI ---
 st.title("🏙️ Análisis poblacional general")
@@ -62,9 +37,22 @@ st.text(
 )
 st.sidebar.header("Filtros")
 
-data_columns = pob_tot_df.select_dtypes(include=['float64', 'int']).columns.tolist()
-selected_column = st.sidebar.selectbox("Selecciona una fecha", data_columns)
+nivel = st.sidebar.radio(
+    "Nivel del mapa", ["Provincias", "Municipios"], horizontal=True,
+    help="El mapa municipal muestra dentro de cada provincia qué municipios pierden población."
+)
+mapa_cliente = st.sidebar.toggle(
+    "Cambiar de fecha en el propio mapa", value=True,
+    help="El mapa incluye un deslizador de fechas y un selector de sexo que no recargan la página."
+)
+data_columns = pob_tot_df.select_dtypes(include='number').columns.tolist()
+if not mapa_cliente:
+    selected_column = st.sidebar.selectbox("Selecciona una fecha", data_columns)
 genero = st.sidebar.radio("Selecciona grupo poblacional", ["Total", "Hombres", "Mujeres"], index=0)
+metodo = st.sidebar.selectbox(
+    "Clasificación del color", list(METODOS), format_func=METODOS.get,
+    help="Con cuantiles cada color agrupa el mismo número de provincias, así no quedan todas en el mismo tono."
+)
 
 if genero == "Hombres":
     pob_df = pob_homb_df
@@ -73,49 +61,37 @@ elif genero == "Mujeres":
 else:
     pob_df = pob_tot_df
 
-gdf_gen = gdf.merge(pob_df, on='Provincia', how='left').fillna(1)
-if selected_column not in gdf_gen.columns:
-    st.warning(f"La columna '{selected_column}' no existe para {genero.lower()}.")
-    st.stop()
-
-vmin = float(gdf_gen[selected_column].min())
-vmax = float(gdf_gen[selected_column].max())
-caption = f"Población de {genero.lower()} en {selected_column}"
-
-colormap = LinearColormap(
-    colors=linear.viridis.colors,
-    vmin=vmin,
-    vmax=vmax,
-    caption=caption,
-    tick_labels=[vmin, vmax]
-)
+try:
+    # El mapa municipal no usa los límites provinciales
+    if nivel == "Provincias":
+        faltan = provincias_sin_datos(geometria_provincias(), pob_df)
+        if faltan:
+            st.warning(f"No hay datos de población para: {', '.join(faltan)}.")
+
+    map_container = st.empty()
+    if nivel == "Municipios":
+        with map_container.container():
+            mostrar_mapa_municipal(genero, metodo)
+    elif mapa_cliente:
+        with map_container:
+            components.html(
+                mapa_temporal(
+                    {"Total": pob_tot_df, "Hombres": pob_homb_df, "Mujeres": pob_muj_df},
+                    periodos_mapa(pob_tot_df),
+                    "Población",
+                    metodo=metodo,
+                ),
+                height=600,
+            )
+    else:
+        if selected_column not in pob_df.columns:
+            st.warning(f"La columna '{selected_column}' no existe para {genero.lower()}.")
+            st.stop()
 
-gdf_gen['geometry'] = gdf_gen['geometry'].simplify(0.001, preserve_topology=True)
-m = folium.Map(zoom_start=6)
-m.fit_bounds([[*gdf_gen.total_bounds[1::-1]], [*gdf_gen.total_bounds[3:1:-1]]])
-
-folium.GeoJson(
-    json.loads(gdf_gen.to_json()),
-    style_function=lambda feature: {
-        "fillColor": colormap(feature["properties"][selected_column]) if feature["properties"][selected_column] else "#ffffff",
-        "color": "black",
-        "weight": 1,
-        "dashArray": "5, 5",
-        "fillOpacity": 0.7,
-    },
-    tooltip=folium.GeoJsonTooltip(
-        fields=["Provincia", selected_column],
-        aliases=["Provincia:", "Población:"],
-        localize=True
-    )
-).add_to(m)
-
-colormap.options = {"position": "bottomleft"}
-colormap.add_to(m)
-
-map_container = st.empty()
-with map_container:
-    st_folium(m, use_container_width=True, height=600, returned_objects=[], key=f"map_{selected_column}_{genero}")
+        with map_container:
+            components.html(mapa_periodo("Población", selected_column, genero, metodo=metodo), height=600)
+except Exception as e:
+    st.error(f"Error al crear el mapa: {e}")
 
 chart_anchor = st.empty()
 with chart_anchor:
@@ -130,48 +106,51 @@ st.text(
     "cierta paridad entre el número de mujeres y hombres."
 )
 
-chart_container = st.empty()
 
-with chart_container:
-    if genero == "Total":
-        # Stacked area chart
-        serie_h = pob_homb_df.sum(axis=0)
-        serie_m = pob_muj_df.sum(axis=0)
-
-        df_h = pd.DataFrame({
-            "Fecha": serie_h.index.astype(str),
-            "Población": serie_h.values,
-            "Sexo": "Hombres"
-        })
+def grafico_apilado():
+    """Especificación Vega-Lite del área apilada de hombres y mujeres."""
+    serie_h = pob_homb_df.sum(axis=0)
+    serie_m = pob_muj_df.sum(axis=0)
 
-        df_m = pd.DataFrame({
-            "Fecha": serie_m.index.astype(str),
-            "Población": serie_m.values,
-            "Sexo": "Mujeres"
-        })
+    df_h = pd.DataFrame({
+        "Fecha": fechas_columnas('PobHomb'),
+        "Población": serie_h.values,
+        "Sexo": "Hombres"
+    })
+
+    df_m = pd.DataFrame({
+        "Fecha": fechas_columnas('PobMuj'),
+        "Población": serie_m.values,
+        "Sexo": "Mujeres"
+    })
+
+    df_stacked = pd.concat([df_h, df_m])
 
-        df_stacked = pd.concat([df_h, df_m])
+    df_stacked = df_stacked.dropna().sort_values("Fecha")
 
-        df_stacked["Fecha"] = df_stacked["Fecha"].map(parse_fecha)
-        df_stacked = df_stacked.dropna().sort_values("Fecha")
+    return alt.Chart(df_stacked).mark_area().encode(
+        x=alt.X("Fecha:T", title="Fecha"),
+        y=alt.Y("Población:Q", stack="zero"),
+        color=alt.Color("Sexo:N", scale=alt.Scale(scheme='tableau10')),
+        tooltip=["Fecha:T", "Sexo:N", "Población:Q"]
+    ).properties(width=700, height=400).interactive().to_dict()
 
-        chart = alt.Chart(df_stacked).mark_area().encode(
-            x=alt.X("Fecha:T", title="Fecha"),
-            y=alt.Y("Población:Q", stack="zero"),
-            color=alt.Color("Sexo:N", scale=alt.Scale(scheme='tableau10')),
-            tooltip=["Fecha:T", "Sexo:N", "Población:Q"]
-        ).properties(width=700, height=400).interactive()
 
-        st.altair_chart(chart, use_container_width=True, key=f"chart_{genero}")
+chart_container = st.empty()
+
+with chart_container:
+    if genero == "Total":
+        # Stacked area chart, compartido entre sesiones
+        spec = GRAFICOS.obtener(("Población", "apilado", version_tabla("PobHomb"), version_tabla("PobMuj")), grafico_apilado)
+        st.vega_lite_chart(spec, use_container_width=True, key=f"chart_{genero}")
 
     else:
         serie_evolucion = pob_df.sum(axis=0)
         df_evolucion = pd.DataFrame({
-            "Fecha": serie_evolucion.index.astype(str),
+            "Fecha": fechas_columnas('PobHomb' if genero == "Hombres" else 'PobMuj'),
             "Población": serie_evolucion.values
         })
 
-        df_evolucion["Fecha"] = df_evolucion["Fecha"].map(parse_fecha)
         df_evolucion = df_evolucion.dropna().sort_values("Fecha").set_index("Fecha")
 
         st.line_chart(df_evolucion)
@@ -186,10 +165,7 @@ st.markdown("""
     .stPlotlyChart, .stAltairChart {
         position: relative;
     }
-    
-    /* Mantener altura consistente */
-    iframe[title="streamlit_folium.st_folium"] {
-        height: 600px !important;
-    }
 </style>
-""", unsafe_allow_html=True)
\ No newline at end of file
+""", unsafe_allow_html=True)
+
+mostrar_panel()
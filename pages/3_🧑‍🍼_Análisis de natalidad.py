@@ -1,53 +1,37 @@
 import streamlit as st
-import geopandas as gpd
 import pandas as pd
-import folium
-import json
 import altair as alt
-from streamlit_folium import st_folium
-from branca.colormap import linear, LinearColormap
-
-def limpiar_indices(df):
-    if df is None or df.empty:
-        return df
-    
-    df.columns.values[0] = 'Provincia'
-    df['Provincia'] = df['Provincia'].str.replace(r'^\d+\s*', '', regex=True).str.strip()
-    df.set_index('Provincia', inplace=True)
-    df.index = df.index.str.strip()
-    df.index = df.index.map(lambda x: '/'.join(x.split('/')[::-1]) if '/' in x else x)
-    df.index = df.index.map(lambda x: ' '.join(x.split(', ')[::-1]) if ', ' in x else x)
-    return df
-
-@st.cache_data
+import streamlit.components.v1 as components
+from utils.artefactos import GRAFICOS, version_tabla
+from utils.clasificacion import METODOS
+from utils.datos import cargar_tabla
+from utils.geometria import geometria_provincias
+from utils.mapas import mapa_periodo, mapa_temporal, periodos_mapa
+from utils.provincias import provincias_sin_datos
+from utils.precarga import iniciar_precarga
+from utils.rendimiento import iniciar_panel, mostrar_panel
+
+iniciar_precarga()
+iniciar_panel()
+
 def cargar_datos():
     try:
-        # Cargar datos geográficos
-        provincias = gpd.read_file('datasets/recintos_provinciales_inspire_peninbal_etrs89.shp').to_crs("EPSG:4326")
-        provincias = provincias[['NAMEUNIT', 'geometry']].rename(columns={'NAMEUNIT': 'Provincia'})
-        gdf = gpd.GeoDataFrame(provincias, crs="EPSG:4326")
-        
         # Cargar datos de natalidad
-        naci_homb_df = limpiar_indices(pd.read_excel('datasets/NaciHomb.xlsx', skiprows=6))
-        naci_homb_df.columns = naci_homb_df.columns.map(str)
+        naci_homb_df = cargar_tabla('NaciHomb')
         
-        naci_muj_df = limpiar_indices(pd.read_excel('datasets/NaciMuj.xlsx', skiprows=6))
-        naci_muj_df.columns = naci_muj_df.columns.map(str)
+        naci_muj_df = cargar_tabla('NaciMuj')
         
-        naci_tot_df = limpiar_indices(pd.read_excel('datasets/NaciTot.xlsx', skiprows=6))
-        naci_tot_df.columns = naci_tot_df.columns.map(str)
+        naci_tot_df = cargar_tabla('NaciTot')
         
-        return gdf, naci_homb_df, naci_muj_df, naci_tot_df
+        return naci_homb_df, naci_muj_df, naci_tot_df
         
     except FileNotFoundError as e:
-        print("No se ha encontrado algún fichero")
+        st.error(f"Error al cargar archivos: {e}")
+        st.info("Asegúrate de que la carpeta 'datasets' esté en el directorio raíz de tu repositorio")
+        st.stop()
 
 # --- Cargar datos ---
-datos = cargar_datos()
-if datos[0] is None:
-    st.stop()
-
-gdf, naci_homb_df, naci_muj_df, naci_tot_df = datos
+naci_homb_df, naci_muj_df, naci_tot_df = cargar_datos()
 
 
 # --- UI ---
@@ -61,9 +45,18 @@ st.text(
 )
 
 st.sidebar.header("Filtros")
-data_columns = [str(col) for col in naci_tot_df.select_dtypes(include=['float64', 'int']).columns]
-selected_column = st.sidebar.selectbox("Selecciona una fecha", sorted(data_columns, reverse=True))
+mapa_cliente = st.sidebar.toggle(
+    "Cambiar de fecha en el propio mapa", value=True,
+    help="El mapa incluye un deslizador de fechas y un selector de sexo que no recargan la página."
+)
+data_columns = [str(col) for col in naci_tot_df.select_dtypes(include='number').columns]
+if not mapa_cliente:
+    selected_column = st.sidebar.selectbox("Selecciona una fecha", sorted(data_columns, reverse=True))
 genero = st.sidebar.radio("Selecciona grupo poblacional", ["Total", "Hombres", "Mujeres"], index=0)
+metodo = st.sidebar.selectbox(
+    "Clasificación del color", list(METODOS), format_func=METODOS.get,
+    help="Con cuantiles cada color agrupa el mismo número de provincias, así no quedan todas en el mismo tono."
+)
 
 if genero == "Hombres":
     pob_df = naci_homb_df
@@ -74,59 +67,30 @@ else:
 
 # --- Unir y visualizar ---
 try:
-    gdf_gen = gdf.merge(pob_df, on='Provincia', how='left').fillna(1)
-    
-    if selected_column not in gdf_gen.columns:
-        st.warning(f"La columna '{selected_column}' no existe para {genero.lower()}.")
-        st.stop()
-
-    if gdf_gen[selected_column].isna().all():
-        st.warning("No hay datos válidos para mostrar en el mapa.")
-    else:
-        vmin = float(gdf_gen[selected_column].min())
-        vmax = float(gdf_gen[selected_column].max())
-        caption = f"Natalidad de {genero.lower()} en {selected_column}"
-
-        colormap = LinearColormap(
-            colors=linear.viridis.colors,
-            vmin=vmin,
-            vmax=vmax,
-            caption=caption,
-            tick_labels=[vmin, vmax]
-        )
-
-        # Simplificar geometría para mejor rendimiento
-        gdf_gen['geometry'] = gdf_gen['geometry'].simplify(0.001, preserve_topology=True)
-        
-        # Crear mapa
-        m = folium.Map(zoom_start=6)
-        
-        # Ajustar bounds del mapa correctamente
-        bounds = gdf_gen.total_bounds
-        m.fit_bounds([[bounds[1], bounds[0]], [bounds[3], bounds[2]]])
-
-        geojson = folium.GeoJson(
-            data=json.loads(gdf_gen.to_json()),
-            style_function=lambda feature: {
-                "fillColor": colormap(feature["properties"].get(selected_column))
-                if isinstance(feature["properties"].get(selected_column), (int, float))
-                else "#ffffff",
-                "color": "black",
-                "weight": 1,
-                "dashArray": "5, 5",
-                "fillOpacity": 0.7,
-            },
-            tooltip=folium.GeoJsonTooltip(
-                fields=["Provincia", str(selected_column)],
-                aliases=["Provincia:", f"Natalidad ({selected_column}):"],
-                localize=True
-            )
+    gdf = geometria_provincias()
+    faltan = provincias_sin_datos(gdf, pob_df)
+    if faltan:
+        st.warning(f"No hay datos de natalidad para: {', '.join(faltan)}.")
+
+    if mapa_cliente:
+        components.html(
+            mapa_temporal(
+                {"Total": naci_tot_df, "Hombres": naci_homb_df, "Mujeres": naci_muj_df},
+                periodos_mapa(naci_tot_df),
+                "Natalidad",
+                metodo=metodo,
+            ),
+            height=600,
         )
-        geojson.add_to(m)
+    else:
+        if selected_column not in pob_df.columns:
+            st.warning(f"La columna '{selected_column}' no existe para {genero.lower()}.")
+            st.stop()
 
-        colormap.options = {"position": "bottomleft"}
-        colormap.add_to(m)
-        st_folium(m, use_container_width=True, height=600, returned_objects=[])
+        if pob_df[selected_column].isna().all():
+            st.warning("No hay datos válidos para mostrar en el mapa.")
+        else:
+            components.html(mapa_periodo("Natalidad", selected_column, genero, metodo=metodo), height=600)
 
 except Exception as e:
     st.error(f"Error al crear el mapa: {e}")
@@ -140,37 +104,44 @@ st.text(
     "un máximo local en la franja entre los años 1996 y el 2008 (antes del comienzo de la crisis económica). "
 )
 
-try:
-    if genero == "Total":
-        # Gráfico apilado
-        serie_h = naci_homb_df.sum(axis=0)
-        serie_m = naci_muj_df.sum(axis=0)
-
-        df_h = pd.DataFrame({
-            "Fecha": serie_h.index.astype(str),
-            "Población": serie_h.values,
-            "Sexo": "Hombres"
-        })
 
-        df_m = pd.DataFrame({
-            "Fecha": serie_m.index.astype(str),
-            "Población": serie_m.values,
-            "Sexo": "Mujeres"
-        })
+def grafico_apilado():
+    """Especificación Vega-Lite del área apilada de hombres y mujeres, o None si no hay datos."""
+    serie_h = naci_homb_df.sum(axis=0)
+    serie_m = naci_muj_df.sum(axis=0)
 
-        df_stacked = pd.concat([df_h, df_m])
-        df_stacked["Fecha"] = pd.to_datetime(df_stacked["Fecha"], format="%Y", errors="coerce")
-        df_stacked = df_stacked.dropna().sort_values("Fecha")
+    df_h = pd.DataFrame({
+        "Fecha": serie_h.index.astype(str),
+        "Población": serie_h.values,
+        "Sexo": "Hombres"
+    })
 
-        if not df_stacked.empty:
-            chart = alt.Chart(df_stacked).mark_area().encode(
-                x=alt.X("Fecha:T", title="Fecha"),
-                y=alt.Y("Población:Q", stack="zero", title="Natalidad"),
-                color=alt.Color("Sexo:N", scale=alt.Scale(scheme='tableau10')),
-                tooltip=["Fecha:T", "Sexo:N", "Población:Q"]
-            ).properties(width=700, height=400).interactive()
+    df_m = pd.DataFrame({
+        "Fecha": serie_m.index.astype(str),
+        "Población": serie_m.values,
+        "Sexo": "Mujeres"
+    })
 
-            st.altair_chart(chart, use_container_width=True)
+    df_stacked = pd.concat([df_h, df_m])
+    df_stacked["Fecha"] = pd.to_datetime(df_stacked["Fecha"], format="%Y", errors="coerce")
+    df_stacked = df_stacked.dropna().sort_values("Fecha")
+
+    if df_stacked.empty:
+        return None
+    return alt.Chart(df_stacked).mark_area().encode(
+        x=alt.X("Fecha:T", title="Fecha"),
+        y=alt.Y("Población:Q", stack="zero", title="Natalidad"),
+        color=alt.Color("Sexo:N", scale=alt.Scale(scheme='tableau10')),
+        tooltip=["Fecha:T", "Sexo:N", "Población:Q"]
+    ).properties(width=700, height=400).interactive().to_dict()
+
+
+try:
+    if genero == "Total":
+        # Gráfico apilado, compartido entre sesiones
+        spec = GRAFICOS.obtener(("Natalidad", "apilado", version_tabla("NaciHomb"), version_tabla("NaciMuj")), grafico_apilado)
+        if spec is not None:
+            st.vega_lite_chart(spec, use_container_width=True)
         else:
             st.warning("No hay datos suficientes para mostrar el gráfico apilado.")
 
@@ -193,3 +164,5 @@ try:
 except Exception as e:
     st.error(f"Error al crear los gráficos: {e}")
     st.info("Verifica que los datos de natalidad estén en el formato correcto.")
+
+mostrar_panel()
@@ -1,65 +1,51 @@
 import streamlit as st
-import geopandas as gpd
 import pandas as pd
-import folium
-import json
 import altair as alt
-from streamlit_folium import st_folium
-from branca.colormap import linear, LinearColormap
-
-def limpiar_indices(df):
-    if df is None or df.empty:
-        return df
-    
-    df.columns.values[0] = 'Provincia'
-    df['Provincia'] = df['Provincia'].str.replace(r'^\d+\s*', '', regex=True).str.strip()
-    df.set_index('Provincia', inplace=True)
-    df.index = df.index.str.strip()
-    df.index = df.index.map(lambda x: '/'.join(x.split('/')[::-1]) if '/' in x else x)
-    df.index = df.index.map(lambda x: ' '.join(x.split(', ')[::-1]) if ', ' in x else x)
-    return df
-
-@st.cache_data
+import streamlit.components.v1 as components
+from utils.artefactos import GRAFICOS, version_tabla
+from utils.clasificacion import METODOS
+from utils.datos import cargar_tabla
+from utils.geometria import geometria_provincias
+from utils.mapas import mapa_periodo, mapa_temporal, periodos_mapa
+from utils.provincias import provincias_sin_datos
+from utils.precarga import iniciar_precarga
+from utils.rendimiento import iniciar_panel, mostrar_panel
+
+iniciar_precarga()
+iniciar_panel()
+
 def cargar_datos():
     try:
-        # Cargar datos geográficos
-        provincias = gpd.read_file('datasets/recintos_provinciales_inspire_peninbal_etrs89.shp').to_crs("EPSG:4326")
-        provincias = provincias[['NAMEUNIT', 'geometry']].rename(columns={'NAMEUNIT': 'Provincia'})
-        gdf = gpd.GeoDataFrame(provincias, crs="EPSG:4326")
-        
         # Cargar datos de defunciones
-        naci_homb_df = limpiar_indices(pd.read_excel('datasets/DefunHomb.xlsx', skiprows=6))
-        naci_homb_df.columns = naci_homb_df.columns.map(str)
+        naci_homb_df = cargar_tabla('DefunHomb')
         
-        naci_muj_df = limpiar_indices(pd.read_excel('datasets/DefunMuj.xlsx', skiprows=6))
-        naci_muj_df.columns = naci_muj_df.columns.map(str)
+        naci_muj_df = cargar_tabla('DefunMuj')
         
-        naci_tot_df = limpiar_indices(pd.read_excel('datasets/DefunTot.xlsx', skiprows=6))
-        naci_tot_df.columns = naci_tot_df.columns.map(str)
+        naci_tot_df = cargar_tabla('DefunTot')
         
-        return gdf, naci_homb_df, naci_muj_df, naci_tot_df
+        return naci_homb_df, naci_muj_df, naci_tot_df
         
     except FileNotFoundError as e:
         st.error(f"Error al cargar archivos: {e}")
         st.info("Asegúrate de que todos los archivos estén en la carpeta 'datasets':")
         st.code("""
         datasets/
-        ├── recintos_provinciales_inspire_peninbal_etrs89.shp
+        ├── provincias.parquet   (python -m utils.geometria)
         ├── DefunHomb.xlsx
         ├── DefunMuj.xlsx
         └── DefunTot.xlsx
         """)
-        return None, None, None, None
+        return None, None, None
     except Exception as e:
         st.error(f"Error inesperado: {e}")
-        return None, None, None, None
+        return None, None, None
 
 # --- Cargar datos ---
 datos = cargar_datos()
 if datos[0] is None:
     st.stop()
 
-gdf, naci_homb_df, naci_muj_df, naci_tot_df = datos
+naci_homb_df, naci_muj_df, naci_tot_df = datos
 
 # Verificar que los datos se cargaron correctamente
 if any(df is None or df.empty for df in [naci_homb_df, naci_muj_df, naci_tot_df]):
@@ -78,9 +64,18 @@ st.text(
 )
 
 st.sidebar.header("Filtros")
-data_columns = [str(col) for col in naci_tot_df.select_dtypes(include=['float64', 'int']).columns]
-selected_column = st.sidebar.selectbox("Selecciona una fecha", sorted(data_columns, reverse=True))
+mapa_cliente = st.sidebar.toggle(
+    "Cambiar de fecha en el propio mapa", value=True,
+    help="El mapa incluye un deslizador de fechas y un selector de sexo que no recargan la página."
+)
+data_columns = [str(col) for col in naci_tot_df.select_dtypes(include='number').columns]
+if not mapa_cliente:
+    selected_column = st.sidebar.selectbox("Selecciona una fecha", sorted(data_columns, reverse=True))
 genero = st.sidebar.radio("Selecciona grupo poblacional", ["Total", "Hombres", "Mujeres"], index=0)
+metodo = st.sidebar.selectbox(
+    "Clasificación del color", list(METODOS), format_func=METODOS.get,
+    help="Con cuantiles cada color agrupa el mismo número de provincias, así no quedan todas en el mismo tono."
+)
 
 # --- Dataset seleccionado ---
 if genero == "Hombres":
@@ -92,60 +87,30 @@ else:
 
 # --- Unir y visualizar ---
 try:
-    gdf_gen = gdf.merge(pob_df, on='Provincia', how='left').fillna(1)
-    
-    if selected_column not in gdf_gen.columns:
-        st.warning(f"La columna '{selected_column}' no existe para {genero.lower()}.")
-        st.stop()
-
-    # Verificar que hay datos válidos
-    if gdf_gen[selected_column].isna().all():
-        st.warning("No hay datos válidos para mostrar en el mapa.")
-    else:
-        vmin = float(gdf_gen[selected_column].min())
-        vmax = float(gdf_gen[selected_column].max())
-        caption = f"Población de {genero.lower()} en {selected_column}"
-
-        colormap = LinearColormap(
-            colors=linear.viridis.colors,
-            vmin=vmin,
-            vmax=vmax,
-            caption=caption,
-            tick_labels=[vmin, vmax]
+    gdf = geometria_provincias()
+    faltan = provincias_sin_datos(gdf, pob_df)
+    if faltan:
+        st.warning(f"No hay datos de defunciones para: {', '.join(faltan)}.")
+
+    if mapa_cliente:
+        components.html(
+            mapa_temporal(
+                {"Total": naci_tot_df, "Hombres": naci_homb_df, "Mujeres": naci_muj_df},
+                periodos_mapa(naci_tot_df),
+                "Defunciones",
+                metodo=metodo,
+            ),
+            height=600,
         )
+    else:
+        if selected_column not in pob_df.columns:
+            st.warning(f"La columna '{selected_column}' no existe para {genero.lower()}.")
+            st.stop()
 
-        # Simplificar geometría para mejor rendimiento
-        gdf_gen['geometry'] = gdf_gen['geometry'].simplify(0.001, preserve_topology=True)
-        
-        # Crear mapa
-        m = folium.Map(zoom_start=6)
-        
-        # Ajustar bounds del mapa
-        bounds = gdf_gen.total_bounds
-        m.fit_bounds([[bounds[1], bounds[0]], [bounds[3], bounds[2]]])
-
-        geojson = folium.GeoJson(
-            data=json.loads(gdf_gen.to_json()),
-            style_function=lambda feature: {
-                "fillColor": colormap(feature["properties"].get(selected_column))
-                if isinstance(feature["properties"].get(selected_column), (int, float))
-                else "#ffffff",
-                "color": "black",
-                "weight": 1,
-                "dashArray": "5, 5",
-                "fillOpacity": 0.7,
-            },
-            tooltip=folium.GeoJsonTooltip(
-                fields=["Provincia", str(selected_column)],
-                aliases=["Provincia:", f"Población ({selected_column}):"],
-                localize=True
-            )
-        )
-        geojson.add_to(m)
-
-        colormap.options = {"position": "bottomleft"}
-        colormap.add_to(m)
-        st_folium(m, use_container_width=True, height=600, returned_objects=[])
+        if pob_df[selected_column].isna().all():
+            st.warning("No hay datos válidos para mostrar en el mapa.")
+        else:
+            components.html(mapa_periodo("Defunciones", selected_column, genero, metodo=metodo), height=600)
 
 except Exception as e:
     st.error(f"Error al crear el mapa: {e}")
@@ -160,37 +125,44 @@ st.text(
     "deber a un posible crecimiento de la misma."
 )
 
-try:
-    if genero == "Total":
-        # Gráfico apilado
-        serie_h = naci_homb_df.sum(axis=0)
-        serie_m = naci_muj_df.sum(axis=0)
-
-        df_h = pd.DataFrame({
-            "Fecha": serie_h.index.astype(str),
-            "Población": serie_h.values,
-            "Sexo": "Hombres"
-        })
 
-        df_m = pd.DataFrame({
-            "Fecha": serie_m.index.astype(str),
-            "Población": serie_m.values,
-            "Sexo": "Mujeres"
-        })
+def grafico_apilado():
+    """Especificación Vega-Lite del área apilada de hombres y mujeres, o None si no hay datos."""
+    serie_h = naci_homb_df.sum(axis=0)
+    serie_m = naci_muj_df.sum(axis=0)
+
+    df_h = pd.DataFrame({
+        "Fecha": serie_h.index.astype(str),
+        "Población": serie_h.values,
+        "Sexo": "Hombres"
+    })
 
-        df_stacked = pd.concat([df_h, df_m])
-        df_stacked["Fecha"] = pd.to_datetime(df_stacked["Fecha"], format="%Y", errors="coerce")
-        df_stacked = df_stacked.dropna().sort_values("Fecha")
+    df_m = pd.DataFrame({
+        "Fecha": serie_m.index.astype(str),
+        "Población": serie_m.values,
+        "Sexo": "Mujeres"
+    })
 
-        if not df_stacked.empty:
-            chart = alt.Chart(df_stacked).mark_area().encode(
-                x=alt.X("Fecha:T", title="Fecha"),
-                y=alt.Y("Población:Q", stack="zero"),
-                color=alt.Color("Sexo:N", scale=alt.Scale(scheme='tableau10')),
-                tooltip=["Fecha:T", "Sexo:N", "Población:Q"]
-            ).properties(width=700, height=400).interactive()
+    df_stacked = pd.concat([df_h, df_m])
+    df_stacked["Fecha"] = pd.to_datetime(df_stacked["Fecha"], format="%Y", errors="coerce")
+    df_stacked = df_stacked.dropna().sort_values("Fecha")
 
-            st.altair_chart(chart, use_container_width=True)
+    if df_stacked.empty:
+        return None
+    return alt.Chart(df_stacked).mark_area().encode(
+        x=alt.X("Fecha:T", title="Fecha"),
+        y=alt.Y("Población:Q", stack="zero"),
+        color=alt.Color("Sexo:N", scale=alt.Scale(scheme='tableau10')),
+        tooltip=["Fecha:T", "Sexo:N", "Población:Q"]
+    ).properties(width=700, height=400).interactive().to_dict()
+
+
+try:
+    if genero == "Total":
+        # Gráfico apilado, compartido entre sesiones
+        spec = GRAFICOS.obtener(("Defunciones", "apilado", version_tabla("DefunHomb"), version_tabla("DefunMuj")), grafico_apilado)
+        if spec is not None:
+            st.vega_lite_chart(spec, use_container_width=True)
         else:
             st.warning("No hay datos suficientes para mostrar el gráfico apilado.")
 
@@ -212,4 +184,6 @@ try:
 
 except Exception as e:
     st.error(f"Error al crear los gráficos: {e}")
-    st.info("Verifica que los datos estén en el formato correcto.")
\ No newline at end of file
+    st.info("Verifica que los datos estén en el formato correcto.")
+
+mostrar_panel()
@@ -1,40 +1,20 @@
 import streamlit as st
-import geopandas as gpd
 import pandas as pd
-import folium
-import json
-import locale
 import altair as alt
-from streamlit_folium import st_folium
-from branca.colormap import linear, LinearColormap
+from utils.datos import cargar_tabla, FLUJO_INMIGRACION
+from utils.municipios import mostrar_mapa_municipal
+from utils.precarga import iniciar_precarga
+from utils.rendimiento import iniciar_panel, mostrar_panel
 
-inmig_file_path = 'datasets/Flujo de inmigracion procedente del extranjero por año, sexo y edad2008.xlsx'
+iniciar_precarga()
+iniciar_panel()
 
-inmig_df_raw = pd.read_excel(inmig_file_path, sheet_name=0, skiprows=5)
+inmig_df = cargar_tabla(FLUJO_INMIGRACION)
 
-# Extraer fechas de la fila 0
-fechas = inmig_df_raw.iloc[0, 1:].tolist()
-inmig_df_raw.columns = ['Sexo/Grupo de edad'] + fechas
-
-fechas_inmg = inmig_df_raw.iloc[0, 1:].tolist()
-
-inmig_df_raw.columns = ['Sexo/Grupo de edad'] + fechas_inmg
-
-# Eliminar las filas de encabezado innecesarias
-inmig_df_raw = inmig_df_raw.drop(index=[0, 1]).reset_index(drop=True)
-
-# Extraer filas por posición (Ambos sexos, Hombres, Mujeres)
-img_df_filtered_g = inmig_df_raw.iloc[0:1].copy()
-
-# Transponer y renombrar
-img_df_transpuesto_g = img_df_filtered_g.set_index('Sexo/Grupo de edad').transpose().reset_index()
-img_df_transpuesto_g.columns = ['Años', 'Inmigrantes']
-
-# Intentar convertir la columna de fecha a datetime
-img_df_transpuesto_g['Años'] = pd.to_datetime(img_df_transpuesto_g['Años'].astype(float).astype(int).astype(str), format='%Y')
-
-# Establecer 'Años' como índice
-img_df_transpuesto_g = img_df_transpuesto_g.set_index('Años')
+# Total de ambos sexos por año
+img_df_transpuesto_g = inmig_df.loc[('Ambos sexos', 'Total')].to_frame('Inmigrantes')
+img_df_transpuesto_g.index = pd.to_datetime(img_df_transpuesto_g.index, format='%Y')
+img_df_transpuesto_g.index.name = 'Años'
 
 # --- UI ---
 st.title("🎎 Análisis de inmigración")
@@ -74,4 +54,12 @@ with col1:
     st.image("images/Poblacion_1971.png", caption="Figura 1. Población por provincia en 1971", width=400)
 
 with col2:
-    st.image("images/Poblacion_2022.png", caption="Figura 2. Población por provincia en 2022", width=400)
\ No newline at end of file
+    st.image("images/Poblacion_2022.png", caption="Figura 2. Población por provincia en 2022", width=400)
+
+st.text(
+    "Dentro de cada provincia la concentración es aún mayor: el mapa municipal muestra cómo la población se "
+    "reúne en las capitales y en la costa mientras buena parte de los municipios del interior apenas tiene habitantes."
+)
+mostrar_mapa_municipal()
+
+mostrar_panel()
@@ -1,40 +1,22 @@
-from pydoc import text
 import streamlit as st
-import pandas as pd
-import plotly.graph_objects as go
+import streamlit.components.v1 as components
+import plotly.express as px
+from utils.cubo import SEXOS
+from utils.estructura_edad import INDICADORES_EDAD, indicadores_edad
+from utils.fechas import texto_fecha
+from utils.mapas import mapa_temporal
+from utils.piramides import COLORES, figura_comparacion, figura_evolucion, figura_fecha, piramides_quinquenales
+from utils.provincias import CODIGO_NACIONAL
+from utils.precarga import iniciar_precarga
+from utils.rendimiento import iniciar_panel, mostrar_panel
+
+iniciar_precarga()
+iniciar_panel()
 
 st.set_page_config(page_title="Pirámides Poblacionales España")
 st.title("🔼 Pirámides Poblacionales de España")
 
-@st.cache_data
-def cargar_y_procesar_piramide(ruta_excel: str):
-    raw = pd.read_excel(ruta_excel, sheet_name=0, skiprows=8)
-    raw.columns = ['Edad', 'Hombres', 'Mujeres']
-    raw = raw.fillna(0)
-    raw['Hombres'] = pd.to_numeric(raw['Hombres'], errors='coerce').fillna(0)
-    raw['Mujeres'] = pd.to_numeric(raw['Mujeres'], errors='coerce').fillna(0)
-
-    # Filtrar solo filas donde 'Edad' contenga "año"
-    df = raw[raw['Edad'].astype(str).str.contains('año')].copy()
-    # Extraer parte numérica de la edad
-    df['Edad_num'] = df['Edad'].str.extract(r'(\d+)').astype(float)
-    # Calcular inicio de cada franja de 5 años
-    df['Grupo_inicio'] = (df['Edad_num'] // 5 * 5).astype(int)
-    df['Grupo'] = df['Grupo_inicio'].astype(str) + '-' + (df['Grupo_inicio'] + 4).astype(str)
-
-    # Agrupar simultáneamente Hombres y Mujeres por 'Grupo'
-    agrupado = df.groupby('Grupo', as_index=False).agg({
-        'Hombres': 'sum',
-        'Mujeres': 'sum',
-        'Grupo_inicio': 'first'
-    })
-
-    # Ordenar por el valor numérico de inicio de franja y quitar esa columna auxiliar
-    agrupado = agrupado.sort_values('Grupo_inicio').drop(columns=['Grupo_inicio']).reset_index(drop=True)
-    return agrupado
-
-ruta_1971 = "datasets/EdadPob1971-PAños.xlsx"
-ruta_2024 = "datasets/EdadPob2024-PAños.xlsx"
+fechas = piramides_quinquenales()[0]
 
 st.subheader("1. Pirámide Poblacional 1971")
 st.text("En cuanto a la pirámide poblacional del año 1971, se puede observar que se cuenta con una población muy " \
@@ -44,43 +26,7 @@ st.text("En cuanto a la pirámide poblacional del año 1971, se puede observar q
 "reflejando una sociedad en crecimiento, aunque con una notable disminución de población conforme aumenta la edad. Esta forma " \
 "piramidal clásica indica un modelo demográfico aún en transición, con una mortalidad elevada en edades avanzadas y un fuerte " \
 "peso de las generaciones jóvenes.")
-pir_1971 = cargar_y_procesar_piramide(ruta_1971)
-
-hombres_1971 = -pir_1971["Hombres"]
-mujeres_1971 = pir_1971["Mujeres"]
-grupos_1971 = pir_1971["Grupo"]
-
-fig1971 = go.Figure()
-fig1971.add_trace(go.Bar(
-    y=grupos_1971,
-    x=hombres_1971,
-    name="Hombres",
-    orientation="h",
-    marker=dict(color="steelblue"),
-    hovertemplate="%{y}<br>Hombres: %{x:.0f}<extra></extra>"
-))
-fig1971.add_trace(go.Bar(
-    y=grupos_1971,
-    x=mujeres_1971,
-    name="Mujeres",
-    orientation="h",
-    marker=dict(color="salmon"),
-    hovertemplate="%{y}<br>Mujeres: %{x:.0f}<extra></extra>"
-))
-fig1971.update_layout(
-    title_text="España - Pirámide Poblacional 1971",
-    barmode="relative",
-    xaxis=dict(
-        title="Población",
-        tickvals=[-2000000, -1000000, 0, 1000000, 2000000],
-        ticktext=["2 M", "1 M", "0", "1 M", "2 M"]
-    ),
-    yaxis=dict(title="Rango de edad"),
-    plot_bgcolor="white",
-    template="simple_white",
-    margin=dict(l=80, r=80, t=50, b=50)
-)
-st.plotly_chart(fig1971, use_container_width=True)
+st.plotly_chart(figura_fecha("1 de enero de 1971", "España - Pirámide Poblacional 1971"), use_container_width=True)
 
 st.subheader("2. Pirámide Poblacional 2024")
 st.text("En la pirámide del año 2024 se observa una clara inversión en la estructura demográfica en comparación " \
@@ -97,40 +43,50 @@ st.text("Además, se aprecia un ensanchamiento progresivo de los grupos de mayor
 st.text("Este tipo de pirámides plantean una gran " \
 "problemática a futuro, ya que la poca tasa de natalidad y la gran vejez de la población imposibilita el relevo generacional " \
 "necesario para mantener el equilibrio entre cotizantes y beneficiarios de un sistema de bienestar como lo es el español.")
-pir_2024 = cargar_y_procesar_piramide(ruta_2024)
+st.plotly_chart(figura_fecha("1 de enero de 2024", "España - Pirámide Poblacional 2024"), use_container_width=True)
+
+st.subheader("3. Evolución de la pirámide poblacional")
+st.text("La siguiente pirámide recorre todas las fechas publicadas por el INE desde 1971. Con el botón de " \
+"reproducción o el deslizador se puede seguir cómo las generaciones del baby boom ascienden por la pirámide mientras " \
+"su base se estrecha.")
+st.plotly_chart(figura_evolucion(), use_container_width=True)
+st.caption("Las fechas más antiguas publican el último grupo de edad abierto (85 y más años hasta 1980, 100 y más " \
+"hasta 2015): esa población aparece en el grupo de su edad inicial.")
+
+st.subheader("4. Comparación de dos fechas")
+col1, col2 = st.columns(2)
+with col1:
+    fecha_a = st.selectbox("Fecha (barras)", fechas, index=0)
+with col2:
+    fecha_b = st.selectbox("Fecha superpuesta (contorno)", fechas, index=len(fechas) - 1)
+st.plotly_chart(figura_comparacion(fecha_a, fecha_b), use_container_width=True)
+
+st.subheader("5. Indicadores de envejecimiento")
+st.text("Las pirámides muestran el envejecimiento; estos indicadores lo miden en cada fecha publicada. La edad " \
+"mediana divide a la población en dos mitades, la dependencia relaciona a los menores de 15 años y a los mayores de 64 " \
+"con la población en edad de trabajar y el índice de envejecimiento cuenta cuántos mayores de 64 hay por cada 100 " \
+"menores de 15.")
+edad = indicadores_edad()
+fechas_edad = edad.ejes["periodo"]
+primera, ultima = (edad.sel(sexo="Total", periodo=fecha).a_pandas() for fecha in (fechas_edad[0], fechas_edad[-1]))
+destacados = ["Edad mediana", "Dependencia de mayores", "Índice de envejecimiento", "Mayores de 65 (%)"]
+for columna, indicador in zip(st.columns(len(destacados)), destacados):
+    columna.metric(f"{indicador} ({fechas_edad[-1].year})", f"{ultima[indicador]:.1f}",
+                   f"{ultima[indicador] - primera[indicador]:+.1f} desde {fechas_edad[0].year}")
 
-hombres_2024 = -pir_2024["Hombres"]
-mujeres_2024 = pir_2024["Mujeres"]
-grupos_2024 = pir_2024["Grupo"]
+indicador = st.selectbox("Indicador", INDICADORES_EDAD)
+if "provincia" in edad.ejes:
+    # Con pirámides provinciales el indicador se pinta también en el mapa temporal
+    textos = texto_fecha(fechas_edad)
+    tablas = {sexo: edad.sel(indicador=indicador, sexo=sexo).a_pandas().T.set_axis(textos, axis=1) for sexo in SEXOS}
+    components.html(mapa_temporal(tablas, textos, indicador), height=600)
+    edad = edad.sel(provincia=CODIGO_NACIONAL)
+serie = edad.sel(indicador=indicador).a_pandas()
+fig = px.line(serie, labels={"value": indicador, "periodo": "Fecha", "sexo": "Sexo"},
+              color_discrete_map={"Total": "black", **COLORES})
+fig.update_layout(template="simple_white", hovermode="x unified")
+st.plotly_chart(fig, use_container_width=True)
+st.caption("En la edad media, el último grupo abierto (85 y más, 100 y más) cuenta con una edad 3,5 años superior a " \
+"su edad inicial.")
 
-fig2024 = go.Figure()
-fig2024.add_trace(go.Bar(
-    y=grupos_2024,
-    x=hombres_2024,
-    name="Hombres",
-    orientation="h",
-    marker=dict(color="steelblue"),
-    hovertemplate="%{y}<br>Hombres: %{x:.0f}<extra></extra>"
-))
-fig2024.add_trace(go.Bar(
-    y=grupos_2024,
-    x=mujeres_2024,
-    name="Mujeres",
-    orientation="h",
-    marker=dict(color="salmon"),
-    hovertemplate="%{y}<br>Mujeres: %{x:.0f}<extra></extra>"
-))
-fig2024.update_layout(
-    title_text="España - Pirámide Poblacional 2024",
-    barmode="relative",
-    xaxis=dict(
-        title="Población",
-        tickvals=[-2000000, -1000000, 0, 1000000, 2000000],
-        ticktext=["2 M", "1 M", "0", "1 M", "2 M"]
-    ),
-    yaxis=dict(title="Rango de edad"),
-    plot_bgcolor="white",
-    template="simple_white",
-    margin=dict(l=80, r=80, t=50, b=50)
-)
-st.plotly_chart(fig2024, use_container_width=True)
+mostrar_panel()
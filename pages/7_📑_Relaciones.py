@@ -2,132 +2,55 @@ import streamlit as st
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
+from utils.correlaciones import PARES, TRANSFORMACIONES, VARIABLES, VENTANA, correlaciones, nombre_par
+from utils.indicadores import TASAS, indicadores
+from utils.provincias import CODIGO_NACIONAL, PROVINCIAS
+from utils.precarga import iniciar_precarga
+from utils.rendimiento import iniciar_panel, mostrar_panel
 
-def parse_spanish_date(date_str):
-    if pd.isna(date_str):
-        return pd.NaT
-    
-    months_es = {
-        'enero': '01', 'febrero': '02', 'marzo': '03', 'abril': '04',
-        'mayo': '05', 'junio': '06', 'julio': '07', 'agosto': '08',
-        'septiembre': '09', 'octubre': '10', 'noviembre': '11', 'diciembre': '12'
-    }
-    
-    try:
-        parts = str(date_str).lower().split(' de ')
-        if len(parts) == 3:
-            day = parts[0].strip()
-            month = months_es.get(parts[1].strip(), '01')
-            year = parts[2].strip()
-            return pd.to_datetime(f"{year}-{month}-{day.zfill(2)}")
-    except:
-        pass
-    
-    return pd.NaT
-
-@st.cache_data
-def cargar_datos():
-    try:
-        pob = pd.read_excel('datasets/Poblacion residente por fecha, sexo y edad1971.xlsx', skiprows=5)
-        defun = pd.read_excel('datasets/Defunciones1975.xlsx', skiprows=6)
-        naci = pd.read_excel('datasets/Nacimientos1975.xlsx', skiprows=6)
-        inmig = pd.read_excel('datasets/Flujo de inmigracion procedente del extranjero por año, sexo y edad2008.xlsx', skiprows=5)
-        return pob, defun, naci, inmig
-    except FileNotFoundError as e:
-        st.error(f"Error al cargar archivos: {e}")
-        st.info("Asegúrate de que la carpeta 'datasets' esté en el directorio raíz de tu repositorio")
-        return None, None, None, None
-
-
-data_loaded = cargar_datos()
-if data_loaded[0] is None:
+iniciar_precarga()
+iniciar_panel()
+
+try:
+    tabla = indicadores()
+except FileNotFoundError as e:
+    st.error(f"Error al cargar archivos: {e}")
+    st.info("Asegúrate de que la carpeta 'datasets' esté en el directorio raíz de tu repositorio")
     st.stop()
 
-pob_df_raw, defun_df_raw, naci_df_raw, inmig_df_raw = data_loaded
+nombres = {CODIGO_NACIONAL: "España", **PROVINCIAS["Provincia"].astype(str).to_dict()}
+años = tabla.ejes["año"]
+
+# --- Filtros ---
+st.sidebar.header("Filtros")
+provincia = st.sidebar.selectbox("Provincia", list(nombres), format_func=nombres.get)
 
 try:
-    # Defunciones
-    defun_df_raw = defun_df_raw.iloc[:, :50]
-    defun_df_raw.columns = defun_df_raw.iloc[0]
-    defun_df_raw = defun_df_raw.drop(index=0).reset_index(drop=True)
-    defun_df_raw_g = defun_df_raw.iloc[[0]].reset_index(drop=True)
-    valid_cols = [col for col in defun_df_raw_g.columns if str(col).strip().replace('.0', '').isdigit() and len(str(int(float(col)))) == 4]
-    defun_df_raw_g = defun_df_raw_g[valid_cols]
-    defun_df_raw_g.columns = pd.to_datetime([str(int(float(col))) for col in defun_df_raw_g.columns], format='%Y')
-    defun_df_raw_g = defun_df_raw_g.T
-    defun_df_raw_g.columns = ['Defunciones']
-    defun_df_raw_g.index.name = 'Años'
-
-    # Nacimientos
-    naci_df_raw = naci_df_raw.iloc[:, :50]
-    naci_df_raw.columns = naci_df_raw.iloc[0]
-    naci_df_raw = naci_df_raw.drop(index=0).reset_index(drop=True)
-    naci_df_raw_g = naci_df_raw.iloc[[0]].reset_index(drop=True)
-    valid_cols = [col for col in naci_df_raw_g.columns if str(col).strip().replace('.0', '').isdigit() and len(str(int(float(col)))) == 4]
-    naci_df_raw_g = naci_df_raw_g[valid_cols]
-    naci_df_raw_g.columns = pd.to_datetime([str(int(float(col))) for col in naci_df_raw_g.columns], format='%Y')
-    naci_df_raw_g = naci_df_raw_g.T
-    naci_df_raw_g.columns = ['Nacimientos']
-    naci_df_raw_g.index.name = 'Años'
-
-    # Inmigración
-    fechas = inmig_df_raw.iloc[0, 1:].tolist()
-    inmig_df_raw.columns = ['Sexo/Grupo de edad'] + fechas
-    inmig_df_raw = inmig_df_raw.drop(index=[0, 1]).reset_index(drop=True)
-    img_df_filtered_g = inmig_df_raw.iloc[0:1].copy()
-    img_df_transpuesto_g = img_df_filtered_g.set_index('Sexo/Grupo de edad').transpose().reset_index()
-    img_df_transpuesto_g.columns = ['Años', 'Inmigrantes']
-    img_df_transpuesto_g['Años'] = pd.to_datetime(img_df_transpuesto_g['Años'].astype(float).astype(int).astype(str), format='%Y')
-    img_df_transpuesto_g = img_df_transpuesto_g.set_index('Años')
-
-    # Población
-    fechas = pob_df_raw.iloc[0, 1:].tolist()
-    pob_df_raw.columns = ['Sexo/Grupo de edad'] + fechas
-    pob_df_raw = pob_df_raw.drop(index=[0, 1]).reset_index(drop=True)
-    pob_df_filtered_g = pob_df_raw.iloc[0:3].copy()
-    pob_df_transpuesto_g = pob_df_filtered_g.set_index('Sexo/Grupo de edad').transpose().reset_index()
-    pob_df_transpuesto_g.columns = ['Años', 'Ambos sexos', 'Hombres', 'Mujeres']
-    pob_df_transpuesto_g['Años'] = pob_df_transpuesto_g['Años'].apply(parse_spanish_date)
-    pob_df_transpuesto_g = pob_df_transpuesto_g.set_index('Años')
-
-    # Unión
-    df = pd.concat([naci_df_raw_g, defun_df_raw_g], axis=1)
-    df = pd.concat([df, img_df_transpuesto_g], axis=1)
-    df = pd.concat([df, pob_df_transpuesto_g[['Ambos sexos']]], axis=1)
-    df = df.rename(columns={'Ambos sexos': 'Población'})
-    df['Inmigrantes'] = df['Inmigrantes'].fillna(0)
-    df = df[df.index >= '1975']
-    df.index = pd.to_datetime(df.index)
-
-    # Relleno de valores
-    julio_mask = df.index.month == 7
-    if julio_mask.any():
-        df.loc[julio_mask, 'Nacimientos'] = df['Nacimientos'].shift(1)[julio_mask]
-        df.loc[julio_mask, 'Defunciones'] = df['Defunciones'].shift(1)[julio_mask]
-    
-    if len(df) > 1:
-        df.iloc[-1, df.columns.get_loc('Población')] = df.iloc[-2]['Población']
+    df = tabla.sel(provincia=provincia).a_pandas()
+    df.index = df.index.year
+    # El flujo de inmigración solo existe a nivel nacional; en las provincias se usa el saldo migratorio
+    migracion = 'Inmigrantes' if provincia == CODIGO_NACIONAL else 'Saldo migratorio'
 
     st.title("📊 Indicadores Demográficos: Bubble Chart y Heatmap")
-    st.subheader("🔵 Bubble Chart: Población vs Año (Tamaño = Inmigración, Color = Saldo Natural)")
+    st.subheader(f"🔵 Bubble Chart: Población vs Año en {nombres[provincia]} "
+                 f"(Tamaño = {migracion}, Color = Saldo Natural)")
     st.text("La primera gráfica (Bubble Chart) muestra de forma más sencilla este estancamiento y leve crecimiento a través de la representación de la inmigración mediante el tamaño de las burbujas y la diferencia entre nacimiento y defunciones (Saldo Natural) mediante su color.")
-    
+
     # Bubble Chart
-    df_bubble = df.copy()
-    df_bubble['Año'] = df_bubble.index.year
-    df_bubble = df_bubble.groupby('Año').mean().reset_index()
-    df_bubble = df_bubble[df_bubble['Año'] >= 2005]
-    df_bubble['Saldo Natural'] = df_bubble['Nacimientos'] - df_bubble['Defunciones']
+    df_bubble = df[df.index >= 2005].rename_axis('Año').reset_index()
+    df_bubble['Tamaño'] = df_bubble[migracion].clip(lower=0).fillna(0)
 
-    if not df_bubble.empty:
+    if df_bubble['Tamaño'].sum() > 0:
         fig_bubble = px.scatter(
             df_bubble,
             x='Año',
             y='Población',
-            size='Inmigrantes',
-            color='Saldo Natural',
+            size='Tamaño',
+            color='Saldo natural',
             color_continuous_scale='RdBu',
-            labels={'Saldo Natural': 'Saldo Natural'},
+            color_continuous_midpoint=0,
+            hover_data={migracion: ':,.0f', 'Tamaño': False},
+            labels={'Saldo natural': 'Saldo Natural'},
             title=''
         )
         fig_bubble.update_traces(marker=dict(line=dict(width=1, color='black')))
@@ -135,44 +58,135 @@ try:
     else:
         st.warning("⚠️ No hay datos suficientes para el Bubble Chart.")
 
-    st.subheader("🌡️ Heatmap de Indicadores Demográficos por Año (Normalizado)")
+    st.subheader(f"🌡️ Heatmap de Indicadores Demográficos por Año en {nombres[provincia]} (Normalizado)")
     st.text("La segunda gráfica muestra mediante un heatmap como las defunciones y la inmigración aumentan a " \
     "lo largo del tiempo, como la natalidad decrementa y, como se ha comentado a lo largo del trabajo, como estas variables " \
     "afectan al aumento y estancamiento de la población.")
 
-    # Heatmap
-    df_heatmap = df.copy().astype(float)
-    df_heatmap['Año'] = df_heatmap.index.year
-    df_heatmap = df_heatmap.groupby('Año').mean()
-
-    if not df_heatmap.empty:
-        df_heatmap_T = df_heatmap.T
-
-        df_heatmap_normalized = df_heatmap_T.apply(
-            lambda row: (row - row.min()) / (row.max() - row.min()) if row.max() != row.min() else row * 0,
-            axis=1
+    # Heatmap: cada fila normalizada entre su mínimo y su máximo
+    df_heatmap = df[['Nacimientos', 'Defunciones', migracion, 'Población']].T
+    minimo, maximo = df_heatmap.min(axis=1), df_heatmap.max(axis=1)
+    df_heatmap_normalized = df_heatmap.sub(minimo, axis=0).div((maximo - minimo).where(maximo > minimo), axis=0)
+    df_heatmap_normalized = df_heatmap_normalized.dropna(how='all')
+
+    if not df_heatmap_normalized.empty:
+        fig_heatmap = go.Figure(data=go.Heatmap(
+            z=df_heatmap_normalized.values,
+            x=df_heatmap_normalized.columns,
+            y=df_heatmap_normalized.index,
+            colorscale='YlOrBr',
+            colorbar=dict(title='Valor Normalizado')
+        ))
+        fig_heatmap.update_layout(
+            title='',
+            height=600
         )
-
-        df_heatmap_normalized = df_heatmap_normalized.dropna(how='all')
-
-        if not df_heatmap_normalized.empty:
-            fig_heatmap = go.Figure(data=go.Heatmap(
-                z=df_heatmap_normalized.values,
-                x=df_heatmap_normalized.columns,
-                y=df_heatmap_normalized.index,
-                colorscale='YlOrBr',
-                colorbar=dict(title='Valor Normalizado')
-            ))
-            fig_heatmap.update_layout(
-                title='',
-                height=600
-            )
-            st.plotly_chart(fig_heatmap, use_container_width=True)
-        else:
-            st.warning("⚠️ El heatmap quedó vacío tras normalizar.")
+        st.plotly_chart(fig_heatmap, use_container_width=True)
     else:
         st.warning("⚠️ No hay datos suficientes para construir el heatmap.")
 
+    # --- Todas las provincias ---
+    st.subheader("🗺️ Indicadores de todas las provincias")
+    st.text("Las tasas se calculan por cada 1.000 habitantes con la población a 1 de julio de cada año. El saldo "
+            "migratorio es lo que cambió la población que no explica el saldo natural.")
+
+    año = st.select_slider("Año", options=list(años.year), value=años.year[-2])
+    provinciales = tabla.sel(año=pd.Period(año, freq="Y"), provincia=list(PROVINCIAS.index)).a_pandas()
+    provinciales = provinciales.rename(index=nombres).rename_axis('Provincia').reset_index()
+    # El último año aún no tiene la población del 1 de enero siguiente
+    color = 'Tasa de crecimiento' if provinciales['Tasa de crecimiento'].notna().any() else 'Tasa de crecimiento natural'
+    fig_provincias = px.scatter(
+        provinciales,
+        x='Tasa de natalidad',
+        y='Tasa de mortalidad',
+        size='Población',
+        color=color,
+        color_continuous_scale='RdBu',
+        color_continuous_midpoint=0,
+        hover_name='Provincia',
+        size_max=45,
+        labels={'Tasa de natalidad': 'Natalidad (‰)', 'Tasa de mortalidad': 'Mortalidad (‰)'},
+    )
+    fig_provincias.update_traces(marker=dict(line=dict(width=1, color='black')))
+    fig_provincias.update_layout(template='simple_white')
+    st.plotly_chart(fig_provincias, use_container_width=True)
+
+    indicador = st.selectbox("Indicador", [t for t in TASAS if t != 'Tasa de inmigración'])
+    matriz = tabla.sel(indicador=indicador, provincia=list(PROVINCIAS.index)).a_pandas().T
+    matriz.index = matriz.index.map(nombres)
+    matriz.columns = matriz.columns.year
+    matriz = matriz.dropna(axis=1, how='all')
+    matriz = matriz.loc[matriz.iloc[:, -1].sort_values().index]
+    fig_matriz = go.Figure(data=go.Heatmap(
+        z=matriz.values,
+        x=matriz.columns,
+        y=matriz.index,
+        # Escala divergente solo para los indicadores con signo (saldos y crecimientos)
+        **(dict(colorscale='RdBu', zmid=0) if (matriz.values < 0).any() else dict(colorscale='YlOrBr')),
+        colorbar=dict(title='‰'),
+        hovertemplate='%{y}, %{x}: %{z:.2f} ‰<extra></extra>',
+    ))
+    fig_matriz.update_layout(title=f'{indicador} (por 1.000 habitantes)', height=1000)
+    st.plotly_chart(fig_matriz, use_container_width=True)
+
+    # --- Correlaciones ---
+    st.subheader(f"🔗 Correlaciones entre nacimientos, defunciones, migración y población en {nombres[provincia]}")
+    st.text("Dos series con tendencia aparecen siempre muy correlacionadas; las variaciones anuales muestran si los " \
+    "cambios de un año en una variable acompañan a los de la otra. La correlación con retardo compara una variable con " \
+    "la otra unos años después y la correlación móvil muestra cómo cambia la relación a lo largo del tiempo.")
+
+    col1, col2 = st.columns(2)
+    with col1:
+        transformacion = st.radio("Series", TRANSFORMACIONES, index=1, horizontal=True)
+    with col2:
+        ventana = st.slider("Ventana de la correlación móvil (años)", 5, 20, VENTANA)
+    resultado = correlaciones(transformacion, ventana)
+
+    # La inmigración solo está a nivel nacional
+    variables = [v for v in VARIABLES if provincia == CODIGO_NACIONAL or v != 'Inmigrantes']
+    matriz_corr = resultado["matrices"].sel(provincia=provincia, variable=variables, con=variables).a_pandas()
+    fig_corr = go.Figure(data=go.Heatmap(
+        z=matriz_corr.values,
+        x=matriz_corr.columns,
+        y=matriz_corr.index,
+        colorscale='RdBu',
+        zmin=-1,
+        zmax=1,
+        texttemplate='%{z:.2f}',
+        colorbar=dict(title='Correlación')
+    ))
+    fig_corr.update_layout(title=f'Matriz de correlación ({transformacion.lower()})', height=500)
+    st.plotly_chart(fig_corr, use_container_width=True)
+
+    pares = [nombre_par(x, y) for x, y in PARES if x in variables and y in variables]
+    par = st.selectbox("Par de variables", pares)
+    x, y = par.split(" – ")
+    col1, col2 = st.columns(2)
+    with col1:
+        retardos = resultado["retardos"].sel(provincia=provincia, par=par).a_pandas()
+        fig_retardos = px.bar(retardos, labels={'value': 'Correlación', 'retardo': f'Años que {x} se adelanta a {y}'})
+        fig_retardos.update_layout(template='simple_white', showlegend=False, yaxis_range=[-1, 1],
+                                   title='Correlación con retardo')
+        st.plotly_chart(fig_retardos, use_container_width=True)
+    with col2:
+        moviles = resultado["moviles"].sel(provincia=provincia, par=par).a_pandas()
+        moviles.index = moviles.index.year
+        fig_moviles = px.line(moviles, labels={'value': 'Correlación', 'año': 'Último año de la ventana'})
+        fig_moviles.update_layout(template='simple_white', showlegend=False, yaxis_range=[-1, 1],
+                                  title=f'Correlación móvil ({ventana} años)')
+        st.plotly_chart(fig_moviles, use_container_width=True)
+
+    if 'Inmigrantes' not in par:
+        por_provincia = resultado["retardos"].sel(par=par, retardo=0, provincia=list(PROVINCIAS.index)).a_pandas()
+        por_provincia = por_provincia.rename(index=nombres).sort_values()
+        fig_por_provincia = px.bar(por_provincia, orientation='h', height=900,
+                                   labels={'value': f'Correlación {par}', 'provincia': ''})
+        fig_por_provincia.update_layout(template='simple_white', showlegend=False, xaxis_range=[-1, 1],
+                                        title='La misma correlación en todas las provincias')
+        st.plotly_chart(fig_por_provincia, use_container_width=True)
+
 except Exception as e:
     st.error(f"Error en el procesamiento de datos: {e}")
-    st.info("Verifica que los archivos Excel tengan el formato esperado.")
\ No newline at end of file
+    st.info("Verifica que los archivos Excel tengan el formato esperado.")
+
+mostrar_panel()
@@ -1,4 +1,7 @@
 import streamlit as st
+from utils.precarga import iniciar_precarga
+
+iniciar_precarga()
 
 st.title("🚀 Conclusiones:")
 st.text("En conclusión, en este trabajo se ha realizado, a través del tratamiento de diversos datasets y " \
@@ -0,0 +1,135 @@
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+from utils.provincias import CODIGO_NACIONAL, PROVINCIAS
+from utils.proyeccion import AÑOS_CALIBRACION, ESCENARIOS, HORIZONTE, proyeccion
+from utils.montecarlo import PERCENTILES, SIMULACIONES, bandas, simulacion, simulacion_guardada
+from utils.precarga import iniciar_precarga
+from utils.rendimiento import iniciar_panel, mostrar_panel
+
+iniciar_precarga()
+iniciar_panel()
+
+st.title("🔮 Proyección de la población")
+st.text(
+    "Las páginas anteriores muestran cómo la natalidad cae, las defunciones crecen y la inmigración sostiene la población. "
+    "Esta página proyecta esa dinámica hacia delante con el método de componentes por cohortes: cada año la población de "
+    "cada provincia, sexo y edad envejece un año, pierde las defunciones, suma los nacimientos y recibe el saldo migratorio."
+)
+st.caption(
+    f"La mortalidad, la fecundidad y la migración de cada provincia se calibran con sus nacimientos, defunciones y "
+    f"variación de población de los últimos {AÑOS_CALIBRACION} años con datos; la estructura por edad de partida es la "
+    "nacional repartida entre provincias según su población. Los escenarios multiplican esas tres componentes."
+)
+
+# --- Filtros ---
+st.sidebar.header("Filtros")
+nombres = {CODIGO_NACIONAL: "España", **PROVINCIAS["Provincia"].astype(str).to_dict()}
+provincia = st.sidebar.selectbox("Provincia", list(nombres), format_func=nombres.get)
+horizonte = st.sidebar.slider("Años de proyección", 10, 50, HORIZONTE, step=5)
+with st.sidebar.expander("Escenario propio"):
+    fecundidad = st.slider("Fecundidad (%)", 50, 150, 100, step=5)
+    mortalidad = st.slider("Mortalidad (%)", 50, 150, 100, step=5)
+    migracion = st.slider("Migración (%)", 0, 200, 100, step=10)
+
+escenarios = {**ESCENARIOS, "Propio": (fecundidad / 100, mortalidad / 100, migracion / 100)}
+resultado = proyeccion(escenarios, horizonte)
+poblacion, componentes = resultado["poblacion"], resultado["componentes"]
+años = poblacion.ejes["año"]
+
+# --- Población total por escenario ---
+st.subheader(f"1. Población de {nombres[provincia]} por escenario")
+totales = poblacion.sel(provincia=provincia, sexo="Total").suma("edad").a_pandas().T
+totales.index = totales.index.year
+fig = px.line(totales, labels={"value": "Población a 1 de enero", "index": "Año", "escenario": "Escenario"})
+fig.update_layout(template="simple_white", hovermode="x unified")
+st.plotly_chart(fig, use_container_width=True)
+
+final = totales.iloc[-1]
+resumen = pd.DataFrame({
+    f"Población {años[0].year}": totales.iloc[0],
+    f"Población {años[-1].year}": final,
+    "Variación (%)": (final / totales.iloc[0] - 1) * 100,
+})
+st.dataframe(resumen.style.format({**{c: "{:,.0f}" for c in resumen.columns[:2]}, "Variación (%)": "{:+.1f}"}),
+             use_container_width=True)
+
+# --- Componentes y pirámide de un escenario ---
+escenario = st.selectbox("Escenario", list(escenarios))
+
+st.subheader(f"2. Componentes del cambio ({escenario})")
+flujos = componentes.sel(escenario=escenario, provincia=provincia).a_pandas()
+flujos.index = flujos.index.year
+flujos["Crecimiento"] = flujos["Nacimientos"] - flujos["Defunciones"] + flujos["Migración neta"]
+fig = px.line(flujos, labels={"value": "Personas al año", "index": "Año", "componente": ""})
+fig.update_layout(template="simple_white", hovermode="x unified")
+st.plotly_chart(fig, use_container_width=True)
+
+st.subheader(f"3. Pirámide en {años[0].year} y {años[-1].year} ({escenario})")
+piramides = poblacion.sel(escenario=escenario, provincia=provincia, año=[años[0], años[-1]],
+                          sexo=["Hombres", "Mujeres"]).agrupar("edad", 5)
+grupos = [f"{inicio}-{inicio + 4}" for inicio in piramides.ejes["edad"]]
+grupos[-1] = f"{piramides.ejes['edad'][-1]} y más"
+fig = go.Figure()
+for posicion, año in enumerate(piramides.ejes["año"]):
+    for indice, (sexo, signo, color) in enumerate([("Hombres", -1, "steelblue"), ("Mujeres", 1, "salmon")]):
+        contorno = posicion == 0
+        fig.add_trace(go.Bar(
+            y=grupos, x=signo * piramides.valores[posicion, indice], orientation="h", name=f"{sexo} {año.year}",
+            marker=dict(color="rgba(0,0,0,0)", line=dict(color=color, width=2)) if contorno else dict(color=color),
+            hovertemplate="%{y}<br>" + sexo + ": %{customdata:,.0f}<extra></extra>",
+            customdata=piramides.valores[posicion, indice],
+        ))
+fig.update_layout(barmode="overlay", template="simple_white", xaxis_title="Población", yaxis_title="Rango de edad")
+st.plotly_chart(fig, use_container_width=True)
+
+# --- Todas las provincias ---
+st.subheader(f"4. Variación por provincia hasta {años[-1].year} ({escenario})")
+provinciales = poblacion.sel(escenario=escenario, año=[años[0], años[-1]], sexo="Total",
+                             provincia=list(PROVINCIAS.index)).suma("edad").a_pandas()
+variacion = ((provinciales.iloc[-1] / provinciales.iloc[0] - 1) * 100).rename(index=nombres).sort_values()
+fig = px.bar(variacion, orientation="h", labels={"value": "Variación (%)", "provincia": ""}, height=900)
+fig.update_layout(template="simple_white", showlegend=False)
+st.plotly_chart(fig, use_container_width=True)
+
+# --- Incertidumbre ---
+st.subheader(f"5. Incertidumbre de la proyección tendencial en {nombres[provincia]}")
+st.caption(
+    "Cada trayectoria repite el escenario tendencial con una fecundidad, una mortalidad y una migración que varían al "
+    "azar cada año, con la misma volatilidad que han tenido los nacimientos, las defunciones y la inmigración en las "
+    f"últimas décadas. La banda va del percentil {PERCENTILES[0]} al {PERCENTILES[-1]}; la semilla es fija, así que "
+    "el resultado es siempre el mismo."
+)
+simulaciones = st.select_slider("Trayectorias", [200, 500, SIMULACIONES, 2000, 5000], value=SIMULACIONES)
+
+
+def figura_abanico(avance):
+    banda = bandas(avance.trayectorias, avance.años, provincia)
+    inferior, mediana, superior = (f"p{p}" for p in PERCENTILES)
+    fig = go.Figure([
+        go.Scatter(x=banda.index, y=banda[superior], line=dict(width=0), showlegend=False, hoverinfo="skip"),
+        go.Scatter(x=banda.index, y=banda[inferior], line=dict(width=0), fill="tonexty",
+                   fillcolor="rgba(70,130,180,0.25)", name=f"p{PERCENTILES[0]}–p{PERCENTILES[-1]}"),
+        go.Scatter(x=banda.index, y=banda[mediana], line=dict(color="steelblue"), name="Mediana"),
+        go.Scatter(x=totales.index, y=totales["Tendencial"], line=dict(color="black", dash="dot"), name="Tendencial"),
+    ])
+    fig.update_layout(template="simple_white", hovermode="x unified", yaxis_title="Población a 1 de enero",
+                      xaxis_title="Año", title=f"{avance.hechas:,} trayectorias")
+    return fig
+
+
+abanico = st.empty()
+if simulacion_guardada(simulaciones, horizonte) or st.button("Simular"):
+    barra = st.progress(0.0)
+
+    def dibujar(avance):
+        # Cada lote terminado redibuja las bandas con las trayectorias que ya hay
+        abanico.plotly_chart(figura_abanico(avance), use_container_width=True, key=f"abanico-{avance.hechas}")
+        barra.progress(avance.hechas / avance.total, text=f"{avance.hechas:,} de {avance.total:,} trayectorias")
+
+    avance = simulacion(simulaciones, horizonte, al_avanzar=dibujar)
+    barra.empty()
+    abanico.plotly_chart(figura_abanico(avance), use_container_width=True, key="abanico")
+
+mostrar_panel()
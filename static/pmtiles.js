@@ -0,0 +1,204 @@
+/*
+ * Lector mínimo de PMTiles v3 para MapLibre GL (ver utils.mapa_teselas).
+ *
+ * Implementa lo que usa el mapa municipal: el protocolo "pmtiles://" de
+ * maplibregl.addProtocol, que devuelve el TileJSON del fichero y cada tesela
+ * pidiendo por rangos solo los bytes necesarios. Directorios y teselas pueden
+ * ir sin comprimir o en gzip, como los escribe GDAL; si el servidor no
+ * atiende peticiones por rangos se descarga el fichero una vez.
+ *
+ * Especificación: https://github.com/protomaps/PMTiles/blob/main/spec/v3/spec.md
+ */
+(function (global) {
+    "use strict";
+
+    var SIN_COMPRESION = 1, GZIP = 2;
+
+    function uint64(vista, posicion) {
+        return vista.getUint32(posicion + 4, true) * 4294967296 + vista.getUint32(posicion, true);
+    }
+
+    function leerCabecera(bytes) {
+        var vista = new DataView(bytes.buffer, bytes.byteOffset, bytes.byteLength);
+        if (String.fromCharCode.apply(null, bytes.subarray(0, 7)) !== "PMTiles" || bytes[7] !== 3) {
+            throw new Error("No es un fichero PMTiles v3");
+        }
+        return {
+            raizInicio: uint64(vista, 8), raizLongitud: uint64(vista, 16),
+            metadatosInicio: uint64(vista, 24), metadatosLongitud: uint64(vista, 32),
+            hojasInicio: uint64(vista, 40),
+            datosInicio: uint64(vista, 56),
+            compresionInterna: bytes[97], compresionTeselas: bytes[98], tipoTeselas: bytes[99],
+            zoomMinimo: bytes[100], zoomMaximo: bytes[101],
+            limites: [vista.getInt32(102, true) / 1e7, vista.getInt32(106, true) / 1e7,
+                      vista.getInt32(110, true) / 1e7, vista.getInt32(114, true) / 1e7],
+        };
+    }
+
+    function descomprimir(bytes, compresion) {
+        if (compresion === SIN_COMPRESION || compresion === 0) {
+            return Promise.resolve(bytes);
+        }
+        if (compresion !== GZIP) {
+            return Promise.reject(new Error("Compresión PMTiles no soportada: " + compresion));
+        }
+        var flujo = new Blob([bytes]).stream().pipeThrough(new DecompressionStream("gzip"));
+        return new Response(flujo).arrayBuffer().then(function (b) { return new Uint8Array(b); });
+    }
+
+    function leerDirectorio(bytes) {
+        var posicion = 0;
+        function varint() {
+            var valor = 0, factor = 1, byte;
+            do {
+                byte = bytes[posicion++];
+                valor += (byte & 0x7f) * factor;
+                factor *= 128;
+            } while (byte & 0x80);
+            return valor;
+        }
+        var n = varint(), entradas = [], i, id = 0;
+        for (i = 0; i < n; i++) {
+            id += varint();
+            entradas.push({id: id, repeticiones: 0, longitud: 0, inicio: 0});
+        }
+        for (i = 0; i < n; i++) entradas[i].repeticiones = varint();
+        for (i = 0; i < n; i++) entradas[i].longitud = varint();
+        for (i = 0; i < n; i++) {
+            var inicio = varint();
+            // 0 significa "justo detrás de la anterior"
+            entradas[i].inicio = inicio === 0 && i > 0 ? entradas[i - 1].inicio + entradas[i - 1].longitud : inicio - 1;
+        }
+        return entradas;
+    }
+
+    // Posición de la tesela en la curva de Hilbert, tras todas las de zooms menores
+    function idTesela(z, x, y) {
+        var id = (Math.pow(4, z) - 1) / 3, n = Math.pow(2, z), s, rx, ry, t;
+        for (s = n / 2; s >= 1; s /= 2) {
+            rx = (x & s) > 0 ? 1 : 0;
+            ry = (y & s) > 0 ? 1 : 0;
+            id += s * s * ((3 * rx) ^ ry);
+            if (ry === 0) {
+                if (rx === 1) {
+                    x = n - 1 - x;
+                    y = n - 1 - y;
+                }
+                t = x; x = y; y = t;
+            }
+        }
+        return id;
+    }
+
+    function buscar(entradas, id) {
+        var bajo = 0, alto = entradas.length - 1, medio;
+        while (bajo <= alto) {
+            medio = (bajo + alto) >> 1;
+            if (entradas[medio].id < id) bajo = medio + 1;
+            else if (entradas[medio].id > id) alto = medio - 1;
+            else return entradas[medio];
+        }
+        // La entrada anterior cubre `id` si es un directorio hoja o una serie de teselas repetidas
+        if (alto >= 0 && (entradas[alto].repeticiones === 0 || id - entradas[alto].id < entradas[alto].repeticiones)) {
+            return entradas[alto];
+        }
+        return null;
+    }
+
+    function Fichero(url) {
+        this.url = url;
+        this.completo = null;
+        this.directorios = {};
+        this.cabecera = this.leer(0, 16384).then(function (bytes) {
+            var cabecera = leerCabecera(bytes);
+            // La raíz suele venir en la misma petición que la cabecera
+            if (cabecera.raizInicio + cabecera.raizLongitud <= bytes.length) {
+                var raiz = bytes.subarray(cabecera.raizInicio, cabecera.raizInicio + cabecera.raizLongitud);
+                this.directorios[cabecera.raizInicio] = descomprimir(raiz, cabecera.compresionInterna).then(leerDirectorio);
+            }
+            return cabecera;
+        }.bind(this));
+    }
+
+    Fichero.prototype.leer = function (inicio, longitud) {
+        if (this.completo) {
+            return this.completo.then(function (b) { return b.subarray(inicio, inicio + longitud); });
+        }
+        var cabeceras = {Range: "bytes=" + inicio + "-" + (inicio + longitud - 1)};
+        return fetch(this.url, {headers: cabeceras}).then(function (respuesta) {
+            if (!respuesta.ok) throw new Error("Error " + respuesta.status + " al leer " + this.url);
+            if (respuesta.status === 206) {
+                return respuesta.arrayBuffer().then(function (b) { return new Uint8Array(b); });
+            }
+            // Sin rangos: el servidor envía el fichero entero, que se guarda para las demás lecturas
+            this.completo = respuesta.arrayBuffer().then(function (b) { return new Uint8Array(b); });
+            return this.completo.then(function (b) { return b.subarray(inicio, inicio + longitud); });
+        }.bind(this));
+    };
+
+    Fichero.prototype.directorio = function (inicio, longitud, compresion) {
+        if (!(inicio in this.directorios)) {
+            this.directorios[inicio] = this.leer(inicio, longitud).then(function (bytes) {
+                return descomprimir(bytes, compresion);
+            }).then(leerDirectorio);
+        }
+        return this.directorios[inicio];
+    };
+
+    Fichero.prototype.metadatos = function () {
+        return this.cabecera.then(function (c) {
+            if (!c.metadatosLongitud) return {};
+            return this.leer(c.metadatosInicio, c.metadatosLongitud).then(function (bytes) {
+                return descomprimir(bytes, c.compresionInterna);
+            }).then(function (bytes) { return JSON.parse(new TextDecoder().decode(bytes)); });
+        }.bind(this));
+    };
+
+    Fichero.prototype.tesela = function (z, x, y) {
+        var id = idTesela(z, x, y), fichero = this;
+        return this.cabecera.then(function (c) {
+            function bajar(inicio, longitud, nivel) {
+                return fichero.directorio(inicio, longitud, c.compresionInterna).then(function (entradas) {
+                    var entrada = buscar(entradas, id);
+                    if (!entrada) return null;
+                    if (entrada.repeticiones > 0) {
+                        return fichero.leer(c.datosInicio + entrada.inicio, entrada.longitud).then(function (bytes) {
+                            return descomprimir(bytes, c.compresionTeselas);
+                        });
+                    }
+                    if (nivel >= 3) return null;
+                    return bajar(c.hojasInicio + entrada.inicio, entrada.longitud, nivel + 1);
+                });
+            }
+            return z < c.zoomMinimo || z > c.zoomMaximo ? null : bajar(c.raizInicio, c.raizLongitud, 0);
+        });
+    };
+
+    function Protocol() {
+        var ficheros = {};
+        function fichero(url) {
+            return ficheros[url] || (ficheros[url] = new Fichero(url));
+        }
+        // Manejador para maplibregl.addProtocol("pmtiles", protocolo.tile)
+        this.tile = function (peticion) {
+            var partes = peticion.url.match(/^pmtiles:\/\/(.+)\/(\d+)\/(\d+)\/(\d+)$/);
+            if (!partes) {
+                var url = peticion.url.slice("pmtiles://".length), f = fichero(url);
+                return Promise.all([f.cabecera, f.metadatos()]).then(function (r) {
+                    var c = r[0], metadatos = r[1];
+                    return {data: {
+                        tilejson: "3.0.0", scheme: "xyz", tiles: [peticion.url + "/{z}/{x}/{y}"],
+                        minzoom: c.zoomMinimo, maxzoom: c.zoomMaximo, bounds: c.limites,
+                        vector_layers: metadatos.vector_layers || [], attribution: metadatos.attribution,
+                    }};
+                });
+            }
+            return fichero(partes[1]).tesela(+partes[2], +partes[3], +partes[4]).then(function (bytes) {
+                var datos = bytes ? bytes.slice().buffer : new ArrayBuffer(0);
+                return {data: datos};
+            });
+        };
+    }
+
+    global.pmtiles = {Protocol: Protocol, Fichero: Fichero, idTesela: idTesela};
+})(typeof self !== "undefined" ? self : this);
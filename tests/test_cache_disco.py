@@ -0,0 +1,85 @@
+import importlib
+import sys
+
+import pytest
+
+from utils import cache_disco
+
+
+@pytest.fixture
+def paquete(tmp_path, monkeypatch):
+    """Paquete `paquete_cache` con una función cacheada en `a` que usa `b`."""
+    raiz = tmp_path / "paquete_cache"
+    raiz.mkdir()
+    (raiz / "__init__.py").write_text("")
+    (raiz / "a.py").write_text(
+        "from utils.cache_disco import cache_disco\n"
+        "from paquete_cache.b import factor\n"
+        "LLAMADAS = []\n"
+        "FUENTE = None\n"
+        "@cache_disco(lambda: [FUENTE])\n"
+        "def calcular():\n"
+        "    LLAMADAS.append(1)\n"
+        "    return factor() * open(FUENTE).read()\n"
+    )
+    (raiz / "b.py").write_text("def factor():\n    return 2\n")
+    fuente = tmp_path / "fuente.txt"
+    fuente.write_text("x")
+
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(cache_disco, "DIRECTORIO_CACHE", tmp_path / "cache")
+    monkeypatch.setenv("CACHE_DISCO", "1")
+    cache_disco.huella_codigo.cache_clear()
+    modulo = importlib.import_module("paquete_cache.a")
+    modulo.FUENTE = str(fuente)
+    yield raiz, fuente, modulo
+    for nombre in [n for n in sys.modules if n.startswith("paquete_cache")]:
+        del sys.modules[nombre]
+    cache_disco.huella_codigo.cache_clear()
+
+
+def test_acierto_con_mismo_codigo_y_datos(paquete):
+    _, fuente, modulo = paquete
+    assert modulo.calcular() == "xx"
+    # Reescribir el mismo contenido no invalida la entrada
+    fuente.write_text("x")
+    assert modulo.calcular() == "xx"
+    assert len(modulo.LLAMADAS) == 1
+
+
+def test_cambio_en_los_datos(paquete):
+    _, fuente, modulo = paquete
+    modulo.calcular()
+    fuente.write_text("y")
+    assert modulo.calcular() == "yy"
+    assert len(modulo.LLAMADAS) == 2
+
+
+def test_cambio_en_un_modulo_importado(paquete):
+    raiz, _, modulo = paquete
+    antes = cache_disco.huella_codigo("paquete_cache.a")
+    modulo.calcular()
+    (raiz / "b.py").write_text("def factor():\n    return 3\n")
+    # Un servidor nuevo: la huella se calcula una vez por proceso
+    cache_disco.huella_codigo.cache_clear()
+    assert cache_disco.huella_codigo("paquete_cache.a") != antes
+    modulo.calcular()
+    assert len(modulo.LLAMADAS) == 2
+
+
+def test_huella_de_las_dependencias_de_utils(monkeypatch):
+    # utils.mapas dibuja con utils.mapa_folium y clasifica con utils.clasificacion
+    vistos = []
+    original = cache_disco._ruta_modulo
+
+    def registrar(nombre):
+        ruta = original(nombre)
+        if ruta is not None:
+            vistos.append(nombre)
+        return ruta
+
+    monkeypatch.setattr(cache_disco, "_ruta_modulo", registrar)
+    cache_disco.huella_codigo.cache_clear()
+    cache_disco.huella_codigo("utils.mapas")
+    cache_disco.huella_codigo.cache_clear()
+    assert {"utils.mapas", "utils.mapa_folium", "utils.clasificacion"} <= set(vistos)
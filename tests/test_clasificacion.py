@@ -0,0 +1,33 @@
+from itertools import combinations
+
+import numpy as np
+
+from utils.clasificacion import _jenks_lote
+
+
+def _suma_cuadrados(tramo):
+    return ((tramo - tramo.mean()) ** 2).sum()
+
+
+def _fisher_por_fuerza_bruta(x, clases):
+    # Todas las particiones de x (ordenado) en `clases` tramos contiguos
+    mejor = None
+    for cortes in combinations(range(1, len(x)), clases - 1):
+        inicios = (0, *cortes)
+        coste = sum(_suma_cuadrados(tramo) for tramo in np.split(x, cortes))
+        if mejor is None or coste < mejor[0]:
+            mejor = coste, inicios
+    return np.array([*x[list(mejor[1])], x[-1]])
+
+
+def test_jenks_coincide_con_la_busqueda_exhaustiva():
+    azar = np.random.default_rng(7)
+    for clases in (2, 3, 4, 5):
+        x = np.sort(azar.lognormal(10, 1, size=(6, 11)), axis=1)
+        esperado = np.array([_fisher_por_fuerza_bruta(fila, clases) for fila in x])
+        np.testing.assert_allclose(_jenks_lote(x, clases), esperado)
+
+
+def test_jenks_con_tantas_clases_como_valores():
+    x = np.array([[1.0, 2.0, 5.0, 9.0]])
+    np.testing.assert_allclose(_jenks_lote(x, 4), [[1.0, 2.0, 5.0, 9.0, 9.0]])
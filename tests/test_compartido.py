@@ -0,0 +1,48 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.compartido import congelar, vista
+
+
+@pytest.fixture
+def compartida():
+    tabla = pd.DataFrame(np.arange(12.0).reshape(4, 3), index=list("abcd"), columns=["x", "y", "z"])
+    return congelar(tabla)
+
+
+def test_las_vistas_no_copian_los_datos(compartida):
+    assert np.shares_memory(vista(compartida).to_numpy(), compartida.to_numpy())
+    assert np.shares_memory(vista(compartida)["y"].to_numpy(), compartida["y"].to_numpy())
+
+
+def test_los_arrays_compartidos_rechazan_escrituras(compartida):
+    pagina = vista(compartida)
+    with pytest.raises(ValueError):
+        pagina.to_numpy()[0, 0] = -1
+    # Ni siquiera volviendo a marcar el array como escribible: el bloque es de solo lectura
+    with pytest.raises(ValueError):
+        pagina.to_numpy().flags.writeable = True
+    with pytest.raises(ValueError):
+        valores = pagina["x"].to_numpy()
+        valores *= 2
+    assert compartida.iloc[0, 0] == 0
+
+
+def test_lo_que_cambia_una_vista_no_llega_a_las_demas(compartida):
+    pagina, otra = vista(compartida), vista(compartida)
+    pagina.iloc[0, 0] = -1
+    pagina["x"] = 0.0
+    pagina.columns.values[1] = "cambiada"
+    pagina.index = ["e", "f", "g", "h"]
+
+    for tabla in (otra, compartida):
+        assert tabla.iloc[0, 0] == 0
+        assert list(tabla.columns) == ["x", "y", "z"]
+        assert list(tabla.index) == list("abcd")
+
+
+def test_congelar_recorre_colecciones():
+    valor = congelar({"a": [np.zeros(3)], "b": (pd.Series([1.0, 2.0]),)})
+    assert not valor["a"][0].flags.writeable
+    assert not valor["b"][0].to_numpy().flags.writeable
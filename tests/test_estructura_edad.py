@@ -0,0 +1,38 @@
+import numpy as np
+import pandas as pd
+
+from utils.cubo import Cubo
+from utils.estructura_edad import estructura_por_edad
+
+
+def _mediana_por_bucle(poblacion, edades):
+    poblacion = np.nan_to_num(poblacion)
+    mitad, acumulada = poblacion.sum() / 2, 0.0
+    for edad, personas in zip(edades, poblacion):
+        if acumulada + personas >= mitad:
+            return edad + (mitad - acumulada) / personas
+        acumulada += personas
+    return np.nan
+
+
+def test_edad_mediana_coincide_con_el_bucle():
+    azar = np.random.default_rng(3)
+    edades = np.arange(101)
+    valores = azar.integers(0, 50_000, size=(4, 3, len(edades))).astype("float64")
+    # Pirámides con el grupo abierto en 85 (el resto de edades sin dato)
+    valores[0, :, 86:] = np.nan
+    piramides = Cubo(valores, {
+        "periodo": pd.period_range("2000", periods=4, freq="Y"),
+        "sexo": pd.Index(["Total", "Hombres", "Mujeres"]),
+        "edad": pd.Index(edades),
+    })
+
+    medianas = estructura_por_edad(piramides).sel(indicador="Edad mediana").valores
+    esperado = np.array([[_mediana_por_bucle(fila, edades) for fila in periodo] for periodo in valores])
+    np.testing.assert_allclose(medianas, esperado)
+
+
+def test_piramide_vacia_sin_indicadores():
+    valores = np.zeros((1, 3))
+    piramides = Cubo(valores, {"periodo": pd.Index([2000]), "edad": pd.Index([0, 1, 2])})
+    assert np.isnan(estructura_por_edad(piramides).valores).all()
@@ -0,0 +1,25 @@
+import numpy as np
+import pandas as pd
+
+from utils.cubo import Cubo
+from utils.memoria import tamaño
+
+
+def _cubo():
+    valores = np.arange(200 * 300, dtype="float64").reshape(200, 300)
+    return Cubo(valores, {"fila": pd.RangeIndex(200), "columna": pd.RangeIndex(300)})
+
+
+def test_cubo_mapeado_no_ocupa_memoria(tmp_path):
+    ruta = tmp_path / "cubo"
+    _cubo().guardar(ruta)
+
+    mapeado = Cubo.abrir(ruta, mmap=True)
+    en_memoria = Cubo.abrir(ruta, mmap=False)
+
+    assert tamaño(en_memoria) >= en_memoria.valores.nbytes
+    # Solo cuentan los ejes: los valores son páginas del fichero
+    assert tamaño(mapeado) == sum(tamaño(eje) for eje in mapeado.ejes.values())
+    assert tamaño(mapeado) < mapeado.valores.nbytes / 100
+    recorte = mapeado.sel(fila=slice(10, 20))
+    assert tamaño(recorte) == sum(tamaño(eje) for eje in recorte.ejes.values())
@@ -0,0 +1,25 @@
+import numpy as np
+
+from utils.montecarlo import TAMAÑO_LOTE, simular
+
+
+def _final(**opciones):
+    *_, ultimo = simular(**opciones)
+    return ultimo
+
+
+def test_mismo_resultado_en_serie_y_en_paralelo():
+    # Cuatro lotes, para que cada proceso tenga uno
+    opciones = dict(simulaciones=4 * TAMAÑO_LOTE, horizonte=5, semilla=11)
+    serie = _final(procesos=1, **opciones)
+    paralelo = _final(procesos=4, **opciones)
+
+    assert serie.terminada and paralelo.terminada
+    assert serie.trayectorias.shape == (4 * TAMAÑO_LOTE, 6, serie.trayectorias.shape[2])
+    np.testing.assert_array_equal(serie.trayectorias, paralelo.trayectorias)
+    assert serie.años.equals(paralelo.años)
+
+
+def test_la_semilla_cambia_las_trayectorias():
+    opciones = dict(simulaciones=TAMAÑO_LOTE, horizonte=3, procesos=1)
+    assert not np.array_equal(_final(semilla=1, **opciones).trayectorias, _final(semilla=2, **opciones).trayectorias)
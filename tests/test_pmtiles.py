@@ -0,0 +1,113 @@
+"""static/pmtiles.js frente a GDAL sobre un PMTiles escrito por GDAL, como static/municipios.pmtiles.
+
+El lector se ejecuta con node, con un `fetch` que sirve el fichero por rangos
+o entero; cada tesela que devuelve se compara con la que lee GDAL de su
+directorio (`/vsipmtiles/`).
+"""
+import json
+import shutil
+import subprocess
+from pathlib import Path
+
+import geopandas as gpd
+import pyogrio
+import pytest
+from pyogrio.core import vsi_listtree
+from shapely.geometry import box
+
+RAIZ = Path(__file__).resolve().parent.parent
+NODE = shutil.which("node")
+CAPA = "municipios"
+
+pytestmark = pytest.mark.skipif(
+    NODE is None or "PMTiles" not in pyogrio.list_drivers(),
+    reason="hacen falta node y el driver PMTiles de GDAL",
+)
+
+# Lee con pmtiles.js el TileJSON y las teselas z/x/y de los argumentos, y las guarda en `salida`
+LECTOR = """
+const fs = require("fs"), path = require("path");
+const [lector, fichero, salida, modo, ...teselas] = process.argv.slice(2);
+const contenido = fs.readFileSync(fichero);
+global.fetch = async (url, opciones) => {
+  if (modo === "entero") return new Response(contenido, {status: 200});
+  const [, inicio, fin] = /bytes=(\\d+)-(\\d+)/.exec(opciones.headers.Range);
+  return new Response(contenido.subarray(+inicio, +fin + 1), {status: 206});
+};
+global.self = global;
+require(lector);
+(async () => {
+  const protocolo = new pmtiles.Protocol(), url = "pmtiles://app/static/prueba.pmtiles";
+  const tilejson = (await protocolo.tile({url: url})).data;
+  for (const zxy of teselas) {
+    const datos = (await protocolo.tile({url: url + "/" + zxy})).data;
+    const destino = path.join(salida, zxy + ".mvt");
+    fs.mkdirSync(path.dirname(destino), {recursive: true});
+    fs.writeFileSync(destino, Buffer.from(datos));
+  }
+  console.log(JSON.stringify(tilejson));
+})().catch((e) => { console.error(e); process.exit(1); });
+"""
+
+
+@pytest.fixture(scope="module")
+def fichero(tmp_path_factory):
+    # Recuadros de 2° sobre España con código y nombre, como los municipios
+    recuadros = [box(x, y, x + 2, y + 2) for x in range(-10, 4, 2) for y in range(36, 44, 2)]
+    municipios = gpd.GeoDataFrame(
+        {"codigo": range(len(recuadros)), "Municipio": [f"Municipio {i}" for i in range(len(recuadros))]},
+        geometry=recuadros, crs="EPSG:4326",
+    )
+    ruta = tmp_path_factory.mktemp("pmtiles") / "prueba.pmtiles"
+    municipios.to_file(ruta, driver="PMTiles", layer=CAPA, MINZOOM=4, MAXZOOM=8)
+    return ruta
+
+
+def teselas_gdal(ruta):
+    raiz = f"/vsipmtiles/{ruta}/"
+    return sorted(nombre[len(raiz):-len(".mvt")] for nombre in vsi_listtree(raiz) if nombre.endswith(".mvt"))
+
+
+def leer_con_pmtiles_js(ruta, salida, teselas, modo="rangos"):
+    lector = salida / "lector.js"
+    lector.write_text(LECTOR, encoding="utf-8")
+    proceso = subprocess.run(
+        [NODE, str(lector), str(RAIZ / "static" / "pmtiles.js"), str(ruta), str(salida), modo, *teselas],
+        capture_output=True, text=True, timeout=120, check=True,
+    )
+    return json.loads(proceso.stdout)
+
+
+def entidades(ruta_tesela):
+    # Leída del PMTiles, GDAL da multipolígonos (el tipo de la capa); de la tesela suelta, polígonos
+    tabla = pyogrio.read_dataframe(ruta_tesela, layer=CAPA).explode(index_parts=False)
+    return sorted(zip(tabla["codigo"], tabla["Municipio"], tabla.geometry.to_wkb()))
+
+
+@pytest.mark.parametrize("modo", ["rangos", "entero"])
+def test_mismas_teselas_que_gdal(fichero, tmp_path, modo):
+    teselas = teselas_gdal(fichero)
+    assert len(teselas) > 100
+
+    leer_con_pmtiles_js(fichero, tmp_path, teselas, modo)
+
+    for zxy in teselas:
+        assert entidades(tmp_path / f"{zxy}.mvt") == entidades(f"/vsipmtiles/{fichero}/{zxy}.mvt"), zxy
+
+
+def test_teselas_vacias_fuera_de_los_datos_y_de_los_zooms(fichero, tmp_path):
+    # Océano a zoom 6, y zooms por debajo y por encima de los del fichero
+    fuera = ["6/0/0", "3/3/3", "9/250/190"]
+    leer_con_pmtiles_js(fichero, tmp_path, fuera)
+
+    for zxy in fuera:
+        assert (tmp_path / f"{zxy}.mvt").stat().st_size == 0, zxy
+
+
+def test_tilejson(fichero, tmp_path):
+    tilejson = leer_con_pmtiles_js(fichero, tmp_path, [])
+
+    assert (tilejson["minzoom"], tilejson["maxzoom"]) == (4, 8)
+    assert tilejson["tiles"] == ["pmtiles://app/static/prueba.pmtiles/{z}/{x}/{y}"]
+    assert tilejson["bounds"] == pytest.approx([-10, 36, 4, 44], abs=1e-6)
+    assert [capa["id"] for capa in tilejson["vector_layers"]] == [CAPA]
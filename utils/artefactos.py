@@ -0,0 +1,100 @@
+"""Caché de artefactos ya renderizados, compartida por todas las sesiones.
+
+Guarda el HTML de los mapas, las especificaciones de los gráficos y las
+trayectorias de las simulaciones (utils.montecarlo) bajo una clave (página,
+tabla y su versión, periodo, sexo, tolerancia), de modo que repetir una
+selección que ya hizo cualquier usuario cuesta una búsqueda en un diccionario.
+Cada caché es una LRU con un número máximo de entradas (CACHE_MAPAS,
+CACHE_GRAFICOS y CACHE_SIMULACIONES en el entorno) y cuenta sus aciertos y
+fallos para poder dimensionarla: `estadisticas()` los devuelve y el panel de
+rendimiento los muestra.
+
+Los valores se comparten tal cual entre sesiones: no deben modificarse.
+"""
+import os
+import threading
+from collections import OrderedDict
+
+from utils.cache_disco import huella
+from utils.ingesta import ruta_origen
+from utils.tiempos import anotar_cache
+
+
+class CacheArtefactos:
+    def __init__(self, nombre, maximo):
+        self.nombre = nombre
+        self.maximo = maximo
+        self.aciertos = 0
+        self.fallos = 0
+        self._valores = OrderedDict()
+        self._en_curso = {}    # clave -> Event de la construcción en marcha
+        self._cerrojo = threading.Lock()
+
+    def obtener(self, clave, construir):
+        """Valor de `clave`, que se construye con `construir()` si no está.
+
+        Si otra sesión ya está construyendo la misma clave, se espera a que
+        termine en lugar de repetir el trabajo; si falla, lo intenta otra.
+        """
+        while True:
+            with self._cerrojo:
+                if clave in self._valores:
+                    self._valores.move_to_end(clave)
+                    self.aciertos += 1
+                    anotar_cache(f"artefactos:{self.nombre}")
+                    return self._valores[clave]
+                en_curso = self._en_curso.get(clave)
+                if en_curso is None:
+                    en_curso = self._en_curso[clave] = threading.Event()
+                    break
+            en_curso.wait()
+
+        # Se construye fuera del cerrojo para no bloquear las demás sesiones
+        try:
+            valor = construir()
+            with self._cerrojo:
+                self.fallos += 1
+                self._valores[clave] = valor
+                self._valores.move_to_end(clave)
+                while len(self._valores) > self.maximo:
+                    self._valores.popitem(last=False)
+        finally:
+            with self._cerrojo:
+                del self._en_curso[clave]
+            en_curso.set()
+        anotar_cache(f"artefactos:{self.nombre}", fallo=True)
+        return valor
+
+    def __contains__(self, clave):
+        with self._cerrojo:
+            return clave in self._valores
+
+    def vaciar(self):
+        with self._cerrojo:
+            self._valores.clear()
+
+    def estadisticas(self):
+        consultas = self.aciertos + self.fallos
+        return {
+            "entradas": len(self._valores),
+            "maximo": self.maximo,
+            "aciertos": self.aciertos,
+            "fallos": self.fallos,
+            "tasa_aciertos": round(self.aciertos / consultas, 3) if consultas else None,
+        }
+
+
+MAPAS = CacheArtefactos("mapas", int(os.environ.get("CACHE_MAPAS", 256)))
+GRAFICOS = CacheArtefactos("graficos", int(os.environ.get("CACHE_GRAFICOS", 256)))
+# Trayectorias de utils.montecarlo: unos MB cada una
+SIMULACIONES = CacheArtefactos("simulaciones", int(os.environ.get("CACHE_SIMULACIONES", 4)))
+CACHES = {cache.nombre: cache for cache in (MAPAS, GRAFICOS, SIMULACIONES)}
+
+
+def estadisticas():
+    return {nombre: cache.estadisticas() for nombre, cache in CACHES.items()}
+
+
+def version_tabla(nombre):
+    """Identifica el contenido actual de un libro, para que un .xlsx nuevo no reutilice artefactos viejos."""
+    return huella(ruta_origen(nombre))
@@ -0,0 +1,241 @@
+"""Benchmark sin navegador de todas las páginas de la app.
+
+Cada página se ejecuta con `streamlit.testing.v1.AppTest` en un proceso propio:
+una primera ejecución en frío (proceso nuevo, sin cachés de Streamlit ni
+importaciones previas) y varias en caliente sobre ese mismo proceso, de las que
+se guarda la mediana. Por ejecución se anotan el tiempo total, el tiempo por
+fase (ver utils.tiempos) y la memoria:
+
+    rss_pico_mb       pico de memoria residente del proceso hasta ese momento
+    asignado_pico_mb  pico de memoria reservada por Python en una ejecución en
+                      caliente adicional medida con tracemalloc
+
+Uso:
+    python -m utils.benchmark                          # todas las páginas
+    python -m utils.benchmark pages/7_📑_Relaciones.py
+    python -m utils.benchmark --referencia base.json --umbral 0.2
+    python -m utils.benchmark --desde-excel            # la ejecución en frío relee los .xlsx
+
+Los resultados se escriben en JSON (`--salida`). Con `--referencia` se comparan
+con una ejecución anterior y el proceso termina con código 1 si alguna página
+tarda más de referencia * (1 + umbral) + margen, o si alguna página falla. Sin
+`datasets/provincias.parquet` ni el shapefile del IGN, que no se distribuyen,
+el error de las páginas con mapa provincial no cuenta como fallo (`sin_datos`).
+El umbral por defecto se puede fijar con la variable BENCHMARK_UMBRAL.
+
+También falla si, en frío, una página pasa más tiempo importando módulos que
+su presupuesto en PRESUPUESTO_IMPORTACION (escalable con --factor-presupuesto
+en máquinas más lentas). Cada presupuesto parte de lo medido para esa página;
+la portada tiene el más estricto: es lo primero que se pinta al arrancar el
+servidor.
+Solo usa los datos de `datasets/`; no necesita red. Para medir muchas sesiones
+a la vez contra un servidor de verdad, ver utils.carga.
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+RAIZ = Path(__file__).resolve().parent.parent
+TIEMPO_MAXIMO = 300
+
+# Segundos de importación permitidos en la ejecución en frío de cada página.
+# Salen de medir en frío cada página (python -m utils.benchmark, sin límites
+# provinciales) y dejar un 25-40 % de holgura sobre lo medido:
+#   portada 0.14 s (sin pandas); 2-4 0.67-0.80 s (pandas, pyarrow, altair y el
+#   mapa); 5 0.67 s (pandas y altair); 6, 7 y 9 0.52-0.56 s (pandas y plotly);
+#   8 0.01 s (solo texto).
+# Una página nueva usa el de por defecto hasta que se mida la suya.
+PRESUPUESTO_IMPORTACION = {
+    "1_🏠_Home.py": 0.2,
+    "pages/2_🏙️_Análisis poblacional.py": 1.0,
+    "pages/3_🧑‍🍼_Análisis de natalidad.py": 1.0,
+    "pages/4_💀_Análisis de defunciones.py": 1.0,
+    "pages/5_🎎_Análisis de Inmigración.py": 0.9,
+    "pages/6_🔼_Pirámide poblacional.py": 0.75,
+    "pages/7_📑_Relaciones.py": 0.75,
+    "pages/8_🚀_Conclusiones.py": 0.1,
+    "pages/9_🔮_Proyección.py": 0.75,
+}
+PRESUPUESTO_IMPORTACION_DEFECTO = 0.75
+
+
+def paginas_app():
+    return [RAIZ / "1_🏠_Home.py", *sorted((RAIZ / "pages").glob("*.py"))]
+
+
+def _rss_pico_mb():
+    import resource
+
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux lo da en KiB y macOS en bytes
+    return round(pico / (1024 ** 2 if sys.platform == "darwin" else 1024), 1)
+
+
+def _ejecutar(ruta):
+    from streamlit.testing.v1 import AppTest
+
+    from utils import tiempos
+
+    registro = tiempos.activar()
+    inicio = time.perf_counter()
+    try:
+        app = AppTest.from_file(str(ruta), default_timeout=TIEMPO_MAXIMO).run()
+        errores = [str(e.value) for e in app.exception] + [str(e.value) for e in app.error]
+    except Exception as e:  # un fallo de la página no debe parar el benchmark
+        errores = [f"{type(e).__name__}: {e}"]
+    segundos = time.perf_counter() - inicio
+    tiempos.desactivar()
+    return {
+        "segundos": round(segundos, 4),
+        "fases": registro.resumen(),
+        "cache": registro.resumen_cache(),
+        "error": errores[0] if errores else None,
+        "errores": errores,
+    }
+
+
+def medir_pagina(ruta, repeticiones=3, desde_excel=False):
+    """Mide una página en el proceso actual, que debe ser nuevo para que el frío lo sea."""
+    from utils import tiempos
+
+    # No importa las librerías de FASES: las envuelve al importarlas la página, dentro de la medida en frío
+    tiempos.instrumentar()
+    with tempfile.TemporaryDirectory() as procesados:
+        if desde_excel:
+            from utils import cache_disco, ingesta
+
+            ingesta.DIRECTORIO_PROCESADOS = Path(procesados)
+            cache_disco.DIRECTORIO_CACHE = Path(procesados) / "cache"
+
+        frio = _ejecutar(ruta)
+        frio["rss_pico_mb"] = _rss_pico_mb()
+
+        calientes = sorted((_ejecutar(ruta) for _ in range(repeticiones)), key=lambda r: r["segundos"])
+        caliente = calientes[len(calientes) // 2]
+
+        tracemalloc.start()
+        _ejecutar(ruta)
+        caliente["asignado_pico_mb"] = round(tracemalloc.get_traced_memory()[1] / 1024 ** 2, 1)
+        tracemalloc.stop()
+        caliente["rss_pico_mb"] = _rss_pico_mb()
+
+    return {"frio": frio, "caliente": caliente}
+
+
+def _medir_en_subproceso(ruta, repeticiones, desde_excel):
+    orden = [sys.executable, "-m", "utils.benchmark", "--hijo", str(ruta), "--repeticiones", str(repeticiones)]
+    if desde_excel:
+        orden.append("--desde-excel")
+    # Sin precarga (utils.precarga): se mide lo que cuesta cada página por sí misma
+    proceso = subprocess.run(orden, cwd=RAIZ, capture_output=True, text=True, timeout=TIEMPO_MAXIMO * (repeticiones + 2),
+                             env=dict(os.environ, PRECARGA="0"))
+    if proceso.returncode != 0:
+        ultima = (proceso.stderr.strip().splitlines() or ["sin salida"])[-1]
+        error = {"segundos": None, "fases": {}, "error": f"el proceso terminó con código {proceso.returncode}: {ultima}"}
+        return {"frio": error, "caliente": error}
+    return json.loads(proceso.stdout.strip().splitlines()[-1])
+
+
+def ejecutar_benchmark(paginas=None, repeticiones=3, desde_excel=False):
+    resultados = {}
+    for ruta in paginas or paginas_app():
+        ruta = Path(ruta).resolve()
+        nombre = ruta.relative_to(RAIZ).as_posix()
+        resultados[nombre] = _medir_en_subproceso(ruta, repeticiones, desde_excel)
+        frio, caliente = resultados[nombre]["frio"], resultados[nombre]["caliente"]
+        if _errores(frio):
+            estado = f"ERROR: {_errores(frio)[0]}"
+        else:
+            estado = "(sin límites provinciales: el mapa no se mide)" if frio["error"] else ""
+        print(f"{nombre}: frío {frio['segundos']} s, caliente {caliente['segundos']} s {estado}", file=sys.stderr)
+    return {
+        "fecha": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "maquina": platform.node(),
+        "repeticiones": repeticiones,
+        "desde_excel": desde_excel,
+        "paginas": resultados,
+    }
+
+
+def sin_datos(error):
+    """True si `error` solo se debe a lo que el repositorio no distribuye: los límites provinciales."""
+    from utils.geometria import FALTAN_LIMITES, hay_limites
+
+    return not hay_limites() and FALTAN_LIMITES in error
+
+
+def _errores(medida):
+    errores = medida.get("errores", [medida["error"]] if medida["error"] else [])
+    return [error for error in errores if not sin_datos(error)]
+
+
+def comparar(actual, referencia, umbral, margen=0.05, factor_presupuesto=1.0):
+    """Lista de textos describiendo errores y regresiones de `actual` frente a `referencia`.
+
+    Los errores de `sin_datos` no cuentan: en una copia recién clonada las
+    páginas con mapa provincial los muestran siempre.
+    """
+    problemas = []
+    for pagina, modos in actual["paginas"].items():
+        importacion = modos["frio"]["fases"].get("importacion", {}).get("segundos", 0)
+        presupuesto = PRESUPUESTO_IMPORTACION.get(pagina, PRESUPUESTO_IMPORTACION_DEFECTO) * factor_presupuesto
+        if importacion > presupuesto:
+            problemas.append(f"{pagina}: {importacion:.3f} s importando módulos (presupuesto {presupuesto:.3f} s)")
+        for modo, medida in modos.items():
+            errores = _errores(medida)
+            if errores:
+                problemas.append(f"{pagina} ({modo}): {errores[0]}")
+                continue
+            base = referencia.get("paginas", {}).get(pagina, {}).get(modo)
+            if not base or base.get("segundos") is None:
+                continue
+            limite = base["segundos"] * (1 + umbral) + margen
+            if medida["segundos"] > limite:
+                problemas.append(
+                    f"{pagina} ({modo}): {medida['segundos']:.3f} s frente a {base['segundos']:.3f} s "
+                    f"(límite {limite:.3f} s)"
+                )
+    return problemas
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Benchmark de las páginas de la app con AppTest.")
+    parser.add_argument("paginas", nargs="*", type=Path, help="scripts a medir (por defecto, todos)")
+    parser.add_argument("--repeticiones", type=int, default=3, help="ejecuciones en caliente por página")
+    parser.add_argument("--salida", type=Path, default=Path("benchmark.json"))
+    parser.add_argument("--referencia", type=Path, help="resultado anterior con el que comparar")
+    parser.add_argument("--umbral", type=float, default=float(os.environ.get("BENCHMARK_UMBRAL", 0.25)),
+                        help="empeoramiento relativo tolerado (0.25 = 25 %%)")
+    parser.add_argument("--margen", type=float, default=0.05, help="holgura absoluta en segundos")
+    parser.add_argument("--factor-presupuesto", type=float, default=1.0,
+                        help="multiplica los presupuestos de importación")
+    parser.add_argument("--desde-excel", action="store_true",
+                        help="en frío, reconstruir las tablas desde los .xlsx en un directorio temporal")
+    parser.add_argument("--hijo", type=Path, help=argparse.SUPPRESS)
+    args = parser.parse_args(argumentos)
+
+    if args.hijo:
+        print(json.dumps(medir_pagina(args.hijo, args.repeticiones, args.desde_excel), ensure_ascii=False))
+        return 0
+
+    resultado = ejecutar_benchmark(args.paginas, args.repeticiones, args.desde_excel)
+    args.salida.write_text(json.dumps(resultado, ensure_ascii=False, indent=2), encoding="utf-8")
+
+    referencia = json.loads(args.referencia.read_text(encoding="utf-8")) if args.referencia else {}
+    problemas = comparar(resultado, referencia, args.umbral, args.margen, args.factor_presupuesto)
+    for problema in problemas:
+        print(f"FALLO {problema}", file=sys.stderr)
+    return 1 if problemas else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
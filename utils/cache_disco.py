@@ -0,0 +1,187 @@
+"""Caché en disco que sobrevive a reinicios y despliegues del servidor.
+
+`@cache_disco(fuentes)` guarda con pickle el resultado de la función en
+`datasets/procesados/cache/`. La clave combina:
+
+- el módulo y el nombre de la función, el código fuente de su módulo y de
+  los módulos del mismo paquete (utils.*) que este importa, directa o
+  indirectamente, más `version` (que se sube cuando cambia algo de lo que
+  depende fuera del paquete, p. ej. el formato de una librería);
+- los argumentos de la llamada;
+- el contenido (sha256) de los ficheros `fuentes`, no su fecha, de modo que
+  copiar o volver a desplegar los mismos datos no invalida nada.
+
+Cada acierto renueva la fecha de modificación del fichero y, al escribir, se
+borran los menos usados hasta que el directorio ocupa menos de CACHE_DISCO_MB
+(256 por defecto). Con CACHE_DISCO=0 se desactiva.
+"""
+import ast
+import functools
+import hashlib
+import importlib.util
+import os
+import pickle
+import sys
+import tempfile
+from pathlib import Path
+
+DIRECTORIO_CACHE = Path(__file__).resolve().parent.parent / "datasets" / "procesados" / "cache"
+TAMAÑO_MAXIMO = int(os.environ.get("CACHE_DISCO_MB", 256)) * 1024 ** 2
+
+_huellas = {}
+
+
+def huella(ruta):
+    """sha256 del contenido de `ruta`, o None si no existe.
+
+    Se recalcula solo cuando cambian el tamaño o la fecha del fichero.
+    """
+    ruta = Path(ruta)
+    try:
+        estado = ruta.stat()
+    except FileNotFoundError:
+        return None
+    clave = (str(ruta), estado.st_size, estado.st_mtime_ns)
+    if clave not in _huellas:
+        resumen = hashlib.sha256()
+        with open(ruta, "rb") as fichero:
+            for bloque in iter(lambda: fichero.read(1 << 20), b""):
+                resumen.update(bloque)
+        _huellas[clave] = resumen.hexdigest()
+    return _huellas[clave]
+
+
+def _ruta_modulo(nombre):
+    # Sin importar nada: se busca el fichero a partir del directorio del paquete
+    raiz, *partes = nombre.split(".")
+    paquete = getattr(sys.modules.get(raiz), "__file__", None)
+    if paquete is None:
+        return None
+    base = Path(paquete).parent.joinpath(*partes)
+    for ruta in (base.with_suffix(".py"), base / "__init__.py"):
+        if ruta.is_file():
+            return ruta
+    return None
+
+
+def _importados(nombre, ruta):
+    # Módulos que importa el fichero, incluidos los imports dentro de funciones
+    arbol = ast.parse(ruta.read_bytes())
+    paquete = nombre if ruta.name == "__init__.py" else nombre.rpartition(".")[0]
+    for nodo in ast.walk(arbol):
+        if isinstance(nodo, ast.Import):
+            yield from (alias.name for alias in nodo.names)
+        elif isinstance(nodo, ast.ImportFrom):
+            base = importlib.util.resolve_name("." * nodo.level + (nodo.module or ""), paquete) if nodo.level \
+                else nodo.module
+            yield base
+            # `from utils import datos` importa el submódulo utils.datos
+            yield from (f"{base}.{alias.name}" for alias in nodo.names)
+
+
+@functools.cache
+def huella_codigo(modulo):
+    """sha256 del código de `modulo` y de los módulos de su mismo paquete de primer nivel que importa."""
+    # Con `python -m utils.x` el módulo se llama __main__
+    especificacion = getattr(sys.modules.get(modulo), "__spec__", None)
+    modulo = especificacion.name if modulo == "__main__" and especificacion else modulo
+    raiz = modulo.split(".")[0]
+    pendientes, vistos, resumen = [modulo], set(), hashlib.sha256()
+    while pendientes:
+        nombre = pendientes.pop()
+        if nombre in vistos:
+            continue
+        vistos.add(nombre)
+        ruta = _ruta_modulo(nombre)
+        if ruta is None:
+            continue
+        resumen.update(nombre.encode() + b"\0" + ruta.read_bytes())
+        pendientes.extend(m for m in _importados(nombre, ruta) if m.split(".")[0] == raiz)
+    return resumen.hexdigest()
+
+
+def _normalizar(valor):
+    # pickle de un DataFrame no da los mismos bytes en todos los procesos; su contenido sí
+    if isinstance(valor, (dict, list, tuple)):
+        elementos = valor.items() if isinstance(valor, dict) else enumerate(valor)
+        return type(valor).__name__, [(k, _normalizar(v)) for k, v in elementos]
+    if type(valor).__module__.startswith("pandas"):
+        import pandas as pd
+
+        tabla = valor.to_frame() if isinstance(valor, pd.Series) else valor
+        if isinstance(tabla, pd.DataFrame):
+            return (
+                type(valor).__name__, list(map(str, tabla.columns)), list(map(str, tabla.dtypes)),
+                pd.util.hash_pandas_object(tabla, index=True).to_numpy().tobytes(),
+            )
+    return valor
+
+
+def _recortar():
+    ficheros = []
+    for ruta in DIRECTORIO_CACHE.glob("*.pkl"):
+        try:
+            estado = ruta.stat()
+        except FileNotFoundError:
+            continue
+        ficheros.append((estado.st_mtime, estado.st_size, ruta))
+    total = sum(tamaño for _, tamaño, _ in ficheros)
+    for _, tamaño, ruta in sorted(ficheros):
+        if total <= TAMAÑO_MAXIMO:
+            break
+        ruta.unlink(missing_ok=True)
+        total -= tamaño
+
+
+def _escribir(ruta, valor):
+    DIRECTORIO_CACHE.mkdir(parents=True, exist_ok=True)
+    # Se escribe aparte y se renombra para que otro proceso nunca lea un fichero a medias
+    with tempfile.NamedTemporaryFile(dir=DIRECTORIO_CACHE, suffix=".tmp", delete=False) as temporal:
+        pickle.dump(valor, temporal, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temporal.name, ruta)
+    _recortar()
+
+
+def cache_disco(fuentes=(), version=1):
+    """Decorador de caché persistente.
+
+    `fuentes` es una lista de rutas o una función que, con los mismos argumentos
+    que la decorada, devuelve esa lista.
+    """
+    def decorar(funcion):
+        @functools.wraps(funcion)
+        def envoltura(*args, **kwargs):
+            if os.environ.get("CACHE_DISCO", "1") == "0":
+                return funcion(*args, **kwargs)
+            rutas = fuentes(*args, **kwargs) if callable(fuentes) else fuentes
+            try:
+                clave = pickle.dumps((
+                    funcion.__module__, funcion.__qualname__, huella_codigo(funcion.__module__), version,
+                    _normalizar(args), _normalizar(sorted(kwargs.items())), [huella(r) for r in rutas],
+                ))
+            except (pickle.PicklingError, TypeError, AttributeError):
+                return funcion(*args, **kwargs)
+            ruta = DIRECTORIO_CACHE / f"{funcion.__qualname__}-{hashlib.sha256(clave).hexdigest()[:32]}.pkl"
+
+            try:
+                with open(ruta, "rb") as fichero:
+                    valor = pickle.load(fichero)
+                os.utime(ruta)
+                return valor
+            except FileNotFoundError:
+                pass
+            except Exception:  # fichero dañado o de otra versión del código: se recalcula
+                ruta.unlink(missing_ok=True)
+
+            valor = funcion(*args, **kwargs)
+            _escribir(ruta, valor)
+            return valor
+
+        return envoltura
+
+    return decorar
+
+
+def vaciar_cache():
+    for ruta in DIRECTORIO_CACHE.glob("*.pkl"):
+        ruta.unlink(missing_ok=True)
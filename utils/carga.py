@@ -0,0 +1,362 @@
+"""Prueba de carga: muchas sesiones a la vez contra un servidor de verdad.
+
+Arranca la app con `streamlit run` en un puerto libre y abre N sesiones por el
+websocket de Streamlit (`/_stcore/stream`), con los mismos mensajes que manda
+el navegador (BackMsg/ForwardMsg). Cada sesión simulada sigue un guion
+aleatorio, reproducible con `--semilla`: entra en una página (con más peso las
+de mapas folium y Relaciones, ver PESOS_PAGINAS), cambia unos cuantos controles
+(año, sexo, método de color, nivel del mapa...) y pasa a otra página. Antes de
+medir, una sesión recorre todas las páginas para que las cachés estén llenas.
+
+Se mide la latencia de cada rerun, desde que se envía hasta que llega
+`script_finished`, y se informa de los percentiles p50/p95/p99 por página y en
+total, los reruns por segundo y la memoria residente del servidor (muestreada
+de /proc mientras dura la prueba). Uso:
+
+    python -m utils.carga --sesiones 20 --duracion 60
+    python -m utils.carga --sesiones 40 --salida carga.json --referencia carga-base.json
+
+El resultado se escribe en JSON (`--salida`) con el commit y la máquina, para
+comparar ejecuciones en la misma máquina. Con `--referencia` el proceso termina
+con código 1 si el p95 de alguna página supera el de referencia * (1 + umbral)
++ margen, o si algún rerun falla. No necesita red ni navegador; solo Linux
+para medir la memoria del servidor.
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+from utils.benchmark import RAIZ
+from utils.memoria import rss_mb
+
+TIEMPO_MAXIMO = 120
+PERCENTILES = (50, 95, 99)
+
+# Probabilidad relativa de que una sesión elija cada página; las demás pesan 1
+PESOS_PAGINAS = {
+    "Análisis poblacional": 3,
+    "Análisis de natalidad": 3,
+    "Análisis de defunciones": 3,
+    "Relaciones": 3,
+}
+CONTROLES = ("radio", "selectbox", "slider", "checkbox")
+
+
+def _puerto_libre():
+    with socket.socket() as conexion:
+        conexion.bind(("127.0.0.1", 0))
+        return conexion.getsockname()[1]
+
+
+def _commit():
+    proceso = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=RAIZ, capture_output=True, text=True)
+    return proceso.stdout.strip() or None
+
+
+class Servidor:
+    """`streamlit run` de la app en segundo plano, mientras dure el bloque `with`."""
+
+    def __init__(self, puerto=None, entorno=None):
+        self.puerto = puerto or _puerto_libre()
+        self.entorno = entorno or {}
+        self.proceso = None
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.puerto}"
+
+    def __enter__(self):
+        orden = [
+            sys.executable, "-m", "streamlit", "run", str(RAIZ / "1_🏠_Home.py"),
+            "--server.headless", "true", "--server.port", str(self.puerto),
+            "--browser.gatherUsageStats", "false",
+        ]
+        self.proceso = subprocess.Popen(orden, cwd=RAIZ, env=dict(os.environ, **self.entorno),
+                                        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        limite = time.monotonic() + TIEMPO_MAXIMO
+        while time.monotonic() < limite:
+            if self.proceso.poll() is not None:
+                raise RuntimeError(f"el servidor terminó al arrancar con código {self.proceso.returncode}")
+            try:
+                with urllib.request.urlopen(f"{self.url}/_stcore/health", timeout=1):
+                    return self
+            except OSError:
+                time.sleep(0.2)
+        self.__exit__()
+        raise TimeoutError(f"el servidor no respondió en {TIEMPO_MAXIMO} s")
+
+    def __exit__(self, *_):
+        self.proceso.terminate()
+        try:
+            self.proceso.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            self.proceso.kill()
+
+    def rss_mb(self):
+        return rss_mb(self.proceso.pid)
+
+
+class Sesion:
+    """Una pestaña del navegador: un websocket y el estado de sus controles."""
+
+    def __init__(self, url):
+        self.url = url.replace("http", "ws", 1) + "/_stcore/stream"
+        self.paginas = {}      # nombre -> page_script_hash
+        self.controles = {}    # id -> control del último rerun (proto de radio, selectbox...)
+        self.estados = {}      # id -> WidgetState enviado
+        self._websocket = None
+
+    async def abrir(self):
+        import websockets
+
+        self._websocket = await websockets.connect(self.url, subprotocols=["streamlit"], max_size=None)
+        return self
+
+    async def cerrar(self):
+        await self._websocket.close()
+
+    async def rerun(self, pagina=""):
+        """Ejecuta la página con los estados actuales; devuelve (segundos, error o None)."""
+        from streamlit.proto.BackMsg_pb2 import BackMsg
+
+        mensaje = BackMsg()
+        mensaje.rerun_script.page_script_hash = self.paginas.get(pagina, "")
+        mensaje.rerun_script.widget_states.widgets.extend(self.estados.values())
+        self.controles = {}
+        inicio = time.perf_counter()
+        await self._websocket.send(mensaje.SerializeToString())
+        try:
+            error = await asyncio.wait_for(self._recibir_hasta_fin(), TIEMPO_MAXIMO)
+        except asyncio.TimeoutError:
+            error = f"sin respuesta en {TIEMPO_MAXIMO} s"
+        return time.perf_counter() - inicio, error
+
+    async def _recibir_hasta_fin(self):
+        from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+        error = None
+        while True:
+            mensaje = ForwardMsg()
+            mensaje.ParseFromString(await self._websocket.recv())
+            tipo = mensaje.WhichOneof("type")
+            if tipo == "navigation":
+                self.paginas = {p.page_name: p.page_script_hash for p in mensaje.navigation.app_pages}
+            elif tipo == "delta" and mensaje.delta.WhichOneof("type") == "new_element":
+                elemento = mensaje.delta.new_element
+                clase = elemento.WhichOneof("type")
+                if clase == "exception" and error is None:
+                    error = f"{elemento.exception.type}: {elemento.exception.message}"
+                elif clase in CONTROLES:
+                    control = getattr(elemento, clase)
+                    self.controles[control.id] = (clase, control)
+            elif tipo == "script_finished":
+                if mensaje.script_finished == ForwardMsg.FINISHED_WITH_COMPILE_ERROR:
+                    return error or "error de compilación"
+                if mensaje.script_finished != ForwardMsg.FINISHED_EARLY_FOR_RERUN:
+                    return error
+
+    def cambiar_control(self, azar):
+        """Da un valor nuevo a un control al azar de la página; False si no hay ninguno."""
+        from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+        candidatos = sorted(self.controles)
+        if not candidatos:
+            return False
+        identificador = azar.choice(candidatos)
+        clase, control = self.controles[identificador]
+        estado = WidgetState(id=identificador)
+        if clase == "checkbox":
+            anterior = self.estados.get(identificador)
+            estado.bool_value = not (anterior.bool_value if anterior else control.default)
+        elif clase == "slider" and control.options:  # select_slider
+            estado.string_array_value.data.append(azar.choice(control.options))
+        elif clase == "slider":
+            pasos = int(round((control.max - control.min) / control.step))
+            estado.double_array_value.data.append(control.min + control.step * azar.randint(0, pasos))
+        else:
+            estado.string_value = azar.choice(control.options)
+        self.estados[identificador] = estado
+        return True
+
+    def olvidar_controles(self):
+        self.estados = {}
+
+
+async def _guion(url, azar, fin, interacciones, pausa, medidas):
+    sesion = await Sesion(url).abrir()
+    try:
+        _, error = await sesion.rerun()
+        while time.monotonic() < fin:
+            nombres = sorted(sesion.paginas)
+            pagina = azar.choices(nombres, weights=[PESOS_PAGINAS.get(n, 1) for n in nombres])[0]
+            sesion.olvidar_controles()
+            segundos, error = await sesion.rerun(pagina)
+            medidas.append({"pagina": pagina, "tipo": "pagina", "segundos": segundos, "error": error})
+            for _ in range(interacciones):
+                await asyncio.sleep(azar.uniform(0, pausa))
+                if time.monotonic() >= fin or not sesion.cambiar_control(azar):
+                    break
+                segundos, error = await sesion.rerun(pagina)
+                medidas.append({"pagina": pagina, "tipo": "control", "segundos": segundos, "error": error})
+    finally:
+        await sesion.cerrar()
+
+
+async def _calentar(url):
+    sesion = await Sesion(url).abrir()
+    try:
+        await sesion.rerun()
+        for pagina in sorted(sesion.paginas):
+            await sesion.rerun(pagina)
+    finally:
+        await sesion.cerrar()
+
+
+async def _muestrear_memoria(servidor, muestras, intervalo=0.5):
+    while True:
+        muestras.append(servidor.rss_mb())
+        await asyncio.sleep(intervalo)
+
+
+def _percentiles(segundos):
+    if not segundos:
+        return {f"p{p}": None for p in PERCENTILES}
+    valores = np.percentile(segundos, PERCENTILES)
+    return {f"p{p}": round(float(v), 4) for p, v in zip(PERCENTILES, valores)}
+
+
+def resumir(medidas, duracion):
+    """Reruns, errores, reruns/s y percentiles de latencia, en total y por página."""
+    def resumen(grupo):
+        return {
+            "reruns": len(grupo),
+            "errores": sum(m["error"] is not None for m in grupo),
+            **_percentiles([m["segundos"] for m in grupo if m["error"] is None]),
+        }
+
+    paginas = sorted({m["pagina"] for m in medidas})
+    return {
+        "total": dict(resumen(medidas), reruns_por_segundo=round(len(medidas) / duracion, 2)),
+        "paginas": {p: resumen([m for m in medidas if m["pagina"] == p]) for p in paginas},
+        "errores": sorted({m["error"] for m in medidas if m["error"] is not None})[:10],
+    }
+
+
+async def _prueba(servidor, sesiones, duracion, interacciones, pausa, semilla, rampa, calentar):
+    if calentar:
+        await _calentar(servidor.url)
+    memoria = []
+    muestreo = asyncio.create_task(_muestrear_memoria(servidor, memoria))
+    medidas = []
+    inicio = time.monotonic()
+    fin = inicio + rampa + duracion
+
+    async def lanzar(indice):
+        await asyncio.sleep(rampa * indice / max(sesiones, 1))
+        await _guion(servidor.url, random.Random(semilla + indice), fin, interacciones, pausa, medidas)
+
+    await asyncio.gather(*(lanzar(i) for i in range(sesiones)))
+    duracion_real = time.monotonic() - inicio
+    muestreo.cancel()
+    memoria = [m for m in memoria if m is not None]
+    resultado = resumir(medidas, duracion_real)
+    resultado["segundos"] = round(duracion_real, 1)
+    resultado["rss_mb"] = {
+        "inicio": round(memoria[0], 1) if memoria else None,
+        "pico": round(max(memoria), 1) if memoria else None,
+        "final": round(memoria[-1], 1) if memoria else None,
+    }
+    return resultado
+
+
+def ejecutar_prueba(sesiones=10, duracion=30, interacciones=3, pausa=0.5, semilla=0, rampa=0.0, calentar=True):
+    """Arranca el servidor, lanza las sesiones y devuelve el informe."""
+    with Servidor() as servidor:
+        resultado = asyncio.run(
+            _prueba(servidor, sesiones, duracion, interacciones, pausa, semilla, rampa, calentar)
+        )
+    return {
+        "fecha": datetime.now().isoformat(timespec="seconds"),
+        "commit": _commit(),
+        "python": platform.python_version(),
+        "maquina": platform.node(),
+        "nucleos": os.cpu_count(),
+        "parametros": {
+            "sesiones": sesiones, "duracion": duracion, "interacciones": interacciones,
+            "pausa": pausa, "semilla": semilla, "rampa": rampa,
+        },
+        **resultado,
+    }
+
+
+def comparar(actual, referencia, umbral, margen=0.05):
+    """Lista de textos describiendo errores y regresiones del p95 frente a `referencia`."""
+    problemas = [f"{pagina}: {medida['errores']} reruns con error" for pagina, medida in actual["paginas"].items()
+                 if medida["errores"]]
+    for pagina, medida in actual["paginas"].items():
+        base = referencia.get("paginas", {}).get(pagina, {}).get("p95")
+        if base is None or medida["p95"] is None:
+            continue
+        limite = base * (1 + umbral) + margen
+        if medida["p95"] > limite:
+            problemas.append(f"{pagina}: p95 {medida['p95']:.3f} s frente a {base:.3f} s (límite {limite:.3f} s)")
+    return problemas
+
+
+def _imprimir(resultado):
+    total = resultado["total"]
+    print(f"{resultado['parametros']['sesiones']} sesiones, {resultado['segundos']} s: {total['reruns']} reruns "
+          f"({total['reruns_por_segundo']}/s), {total['errores']} con error")
+    print(f"{'página':<26}{'reruns':>8}{'p50 s':>9}{'p95 s':>9}{'p99 s':>9}")
+    for pagina, medida in [*resultado["paginas"].items(), ("Total", total)]:
+        print(f"{pagina:<26}{medida['reruns']:>8}" + "".join(
+            f"{medida[f'p{p}']:>9.3f}" if medida[f"p{p}"] is not None else f"{'-':>9}" for p in PERCENTILES))
+    memoria = resultado["rss_mb"]
+    print(f"Memoria del servidor: {memoria['inicio']} MB al empezar, {memoria['pico']} MB de pico, "
+          f"{memoria['final']} MB al terminar")
+    for error in resultado["errores"]:
+        print(f"ERROR {error}")
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Prueba de carga con sesiones simultáneas por websocket.")
+    parser.add_argument("--sesiones", type=int, default=10, help="sesiones simultáneas")
+    parser.add_argument("--duracion", type=float, default=30, help="segundos de prueba tras la rampa")
+    parser.add_argument("--interacciones", type=int, default=3, help="controles que cambia cada sesión por página")
+    parser.add_argument("--pausa", type=float, default=0.5, help="espera máxima entre acciones de una sesión (s)")
+    parser.add_argument("--rampa", type=float, default=0.0, help="segundos en los que se van abriendo las sesiones")
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("--sin-calentar", action="store_true", help="medir también las primeras visitas en frío")
+    parser.add_argument("--salida", type=Path, default=Path("carga.json"))
+    parser.add_argument("--referencia", type=Path, help="resultado anterior con el que comparar")
+    parser.add_argument("--umbral", type=float, default=float(os.environ.get("BENCHMARK_UMBRAL", 0.25)),
+                        help="empeoramiento relativo tolerado del p95 (0.25 = 25 %%)")
+    parser.add_argument("--margen", type=float, default=0.05, help="holgura absoluta en segundos")
+    args = parser.parse_args(argumentos)
+
+    resultado = ejecutar_prueba(args.sesiones, args.duracion, args.interacciones, args.pausa, args.semilla,
+                                args.rampa, not args.sin_calentar)
+    args.salida.write_text(json.dumps(resultado, ensure_ascii=False, indent=2), encoding="utf-8")
+    _imprimir(resultado)
+
+    referencia = json.loads(args.referencia.read_text(encoding="utf-8")) if args.referencia else {}
+    problemas = comparar(resultado, referencia, args.umbral, args.margen)
+    for problema in problemas:
+        print(f"FALLO {problema}", file=sys.stderr)
+    return 1 if problemas else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,117 @@
+"""Clasificación de valores en clases de color para los mapas coropléticos.
+
+Las funciones reciben una matriz (mapa, provincia), p. ej. una fila por cada
+periodo y sexo, y resuelven todas las filas a la vez con NumPy; NaN es "sin
+dato". Métodos:
+
+    lineal     intervalos de igual anchura entre el mínimo y el máximo
+    cuantiles  el mismo número de provincias en cada clase
+    jenks      cortes naturales (Fisher-Jenks): minimizan la varianza dentro
+               de cada clase
+
+Con una escala lineal Madrid y Barcelona se quedan solas en el extremo y el
+resto de provincias comparten color; por eso el método por defecto son los
+cuantiles.
+"""
+import warnings
+
+import numpy as np
+
+METODOS = {
+    "cuantiles": "Cuantiles",
+    "jenks": "Cortes naturales (Jenks)",
+    "lineal": "Intervalos iguales",
+}
+METODO_DEFECTO = "cuantiles"
+CLASES = 7
+# viridis en CLASES pasos, la misma escala que usaban los mapas
+PALETA = ["#440154", "#443a82", "#31678d", "#21908c", "#36b778", "#8fd743", "#fde725"]
+SIN_DATO = "#ffffff"
+
+
+def cortes(valores, metodo=METODO_DEFECTO, clases=CLASES):
+    """Límites de las clases de cada fila de `valores`, de forma (filas, clases + 1).
+
+    La clase c abarca [cortes[c], cortes[c + 1]); la última incluye el máximo.
+    Las filas sin ningún dato quedan a NaN.
+    """
+    valores = np.atleast_2d(np.asarray(valores, dtype="float64"))
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)  # filas enteras a NaN
+        if metodo == "lineal":
+            minimo = np.nanmin(valores, axis=1, keepdims=True)
+            maximo = np.nanmax(valores, axis=1, keepdims=True)
+            return minimo + (maximo - minimo) * np.linspace(0, 1, clases + 1)
+        if metodo == "cuantiles":
+            return np.nanquantile(valores, np.linspace(0, 1, clases + 1), axis=1).T
+    if metodo == "jenks":
+        return _jenks(valores, clases)
+    raise ValueError(f"Método de clasificación desconocido '{metodo}'; disponibles: {sorted(METODOS)}")
+
+
+def _jenks(valores, clases):
+    resultado = np.full((len(valores), clases + 1), np.nan)
+    ordenados = np.sort(valores, axis=1)  # los NaN quedan al final
+    validos = np.count_nonzero(~np.isnan(valores), axis=1)
+    # Las filas con el mismo número de datos se resuelven juntas
+    for n in np.unique(validos[validos > 0]):
+        filas = np.flatnonzero(validos == n)
+        limites = _jenks_lote(ordenados[filas, :n], min(clases, n))
+        resultado[filas] = np.pad(limites, ((0, 0), (0, clases + 1 - limites.shape[1])), mode="edge")
+    return resultado
+
+
+def _jenks_lote(x, clases):
+    # x: (filas, n) ordenado y sin NaN. Programación dinámica de Fisher sobre la
+    # matriz de sumas de cuadrados de cada tramo x[i..j], calculada con sumas acumuladas.
+    filas, n = x.shape
+    s1 = np.pad(np.cumsum(x, axis=1), ((0, 0), (1, 0)))
+    s2 = np.pad(np.cumsum(x * x, axis=1), ((0, 0), (1, 0)))
+    i, j = np.triu_indices(n)
+    tramo = np.full((filas, n, n), np.inf)
+    suma = s1[:, j + 1] - s1[:, i]
+    tramo[:, i, j] = s2[:, j + 1] - s2[:, i] - suma * suma / (j - i + 1)
+
+    coste = tramo[:, 0, :]  # mejor partición de x[0..j] en una clase
+    inicios = []
+    for _ in range(1, clases):
+        # x[0..j] en m + 1 clases: la última empieza en i >= 1
+        candidatos = coste[:, :-1, None] + tramo[:, 1:, :]
+        inicio = np.argmin(candidatos, axis=1) + 1
+        coste = np.min(candidatos, axis=1)
+        inicios.append(inicio)
+
+    posiciones = np.zeros((filas, clases), dtype=int)
+    fin = np.full(filas, n - 1)
+    todas = np.arange(filas)
+    for clase in range(clases - 1, 0, -1):
+        posiciones[:, clase] = inicios[clase - 1][todas, fin]
+        fin = posiciones[:, clase] - 1
+    return np.column_stack([np.take_along_axis(x, posiciones, axis=1), x[:, -1]])
+
+
+def clasificar(valores, limites):
+    """Clase (0..clases-1) de cada valor según los `limites` de su fila; -1 si no hay dato."""
+    valores = np.atleast_2d(np.asarray(valores, dtype="float64"))
+    clases = np.sum(valores[..., None] >= limites[:, None, 1:-1], axis=-1)
+    return np.where(np.isnan(valores), -1, clases)
+
+
+def colores(valores, limites, paleta):
+    """Color hexadecimal de cada valor: `paleta[clase]`, o SIN_DATO."""
+    return np.append(np.asarray(paleta), SIN_DATO)[clasificar(valores, limites)]
+
+
+def clasificar_tablas(tablas, codigos, periodos, metodo=METODO_DEFECTO):
+    """Valores, límites y colores de todos los periodos y sexos en una sola pasada.
+
+    `tablas` asocia cada sexo a un DataFrame indexado por código INE con una
+    columna por periodo. Devuelve tres arrays: valores y colores de forma
+    (sexo, periodo, provincia) y límites de forma (sexo, periodo, CLASES + 1).
+    """
+    valores = np.stack([
+        tabla.reindex(index=codigos, columns=periodos).to_numpy(dtype="float64").T for tabla in tablas.values()
+    ])
+    filas = valores.reshape(-1, valores.shape[-1])
+    limites = cortes(filas, metodo)
+    return valores, limites.reshape(*valores.shape[:2], -1), colores(filas, limites, PALETA).reshape(valores.shape)
@@ -0,0 +1,115 @@
+"""Datos de solo lectura compartidos por todas las sesiones.
+
+`st.cache_data` devuelve a cada llamada una copia (deserializada) del valor,
+así que cada sesión y cada rerun pagan su propia copia de las tablas. Lo que
+aquí se comparte se guarda una vez por proceso y se entrega como vistas:
+
+    congelar(valor)   marca como de solo lectura los arrays de NumPy del valor
+                      (las tablas de un solo tipo se reconstruyen sobre un único
+                      bloque de solo lectura)
+    vista(valor)      lo que reciben las páginas: un DataFrame/Series nuevo que
+                      comparte los datos (copia perezosa de pandas: se copian al
+                      modificarlos) con sus propios índices
+    compartido        decorador como `cache_data`, pero sobre `st.cache_resource`,
+                      que congela el resultado y devuelve vistas
+
+Con esto, `tabla.iloc[0, 0] = 0`, `tabla["x"] = ...` o `tabla.columns = ...`
+en una página solo cambian su vista, y escribir en los arrays compartidos
+(`tabla.to_numpy()[0] = 0`, `valores *= 2`) da ValueError. Los índices de
+texto y los MultiIndex permiten cambiar sus valores en el sitio
+(`tabla.columns.values[0] = "x"`), por eso cada vista lleva una copia de ellos;
+los numéricos ya son de solo lectura y se comparten.
+"""
+import functools
+
+import numpy as np
+import pandas as pd
+
+from utils.tiempos import cache_resource
+
+
+def _solo_lectura(array):
+    if array.flags.writeable:
+        array = array if array.base is None and array.flags.owndata else array.copy()
+        array.flags.writeable = False
+    return array
+
+
+def _congelar_tabla(tabla):
+    tipos = set(tabla.dtypes)
+    if len(tipos) != 1 or not isinstance(tipos.pop(), np.dtype) or tabla.shape[1] == 0:
+        # Varios tipos o tipos de pandas (texto, categorías, geometría): se
+        # comparte tal cual y la protección queda en las vistas
+        return tabla
+    valores = _solo_lectura(tabla.to_numpy(copy=True))
+    congelada = tabla._constructor(valores, index=tabla.index, columns=tabla.columns, copy=False)
+    congelada.attrs = tabla.attrs
+    return congelada
+
+
+def congelar(valor):
+    """`valor` con sus arrays de NumPy de solo lectura; recorre tuplas, listas y diccionarios."""
+    if isinstance(valor, np.ndarray):
+        return _solo_lectura(valor)
+    if isinstance(valor, pd.DataFrame):
+        return _congelar_tabla(valor)
+    if isinstance(valor, pd.Series) and isinstance(valor.dtype, np.dtype):
+        return pd.Series(_solo_lectura(valor.to_numpy(copy=True)), index=valor.index, name=valor.name, copy=False)
+    if isinstance(valor, (tuple, list)):
+        return type(valor)(congelar(v) for v in valor)
+    if isinstance(valor, dict):
+        return {clave: congelar(v) for clave, v in valor.items()}
+    return valor
+
+
+def _eje(indice):
+    if not isinstance(indice, pd.MultiIndex):
+        valores = indice.values
+        if isinstance(valores, np.ndarray) and not valores.flags.writeable:
+            return indice
+    # En los índices de texto la copia comparte el array de Arrow, que es inmutable
+    return indice.copy(deep=True)
+
+
+def vista(valor):
+    """Vista de un valor compartido que se puede modificar sin afectar a nadie más."""
+    if isinstance(valor, pd.DataFrame):
+        resultado = valor.copy(deep=False)
+        resultado.index = _eje(valor.index)
+        resultado.columns = _eje(valor.columns)
+        return resultado
+    if isinstance(valor, pd.Series):
+        resultado = valor.copy(deep=False)
+        resultado.index = _eje(valor.index)
+        return resultado
+    if isinstance(valor, np.ndarray):
+        return valor.view()
+    if isinstance(valor, (tuple, list)):
+        return type(valor)(vista(v) for v in valor)
+    if isinstance(valor, dict):
+        return {clave: vista(v) for clave, v in valor.items()}
+    return valor
+
+
+def compartido(funcion=None, **opciones):
+    """Como `utils.tiempos.cache_data`, pero el valor se guarda una vez por proceso.
+
+    El resultado de `funcion` se congela y cada llamada recibe una vista; sirve
+    para tablas, series, arrays y textos (el HTML de un mapa), no para objetos
+    que se modifican al usarlos, como las figuras de plotly.
+    """
+    if funcion is None:
+        return lambda f: compartido(f, **opciones)
+
+    @functools.wraps(funcion)
+    def congelada(*args, **kwargs):
+        return congelar(funcion(*args, **kwargs))
+
+    cacheada = cache_resource(congelada, **opciones)
+
+    @functools.wraps(funcion)
+    def llamar(*args, **kwargs):
+        return vista(cacheada(*args, **kwargs))
+
+    llamar.clear = cacheada.clear
+    return llamar
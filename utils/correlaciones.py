@@ -0,0 +1,110 @@
+"""Correlaciones entre nacimientos, defunciones, migración y población.
+
+Parte del cubo de utils.indicadores, que ya alinea todas las series en el mismo
+eje de años, y calcula a la vez para el total nacional y las 52 provincias:
+
+    matrices     correlación de Pearson entre cada par de VARIABLES
+    retardos     correlación de x(t) con y(t + k) para k entre -RETARDO_MAXIMO
+                 y RETARDO_MAXIMO: con k > 0, x se adelanta k años a y
+    moviles      correlación de cada par en una ventana de `ventana` años que
+                 recorre la serie; se etiqueta con el último año de la ventana
+
+Cada cálculo es una operación de NumPy sobre arrays (provincia, par, año); los
+años sin dato en alguna de las dos series se descartan par a par y con menos de
+MINIMO_OBSERVACIONES años la correlación es NaN. Con las series en niveles
+cualquier par de tendencias sale correlacionado, por eso también se pueden
+correlacionar sus variaciones anuales (TRANSFORMACIONES). La inmigración solo
+existe a nivel nacional (2008 en adelante); en las provincias es NaN.
+
+    resultado = correlaciones("Variaciones anuales")
+    resultado["matrices"].sel(provincia=28).a_pandas()
+    resultado["retardos"].sel(par="Nacimientos – Saldo migratorio").a_pandas()
+"""
+from itertools import combinations
+
+import numpy as np
+import pandas as pd
+
+from utils.compartido import compartido
+from utils.cubo import Cubo
+from utils.indicadores import indicadores, version_indicadores
+
+VARIABLES = ["Nacimientos", "Defunciones", "Inmigrantes", "Saldo migratorio", "Población"]
+PARES = list(combinations(VARIABLES, 2))
+TRANSFORMACIONES = ["Niveles", "Variaciones anuales"]
+RETARDO_MAXIMO = 5
+VENTANA = 10
+MINIMO_OBSERVACIONES = 5
+
+
+def nombre_par(x, y):
+    return f"{x} – {y}"
+
+
+def _correlacion(x, y):
+    # Pearson a lo largo del último eje, con los años en que hay dato de las dos series
+    validos = np.isfinite(x) & np.isfinite(y)
+    n = validos.sum(axis=-1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        dx = np.where(validos, x, 0.0)
+        dx = np.where(validos, dx - (dx.sum(axis=-1) / n)[..., None], 0.0)
+        dy = np.where(validos, y, 0.0)
+        dy = np.where(validos, dy - (dy.sum(axis=-1) / n)[..., None], 0.0)
+        r = (dx * dy).sum(axis=-1) / np.sqrt((dx ** 2).sum(axis=-1) * (dy ** 2).sum(axis=-1))
+    return np.where(n >= MINIMO_OBSERVACIONES, r, np.nan)
+
+
+def series(transformacion="Niveles"):
+    """Array (provincia, variable, año) de las VARIABLES y su eje de años."""
+    tabla = indicadores().sel(indicador=VARIABLES)
+    valores, años = np.moveaxis(tabla.valores, 0, -1), tabla.ejes["año"]
+    if transformacion == "Variaciones anuales":
+        valores, años = np.diff(valores, axis=-1), años[1:]
+    elif transformacion != "Niveles":
+        raise ValueError(f"Transformación desconocida '{transformacion}'; disponibles: {TRANSFORMACIONES}")
+    return valores, años, tabla.ejes["provincia"]
+
+
+def matrices(valores):
+    """(provincia, variable, variable) con la correlación de cada par."""
+    return _correlacion(valores[:, :, None], valores[:, None, :])
+
+
+def correlacion_retardada(x, y, retardo_maximo=RETARDO_MAXIMO):
+    """(..., retardo) con la correlación de x(t) e y(t + k) para k en -retardo_maximo..retardo_maximo."""
+    largo = x.shape[-1]
+    resultado = []
+    for k in range(-retardo_maximo, retardo_maximo + 1):
+        adelante, atras = (x[..., :largo - k], y[..., k:]) if k >= 0 else (x[..., -k:], y[..., :largo + k])
+        resultado.append(_correlacion(adelante, atras))
+    return np.stack(resultado, axis=-1)
+
+
+def correlacion_movil(x, y, ventana=VENTANA):
+    """(..., año final de la ventana) con la correlación en cada ventana de `ventana` años."""
+    ventanas = np.lib.stride_tricks.sliding_window_view
+    return _correlacion(ventanas(x, ventana, axis=-1), ventanas(y, ventana, axis=-1))
+
+
+@compartido(show_spinner=False)
+def _correlaciones(transformacion, ventana, versiones):
+    valores, años, provincias = series(transformacion)
+    variables = pd.Index(VARIABLES)
+    pares = pd.Index([nombre_par(x, y) for x, y in PARES])
+    x = valores[:, [VARIABLES.index(a) for a, _ in PARES]]
+    y = valores[:, [VARIABLES.index(b) for _, b in PARES]]
+    retardos = pd.RangeIndex(-RETARDO_MAXIMO, RETARDO_MAXIMO + 1)
+    return {
+        "matrices": Cubo(matrices(valores), {"provincia": provincias, "variable": variables, "con": variables}),
+        "retardos": Cubo(correlacion_retardada(x, y), {"provincia": provincias, "par": pares, "retardo": retardos}),
+        "moviles": Cubo(correlacion_movil(x, y, ventana),
+                        {"provincia": provincias, "par": pares, "año": años[ventana - 1:]}),
+    }
+
+
+def correlaciones(transformacion="Niveles", ventana=VENTANA):
+    """Diccionario con los cubos `matrices`, `retardos` y `moviles`, compartido entre sesiones y reruns.
+
+    Se recalcula si cambia alguno de los libros de los que salen los indicadores.
+    """
+    return _correlaciones(transformacion, ventana, version_indicadores())
@@ -0,0 +1,380 @@
+"""Cubo demográfico: arrays N-dimensionales con ejes etiquetados.
+
+Cada variable (población, nacimientos, defunciones, inmigración...) se guarda
+como un único `numpy.ndarray` de solo lectura con ejes `periodo`, `provincia`,
+`sexo` y/o `edad`. Las selecciones por etiqueta devuelven vistas del array
+siempre que es posible, y las agregaciones trabajan solo sobre el trozo pedido:
+
+    cubo("poblacion").sel(periodo="2022-01-01", sexo="Mujeres")          # todas las provincias
+    cubo("poblacion_edad").sel(periodo="2022", sexo="Mujeres", edad=slice(65, None)).suma("edad")
+    cubo("nacimientos").sel(provincia=CODIGO_NACIONAL, sexo="Total", periodo=slice("1975", "2023"))
+
+Con `cubo(nombre, mmap=True)` el array se guarda en `datasets/procesados/cubos/`
+y se abre mapeado en memoria. Sin mmap, los cubos construidos se guardan en la
+caché en disco (utils.cache_disco), de modo que un servidor recién arrancado
+no tiene que volver a construirlos mientras no cambien los .xlsx.
+
+Los ejes usan tipos compactos: los años de los recuentos anuales son un
+`PeriodIndex` (un año es un intervalo, no el 1 de enero), las fechas del
+padrón siguen siendo instantes (`DatetimeIndex`), el sexo es categórico y las
+provincias son códigos INE int16.
+"""
+import json
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+from utils.cache_disco import cache_disco
+from utils.datos import cargar_tabla, FLUJO_INMIGRACION, POBLACION_EDAD
+from utils.fechas import fechas_columnas, parsear_fechas
+from utils.ingesta import DIRECTORIO_PROCESADOS, VERSION_INGESTA, ruta_origen, ruta_procesada
+from utils.provincias import CODIGO_NACIONAL
+
+DIRECTORIO_CUBOS = DIRECTORIO_PROCESADOS / "cubos"
+
+SEXOS = pd.CategoricalIndex(
+    ["Total", "Hombres", "Mujeres"], categories=["Total", "Hombres", "Mujeres"], ordered=True, name="sexo"
+)
+
+
+class Cubo:
+    def __init__(self, valores, ejes):
+        valores = np.asarray(valores)
+        ejes = {nombre: pd.Index(indice, name=nombre) for nombre, indice in ejes.items()}
+        if valores.shape != tuple(len(i) for i in ejes.values()):
+            raise ValueError(f"Forma {valores.shape} incompatible con los ejes {list(ejes)}")
+        if valores.flags.writeable and valores.base is None:
+            valores.flags.writeable = False
+        self.valores = valores
+        self.ejes = ejes
+
+    def __setstate__(self, estado):
+        # Al leerlo de la caché en disco el array vuelve a ser escribible
+        estado["valores"].flags.writeable = False
+        self.__dict__.update(estado)
+
+    @property
+    def nombres(self):
+        return tuple(self.ejes)
+
+    @property
+    def shape(self):
+        return self.valores.shape
+
+    def __repr__(self):
+        dims = ", ".join(f"{n}: {len(i)}" for n, i in self.ejes.items())
+        return f"Cubo({dims})"
+
+    def sel(self, **criterios):
+        """Selecciona por etiqueta en cada eje.
+
+        Un valor escalar elimina el eje; un `slice` (por etiquetas, extremos
+        incluidos) o una lista lo conservan. Escalares y rangos devuelven vistas.
+        """
+        desconocidos = set(criterios) - set(self.ejes)
+        if desconocidos:
+            raise KeyError(f"Ejes desconocidos: {sorted(desconocidos)}")
+
+        basico, listas, ejes = [], {}, {}
+        for nombre, indice in self.ejes.items():
+            if nombre not in criterios:
+                basico.append(slice(None))
+                ejes[nombre] = indice
+                continue
+            posicion = _posiciones(indice, criterios[nombre])
+            basico.append(posicion if not isinstance(posicion, np.ndarray) else slice(None))
+            if isinstance(posicion, np.ndarray):
+                listas[nombre] = posicion
+            if not isinstance(posicion, (int, np.integer)):
+                ejes[nombre] = indice[posicion]
+
+        valores = self.valores[tuple(basico)]
+        for nombre, posiciones in listas.items():
+            valores = np.take(valores, posiciones, axis=list(ejes).index(nombre))
+        return Cubo(valores, ejes)
+
+    def _reducir(self, funcion, ejes):
+        ejes = ejes or self.nombres
+        posiciones = tuple(self.nombres.index(e) for e in ejes)
+        restantes = {n: i for n, i in self.ejes.items() if n not in ejes}
+        return Cubo(funcion(self.valores, axis=posiciones), restantes)
+
+    def agrupar(self, eje, ancho):
+        """Suma bloques de `ancho` posiciones consecutivas de `eje` (p. ej. edades en grupos de 5 años).
+
+        Las etiquetas del resultado son las del inicio de cada bloque; los NaN cuentan como 0.
+        """
+        posicion = self.nombres.index(eje)
+        inicios = np.arange(0, len(self.ejes[eje]), ancho)
+        valores = np.add.reduceat(np.nan_to_num(self.valores), inicios, axis=posicion)
+        return Cubo(valores, {**self.ejes, eje: self.ejes[eje][inicios]})
+
+    def suma(self, *ejes):
+        """Suma a lo largo de `ejes` (todos si no se indica ninguno), ignorando NaN."""
+        return self._reducir(np.nansum, ejes)
+
+    def media(self, *ejes):
+        return self._reducir(np.nanmean, ejes)
+
+    def a_pandas(self):
+        """Escalar, Series, DataFrame o Series con MultiIndex según la dimensión."""
+        if self.valores.ndim == 0:
+            return self.valores.item()
+        if self.valores.ndim == 1:
+            return pd.Series(self.valores, index=next(iter(self.ejes.values())))
+        if self.valores.ndim == 2:
+            filas, columnas = self.ejes.values()
+            return pd.DataFrame(self.valores, index=filas, columns=columnas)
+        indice = pd.MultiIndex.from_product(list(self.ejes.values()))
+        return pd.Series(self.valores.reshape(-1), index=indice)
+
+    def guardar(self, ruta):
+        ruta.parent.mkdir(parents=True, exist_ok=True)
+        np.save(ruta.with_suffix(".npy"), np.ascontiguousarray(self.valores))
+        ejes = [_eje_a_json(n, i) for n, i in self.ejes.items()]
+        ruta.with_suffix(".json").write_text(json.dumps(ejes, ensure_ascii=False), encoding="utf-8")
+
+    @classmethod
+    def abrir(cls, ruta, mmap=True):
+        valores = np.load(ruta.with_suffix(".npy"), mmap_mode="r" if mmap else None)
+        ejes = json.loads(ruta.with_suffix(".json").read_text(encoding="utf-8"))
+        return cls(valores, dict(_eje_desde_json(e) for e in ejes))
+
+
+def _posiciones(indice, criterio):
+    if isinstance(criterio, slice):
+        return indice.slice_indexer(criterio.start, criterio.stop, criterio.step)
+    if isinstance(criterio, (list, tuple, np.ndarray, pd.Index)):
+        posiciones = indice.get_indexer(criterio)
+        if (posiciones < 0).any():
+            raise KeyError(f"Etiquetas no encontradas en '{indice.name}': {list(np.asarray(criterio)[posiciones < 0])}")
+        if len(posiciones) and (np.diff(posiciones) == 1).all():
+            return slice(posiciones[0], posiciones[-1] + 1)
+        return posiciones
+    posicion = indice.get_loc(criterio)
+    if isinstance(posicion, np.ndarray):
+        posicion = np.flatnonzero(posicion)
+    return posicion
+
+
+def _eje_a_json(nombre, indice):
+    if isinstance(indice, pd.DatetimeIndex):
+        return {"nombre": nombre, "tipo": "fecha", "valores": indice.strftime("%Y-%m-%d").tolist()}
+    if isinstance(indice, pd.PeriodIndex):
+        return {"nombre": nombre, "tipo": "periodo", "frecuencia": indice.freqstr, "valores": indice.astype(str).tolist()}
+    if isinstance(indice, pd.CategoricalIndex):
+        return {"nombre": nombre, "tipo": "categoria", "valores": [str(v) for v in indice]}
+    if pd.api.types.is_integer_dtype(indice):
+        return {"nombre": nombre, "tipo": "entero", "dtype": str(indice.dtype), "valores": indice.tolist()}
+    return {"nombre": nombre, "tipo": "texto", "valores": indice.tolist()}
+
+
+def _eje_desde_json(eje):
+    valores, nombre = eje["valores"], eje["nombre"]
+    if eje["tipo"] == "fecha":
+        return nombre, pd.DatetimeIndex(pd.to_datetime(valores), name=nombre)
+    if eje["tipo"] == "periodo":
+        return nombre, pd.PeriodIndex(valores, freq=eje["frecuencia"], name=nombre)
+    if eje["tipo"] == "categoria":
+        return nombre, pd.CategoricalIndex(valores, categories=valores, ordered=True, name=nombre)
+    return nombre, pd.Index(valores, dtype=eje.get("dtype"), name=nombre)
+
+
+# --- Construcción desde las tablas procesadas ---
+
+def _densificar(largo, ejes):
+    """Convierte una Serie indexada por (eje1, eje2, ...) en un Cubo completo."""
+    completo = pd.MultiIndex.from_product(list(ejes.values()), names=list(ejes))
+    valores = largo.reindex(completo).to_numpy(dtype="float64")
+    return Cubo(valores.reshape([len(i) for i in ejes.values()]), ejes)
+
+
+def _años(columnas):
+    return pd.PeriodIndex(pd.Index(columnas).astype(str), freq="Y")
+
+
+def _provincias(codigos):
+    return codigos.sort_values().astype("int16")
+
+
+def _edades(etiquetas):
+    # "0 años" -> 0, "85 y más años" -> 85 (grupo abierto), "Total" -> NaN
+    etiquetas = pd.Series(etiquetas, dtype="object").astype(str)
+    edad = pd.to_numeric(etiquetas.str.extract(r"^(\d+)", expand=False), errors="coerce")
+    return edad, etiquetas.str.contains("y más", regex=False)
+
+
+def _con_edad(largo, nivel_edad):
+    """Traduce el nivel de edad a enteros.
+
+    Cada fecha publica edades simples hasta un límite y un grupo abierto
+    "N y más años"; ese grupo ocupa la edad N cuando no hay dato simple para
+    ella, de modo que la suma sobre `edad` reproduce el total publicado.
+    """
+    etiquetas = largo.index.get_level_values(nivel_edad)
+    edad, abierto = _edades(etiquetas)
+    validas = edad.notna().to_numpy()
+    largo = largo[validas]
+    edad, abierto = edad[validas].astype(int).to_numpy(), abierto[validas].to_numpy()
+    niveles = [largo.index.get_level_values(n) if n != nivel_edad else edad for n in largo.index.names]
+    largo = pd.Series(largo.to_numpy(), index=pd.MultiIndex.from_arrays(niveles, names=largo.index.names))
+    simples, abiertos = largo[~abierto], largo[abierto]
+    return simples.combine_first(abiertos)
+
+
+def _provincial(prefijo, periodos):
+    tablas = {"Total": f"{prefijo}Tot", "Hombres": f"{prefijo}Homb", "Mujeres": f"{prefijo}Muj"}
+    partes = []
+    for sexo, nombre in tablas.items():
+        tabla = cargar_tabla(nombre).copy()
+        tabla.columns = periodos(nombre)
+        tabla.loc[CODIGO_NACIONAL] = tabla.sum()
+        partes.append(tabla.stack().rename_axis(["provincia", "periodo"]).to_frame("valor").assign(sexo=sexo))
+    largo = pd.concat(partes).set_index("sexo", append=True)["valor"]
+    largo = largo.reorder_levels(["periodo", "provincia", "sexo"])
+    ejes = {
+        "periodo": largo.index.levels[0].sort_values(),
+        "provincia": _provincias(largo.index.levels[1]),
+        "sexo": SEXOS,
+    }
+    return _densificar(largo, ejes)
+
+
+def _movimiento_natural(nombre):
+    # Nacimientos1975 / Defunciones1975: provincias (incl. total nacional) x (sexo, año)
+    tabla = cargar_tabla(nombre)
+    largo = tabla.stack(["Sexo", "Año"]).rename_axis(["provincia", "sexo", "periodo"])
+    largo.index = largo.index.set_levels(_años(largo.index.levels[2]), level="periodo")
+    largo = largo.reorder_levels(["periodo", "provincia", "sexo"])
+    ejes = {
+        "periodo": largo.index.levels[0].sort_values(),
+        "provincia": _provincias(largo.index.levels[1]),
+        "sexo": SEXOS,
+    }
+    return _densificar(largo, ejes)
+
+
+def _poblacion_edad():
+    tabla = cargar_tabla(POBLACION_EDAD).copy()
+    tabla.columns = fechas_columnas(POBLACION_EDAD)
+    largo = tabla.stack().rename_axis(["edad", "sexo", "periodo"])
+    partes = [largo]
+
+    # Las pirámides de EdadPob* añaden fechas que no están en la serie larga
+    for nombre in ("EdadPob1971-PAños", "EdadPob2024-PAños"):
+        piramide = cargar_tabla(nombre).copy()
+        piramide.columns = piramide.columns.set_levels(
+            parsear_fechas(piramide.columns.levels[0]), level="Fecha"
+        )
+        piramide = piramide.stack(["Fecha", "Sexo"])
+        piramide = pd.concat([piramide, piramide.groupby(level=["Edad", "Fecha"]).sum(min_count=1)
+                              .to_frame().assign(Sexo="Total").set_index("Sexo", append=True)[0]])
+        piramide = piramide.rename_axis(["edad", "periodo", "sexo"]).reorder_levels(["edad", "sexo", "periodo"])
+        nuevas = ~piramide.index.get_level_values("periodo").isin(tabla.columns)
+        partes.append(piramide[nuevas])
+
+    largo = pd.concat(partes)
+    largo = largo.rename(index={"Ambos sexos": "Total"}, level="sexo")
+    largo = _con_edad(largo, "edad").reorder_levels(["periodo", "sexo", "edad"])
+    ejes = {
+        "periodo": largo.index.levels[0].sort_values(),
+        "sexo": SEXOS,
+        "edad": pd.Index(np.arange(largo.index.levels[2].max() + 1)),
+    }
+    return _densificar(largo, ejes)
+
+
+def _inmigracion():
+    tabla = cargar_tabla(FLUJO_INMIGRACION)
+    largo = tabla.stack().rename_axis(["sexo", "edad", "periodo"])
+    largo = largo.rename(index={"Ambos sexos": "Total"}, level="sexo")
+    largo.index = largo.index.set_levels(_años(largo.index.levels[2]), level="periodo")
+    largo = _con_edad(largo, "edad").reorder_levels(["periodo", "sexo", "edad"])
+    ejes = {
+        "periodo": largo.index.levels[0].sort_values(),
+        "sexo": SEXOS,
+        "edad": pd.Index(np.arange(largo.index.levels[2].max() + 1)),
+    }
+    return _densificar(largo, ejes)
+
+
+# Se incrementa cuando cambia la forma de construir los cubos, para invalidar la caché en disco
+VERSION_CUBOS = 2
+
+# Variable -> (constructor, tablas procesadas de las que depende)
+CUBOS = {
+    "poblacion": (lambda: _provincial("Pob", fechas_columnas), ["PobTot", "PobHomb", "PobMuj"]),
+    "nacimientos": (lambda: _movimiento_natural("Nacimientos1975"), ["Nacimientos1975"]),
+    "defunciones": (lambda: _movimiento_natural("Defunciones1975"), ["Defunciones1975"]),
+    "poblacion_edad": (_poblacion_edad, [POBLACION_EDAD, "EdadPob1971-PAños", "EdadPob2024-PAños"]),
+    "inmigracion": (_inmigracion, [FLUJO_INMIGRACION]),
+}
+
+
+@cache_disco(lambda nombre: [ruta_origen(f) for f in CUBOS[nombre][1]], version=(VERSION_INGESTA, VERSION_CUBOS))
+def construir_cubo(nombre):
+    constructor, _ = CUBOS[nombre]
+    return constructor()
+
+
+def _ruta_cubo(nombre):
+    # Con la versión en el nombre, un cambio en la construcción no reutiliza cubos viejos
+    return DIRECTORIO_CUBOS / f"{nombre}-v{VERSION_CUBOS}.npy"
+
+
+def _mtime(ruta):
+    return ruta.stat().st_mtime_ns if ruta.exists() else None
+
+
+def _marca_fuentes(nombre):
+    # Cambia cuando se sustituye un .xlsx o se regenera una tabla de las que depende el cubo
+    _, fuentes = CUBOS[nombre]
+    return tuple((_mtime(ruta_origen(f)), _mtime(ruta_procesada(f))) for f in fuentes)
+
+
+def _cubo_desactualizado(nombre):
+    ruta = _ruta_cubo(nombre)
+    if not ruta.exists():
+        return True
+    _, fuentes = CUBOS[nombre]
+    for fuente in fuentes:
+        cargar_tabla(fuente)
+    return any(ruta_procesada(f).stat().st_mtime_ns > ruta.stat().st_mtime_ns for f in fuentes)
+
+
+def dependientes(tablas):
+    """Cubos construidos a partir de alguna de las `tablas` procesadas."""
+    tablas = set(tablas)
+    return [nombre for nombre, (_, fuentes) in CUBOS.items() if tablas & set(fuentes)]
+
+
+def reconstruir_cubos(tablas):
+    """Vuelve a guardar en disco los cubos que dependen de `tablas`; devuelve sus nombres."""
+    nombres = dependientes(tablas)
+    for nombre in nombres:
+        construir_cubo(nombre).guardar(_ruta_cubo(nombre))
+    return nombres
+
+
+@lru_cache(maxsize=2 * len(CUBOS))
+def _cubo_en_memoria(nombre, _marca):
+    return construir_cubo(nombre)
+
+
+@lru_cache(maxsize=2 * len(CUBOS))
+def _cubo_mapeado(nombre, _marca):
+    if _cubo_desactualizado(nombre):
+        construir_cubo(nombre).guardar(_ruta_cubo(nombre))
+    return Cubo.abrir(_ruta_cubo(nombre), mmap=True)
+
+
+def cubo(nombre, mmap=False):
+    """Cubo de una variable, construido una vez por proceso y compartido.
+
+    Se reconstruye si alguna de sus tablas de origen se ha regenerado desde entonces.
+    """
+    if nombre not in CUBOS:
+        raise KeyError(f"Cubo desconocido '{nombre}'; disponibles: {sorted(CUBOS)}")
+    marca = _marca_fuentes(nombre)
+    return _cubo_mapeado(nombre, marca) if mmap else _cubo_en_memoria(nombre, marca)
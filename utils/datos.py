@@ -0,0 +1,61 @@
+"""Acceso a las tablas del INE ya convertidas a Parquet.
+
+Las páginas usan `cargar_tabla` en lugar de `pd.read_excel`. Si la versión
+Parquet de un libro no existe, se generó a partir de un .xlsx con otro
+contenido o con otra versión de la ingesta, se regenera al vuelo. Se compara
+el contenido y no la fecha, así que copiar o volver a desplegar los mismos
+.xlsx no obliga a reconvertirlos.
+
+Cada tabla se lee una vez por proceso y la comparten todas las sesiones:
+`cargar_tabla` devuelve una vista (ver utils.compartido), que la página puede
+modificar sin tocar la de las demás.
+"""
+from functools import lru_cache
+
+import pandas as pd
+
+from utils.cache_disco import huella
+from utils.compartido import congelar, vista
+from utils.ingesta import (
+    ESQUEMAS,
+    FLUJO_INMIGRACION,
+    POBLACION_EDAD,
+    POBLACION_MUNICIPIOS,
+    VERSION_INGESTA,
+    ingerir,
+    ruta_origen,
+    ruta_procesada,
+)
+
+__all__ = ["cargar_tabla", "FLUJO_INMIGRACION", "POBLACION_EDAD", "POBLACION_MUNICIPIOS"]
+
+
+def _vigente(nombre, tabla):
+    if tabla.attrs.get("version_ingesta") != VERSION_INGESTA:
+        return False
+    origen = ruta_origen(nombre)
+    return not origen.exists() or tabla.attrs.get("huella_origen") == huella(origen)
+
+
+def _mtime(ruta):
+    return ruta.stat().st_mtime_ns if ruta.exists() else None
+
+
+def _marca(nombre):
+    # Cambia cuando se sustituye el .xlsx o se regenera el Parquet
+    return _mtime(ruta_origen(nombre)), _mtime(ruta_procesada(nombre))
+
+
+@lru_cache(maxsize=2 * len(ESQUEMAS))
+def _tabla_compartida(nombre, _marca):
+    if not ruta_procesada(nombre).exists():
+        return congelar(ingerir(nombre))
+    tabla = pd.read_parquet(ruta_procesada(nombre))
+    return congelar(tabla if _vigente(nombre, tabla) else ingerir(nombre))
+
+
+def cargar_tabla(nombre):
+    """Devuelve la tabla limpia de un libro de `datasets/` (p. ej. "PobTot")."""
+    if nombre not in ESQUEMAS:
+        raise KeyError(f"No hay esquema de ingesta para '{nombre}'")
+    return vista(_tabla_compartida(nombre, _marca(nombre)))
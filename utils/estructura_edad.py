@@ -0,0 +1,96 @@
+"""Indicadores de la estructura por edad: edades mediana y media, dependencia y envejecimiento.
+
+`estructura_por_edad(piramides)` recibe un Cubo cuyo último eje es `edad`
+(edades simples con el grupo abierto en su edad inicial, como el cubo
+poblacion_edad) y devuelve otro con los mismos ejes y `indicador` en lugar de
+`edad`. Todas las fechas y sexos, y las provincias si el cubo las trae, se
+calculan en las mismas operaciones de NumPy:
+
+    Edad mediana               interpolada dentro de su edad simple; se busca
+                               con un único searchsorted sobre las sumas
+                               acumuladas de todas las pirámides
+    Edad media                 cada edad en su punto medio y el grupo abierto
+                               EXCESO_GRUPO_ABIERTO años por encima de su inicio
+    Dependencia juvenil        0-14 años por cada 100 de 15-64
+    Dependencia de mayores     65 y más por cada 100 de 15-64
+    Dependencia total          la suma de las dos
+    Índice de envejecimiento   65 y más por cada 100 de 0-14
+    Mayores de 65 (%)          sobre la población total
+
+Los libros solo traen edades a nivel nacional; `indicadores_edad()` los
+calcula para todas las fechas publicadas y se comparte entre sesiones:
+
+    indicadores_edad().sel(sexo="Total", indicador="Edad mediana").a_pandas()
+"""
+import numpy as np
+import pandas as pd
+
+from utils.artefactos import version_tabla
+from utils.compartido import compartido
+from utils.cubo import CUBOS, Cubo, cubo
+
+EDAD_ACTIVA = 15
+EDAD_MAYOR = 65
+# Años que vive de media por encima de su edad inicial el grupo abierto (85 y más, 100 y más)
+EXCESO_GRUPO_ABIERTO = 3.5
+INDICADORES_EDAD = [
+    "Edad mediana", "Edad media", "Dependencia juvenil", "Dependencia de mayores", "Dependencia total",
+    "Índice de envejecimiento", "Mayores de 65 (%)",
+]
+
+
+def _mediana(poblacion, acumulada, edades):
+    # Cada pirámide se desplaza por encima de las anteriores para que todas
+    # formen una única secuencia creciente y baste un searchsorted
+    filas, totales = acumulada.reshape(-1, len(edades)), acumulada[..., -1].reshape(-1)
+    desplazamientos = np.concatenate([[0.0], np.cumsum(totales)[:-1]])
+    mitades = desplazamientos + totales / 2
+    posiciones = np.searchsorted((filas + desplazamientos[:, None]).reshape(-1), mitades)
+    fila = np.arange(len(filas))
+    indice = np.minimum(posiciones - fila * len(edades), len(edades) - 1)
+    anterior = np.where(indice > 0, filas[fila, indice - 1], 0.0)
+    en_edad = poblacion.reshape(-1, len(edades))[fila, indice]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mediana = edades[indice] + (totales / 2 - anterior) / en_edad
+    return np.where(totales > 0, mediana, np.nan).reshape(acumulada.shape[:-1])
+
+
+def estructura_por_edad(piramides):
+    """Cubo con los INDICADORES_EDAD de cada pirámide de `piramides` (último eje `edad`)."""
+    edades = piramides.ejes["edad"].to_numpy()
+    datos = ~np.isnan(piramides.valores)
+    poblacion = np.where(datos, piramides.valores, 0.0)
+    acumulada = np.cumsum(poblacion, axis=-1)
+    total = acumulada[..., -1]
+
+    # Grupo abierto: la última edad con dato de cada pirámide
+    abierto = len(edades) - 1 - np.argmax(datos[..., ::-1], axis=-1)
+    centros = np.where(np.arange(len(edades)) == abierto[..., None],
+                       edades[abierto][..., None] + EXCESO_GRUPO_ABIERTO, edades + 0.5)
+
+    jovenes = poblacion[..., edades < EDAD_ACTIVA].sum(axis=-1)
+    mayores = poblacion[..., edades >= EDAD_MAYOR].sum(axis=-1)
+    activos = total - jovenes - mayores
+    with np.errstate(divide="ignore", invalid="ignore"):
+        valores = np.stack([
+            _mediana(poblacion, acumulada, edades),
+            (poblacion * centros).sum(axis=-1) / total,
+            jovenes / activos * 100,
+            mayores / activos * 100,
+            (jovenes + mayores) / activos * 100,
+            mayores / jovenes * 100,
+            mayores / total * 100,
+        ], axis=-1)
+    valores[total == 0] = np.nan
+    ejes = {nombre: indice for nombre, indice in piramides.ejes.items() if nombre != "edad"}
+    return Cubo(valores, {**ejes, "indicador": pd.Index(INDICADORES_EDAD)})
+
+
+@compartido(show_spinner=False)
+def _indicadores_edad(versiones):
+    return estructura_por_edad(cubo("poblacion_edad"))
+
+
+def indicadores_edad():
+    """`estructura_por_edad` del cubo poblacion_edad (periodo, sexo, indicador), compartido."""
+    return _indicadores_edad(tuple(version_tabla(tabla) for tabla in CUBOS["poblacion_edad"][1]))
@@ -0,0 +1,47 @@
+"""Conversión vectorizada de fechas del INE ("1 de julio de 2015") a fechas de pandas."""
+from functools import lru_cache
+
+import pandas as pd
+
+from utils.datos import cargar_tabla
+from utils.ingesta import ESQUEMAS, ruta_origen, ruta_procesada
+
+MESES = {
+    'enero': 1, 'febrero': 2, 'marzo': 3, 'abril': 4,
+    'mayo': 5, 'junio': 6, 'julio': 7, 'agosto': 8,
+    'septiembre': 9, 'octubre': 10, 'noviembre': 11, 'diciembre': 12
+}
+
+_PATRON = r'^\s*(?P<day>\d{1,2})\s+de\s+(?P<month>[a-z]+)\s+de\s+(?P<year>\d{4})\s*$'
+
+
+def parsear_fechas(textos):
+    """DatetimeIndex a partir de una secuencia de textos "D de <mes> de AAAA".
+
+    Todo se resuelve en una pasada con expresiones regulares y
+    `pd.to_datetime` sobre columnas; lo que no encaje queda como NaT.
+    """
+    partes = pd.Series(textos, dtype="object").astype(str).str.lower().str.extract(_PATRON)
+    partes['month'] = partes['month'].map(MESES)
+    partes = partes.apply(pd.to_numeric, errors='coerce')
+    return pd.DatetimeIndex(pd.to_datetime(partes[['year', 'month', 'day']], errors='coerce'))
+
+
+def texto_fecha(fechas):
+    """Inverso de `parsear_fechas`: "1 de enero de 1971" para cada fecha."""
+    fechas = pd.DatetimeIndex(fechas)
+    nombres = {numero: mes for mes, numero in MESES.items()}
+    return [f"{dia} de {nombres[mes]} de {año}" for dia, mes, año in zip(fechas.day, fechas.month, fechas.year)]
+
+
+@lru_cache(maxsize=2 * len(ESQUEMAS))
+def _fechas_columnas(nombre, _marca):
+    return parsear_fechas(cargar_tabla(nombre).columns)
+
+
+def fechas_columnas(nombre):
+    """Fechas de las columnas de una tabla procesada, calculadas una vez por versión de la tabla."""
+    # La misma marca que utils.datos: cambia al sustituir el .xlsx o regenerar el Parquet
+    marca = tuple(ruta.stat().st_mtime_ns if ruta.exists() else None
+                  for ruta in (ruta_origen(nombre), ruta_procesada(nombre)))
+    return _fechas_columnas(nombre, marca)
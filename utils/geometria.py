@@ -0,0 +1,144 @@
+"""Geometría provincial compartida por todas las páginas y sesiones.
+
+Los límites se guardan en `datasets/provincias.parquet`, un GeoParquet 1.1
+ya en EPSG:4326 que contiene cada provincia simplificada con cada una de las
+TOLERANCIAS (columna `tolerancia`, un grupo de filas por tolerancia, así que
+un lector que filtra por tolerancia solo descomprime su grupo) y la columna
+`bbox` de GeoParquet con la caja de cada geometría. Cada grupo abarca toda
+España, de modo que esas cajas no sirven para descartar grupos por zona; las
+consultas por zona usan el índice espacial en memoria (`geometria_en_caja`).
+Cargarlo es una sola lectura columnar. Se genera a partir del shapefile del
+IGN, que no se distribuye con el repositorio, con
+
+    python -m utils.geometria
+
+y `python -m utils.ingesta` lo regenera cuando el shapefile es más reciente.
+Si no existe se recurre al shapefile, que se lee, reproyecta y simplifica una
+vez; si tampoco está, `geometria_provincias` lanza FileNotFoundError. El
+resultado se comparte entre sesiones y queda en la caché en disco para los
+siguientes arranques del servidor. Las páginas piden la variante ya
+simplificada que necesitan.
+"""
+import math
+
+import streamlit as st
+
+from utils.cache_disco import cache_disco
+from utils.compartido import vista
+from utils.ingesta import DIRECTORIO_DATOS
+from utils.provincias import PROVINCIAS
+
+RUTA_PAQUETE = DIRECTORIO_DATOS / "provincias.parquet"
+RUTA_PROVINCIAS = DIRECTORIO_DATOS / "recintos_provinciales_inspire_peninbal_etrs89.shp"
+FICHEROS_PROVINCIAS = [RUTA_PAQUETE, *(RUTA_PROVINCIAS.with_suffix(s) for s in (".shp", ".shx", ".dbf", ".prj"))]
+
+# Comienzo del error cuando no hay límites (ver utils.benchmark, que lo trata como dato no distribuido)
+FALTAN_LIMITES = "Faltan los límites provinciales"
+
+# Tolerancias de simplificación (grados) precalculadas, de más a menos detalle
+TOLERANCIAS = (0.0005, 0.001, 0.005, 0.01)
+TOLERANCIA_DEFECTO = 0.001
+
+
+def _leer_shapefile():
+    import geopandas as gpd
+
+    provincias = gpd.read_file(RUTA_PROVINCIAS).to_crs("EPSG:4326")
+    # NATCODE = 34 + comunidad (2) + provincia (2) + 00000
+    provincias['codigo'] = provincias['NATCODE'].str[4:6].astype(int)
+    provincias = provincias[provincias['codigo'].isin(PROVINCIAS.index)]
+    return provincias[['codigo', 'geometry']].join(PROVINCIAS, on='codigo').reset_index(drop=True)
+
+
+def _variantes(provincias):
+    return {
+        tolerancia: provincias.assign(geometry=provincias.geometry.simplify(tolerancia, preserve_topology=True))
+        for tolerancia in TOLERANCIAS
+    }
+
+
+def empaquetar(ruta=RUTA_PAQUETE):
+    """Escribe el GeoParquet con todas las variantes simplificadas a partir del shapefile."""
+    import pandas as pd
+
+    provincias = _leer_shapefile()
+    paquete = pd.concat(
+        [variante.assign(tolerancia=tolerancia) for tolerancia, variante in _variantes(provincias).items()],
+        ignore_index=True,
+    )
+    paquete.to_parquet(
+        ruta, index=False, compression="zstd", schema_version="1.1.0", write_covering_bbox=True,
+        row_group_size=len(provincias),
+    )
+    return ruta
+
+
+def hay_limites():
+    """True si está el GeoParquet o el shapefile del que se genera."""
+    return RUTA_PAQUETE.exists() or RUTA_PROVINCIAS.exists()
+
+
+def actualizar_paquete():
+    """Regenera el GeoParquet si el shapefile es más reciente; devuelve su ruta si lo escribió."""
+    if not RUTA_PROVINCIAS.exists():
+        return None
+    if RUTA_PAQUETE.exists() and RUTA_PAQUETE.stat().st_mtime_ns >= RUTA_PROVINCIAS.stat().st_mtime_ns:
+        return None
+    return empaquetar()
+
+
+@st.cache_resource(show_spinner=False)
+@cache_disco(FICHEROS_PROVINCIAS)
+def _geometrias_simplificadas():
+    if not RUTA_PAQUETE.exists():
+        if not RUTA_PROVINCIAS.exists():
+            raise FileNotFoundError(
+                f"{FALTAN_LIMITES}: ni {RUTA_PAQUETE.name} ni {RUTA_PROVINCIAS.name} "
+                f"están en {DIRECTORIO_DATOS}"
+            )
+        return _variantes(_leer_shapefile())
+
+    import geopandas as gpd
+
+    paquete = gpd.read_parquet(RUTA_PAQUETE, columns=['codigo', 'Provincia', 'tolerancia', 'geometry'])
+    return {
+        tolerancia: variante.drop(columns='tolerancia').reset_index(drop=True)
+        for tolerancia, variante in paquete.groupby('tolerancia', sort=True)
+    }
+
+
+def tolerancia_para_zoom(zoom):
+    """Tolerancia precalculada más cercana a medio píxel en el nivel de zoom dado."""
+    medio_pixel = 360 / (256 * 2 ** zoom) / 2
+    return min(TOLERANCIAS, key=lambda t: abs(math.log(t / medio_pixel)))
+
+
+def _variante(tolerancia):
+    geometrias = _geometrias_simplificadas()
+    if tolerancia not in geometrias:
+        tolerancia = min(geometrias, key=lambda t: abs(t - tolerancia))
+    return geometrias[tolerancia]
+
+
+def geometria_provincias(tolerancia=TOLERANCIA_DEFECTO):
+    """GeoDataFrame (codigo, geometry, Provincia) en EPSG:4326 simplificado con `tolerancia`.
+
+    Es una vista del objeto compartido (ver utils.compartido).
+    """
+    return vista(_variante(tolerancia))
+
+
+def geometria_en_caja(caja, tolerancia=TOLERANCIA_DEFECTO):
+    """Provincias cuya geometría corta la caja (oeste, sur, este, norte) en grados.
+
+    Usa el índice espacial (árbol R) de la variante compartida, que se construye
+    la primera vez que se consulta.
+    """
+    from shapely import box
+
+    provincias = _variante(tolerancia)
+    return provincias.iloc[sorted(provincias.sindex.query(box(*caja), predicate='intersects'))]
+
+
+if __name__ == "__main__":
+    print(f"Escrito {empaquetar()}")
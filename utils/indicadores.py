@@ -0,0 +1,100 @@
+"""Indicadores del movimiento natural por provincia y año.
+
+Se calculan de una vez, con operaciones de NumPy sobre los cubos, para el
+total nacional (CODIGO_NACIONAL), las 52 provincias y todos los años que
+tienen nacimientos, defunciones y padrón a 1 de julio:
+
+    Nacimientos, Defunciones   recuentos del año (ambos sexos)
+    Inmigrantes                flujo de inmigración del exterior; solo nacional
+    Población                  a 1 de julio, población media del año y
+                               denominador de las tasas
+    Saldo natural              nacimientos menos defunciones
+    Crecimiento                población a 1 de enero del año siguiente menos
+                               la del año
+    Saldo migratorio           crecimiento menos saldo natural (incluye los
+                               ajustes del padrón)
+    Tasa de ...                los anteriores por 1.000 habitantes
+
+El resultado es un Cubo (año, provincia, indicador) compartido entre sesiones:
+
+    tabla = indicadores()
+    tabla.sel(provincia=28).a_pandas()                                # año x indicador
+    tabla.sel(indicador="Tasa de natalidad", año=pd.Period("2020"))   # todas las provincias
+"""
+import numpy as np
+import pandas as pd
+
+from utils.artefactos import version_tabla
+from utils.compartido import compartido
+from utils.cubo import CUBOS, Cubo, cubo
+from utils.provincias import CODIGO_NACIONAL, PROVINCIAS
+
+POR_MIL = 1000
+RECUENTOS = ["Nacimientos", "Defunciones", "Inmigrantes", "Población", "Saldo natural", "Crecimiento",
+             "Saldo migratorio"]
+# Tasa -> recuento del numerador
+TASAS = {
+    "Tasa de natalidad": "Nacimientos",
+    "Tasa de mortalidad": "Defunciones",
+    "Tasa de inmigración": "Inmigrantes",
+    "Tasa de crecimiento natural": "Saldo natural",
+    "Tasa de crecimiento": "Crecimiento",
+    "Tasa de migración neta": "Saldo migratorio",
+}
+INDICADORES = RECUENTOS + list(TASAS)
+
+_FUENTES = ["poblacion", "nacimientos", "defunciones", "inmigracion"]
+
+
+def _en_fechas(poblacion, fechas):
+    # Filas del cubo de población en `fechas`; NaN donde el padrón no llega
+    posiciones = poblacion.ejes["periodo"].get_indexer(fechas)
+    valores = np.take(poblacion.valores, posiciones, axis=0)
+    return np.where((posiciones >= 0)[:, None], valores, np.nan)
+
+
+def calcular_indicadores():
+    """Cubo (año, provincia, indicador) con los INDICADORES."""
+    codigos = [CODIGO_NACIONAL, *PROVINCIAS.index]
+    nacimientos, defunciones = (cubo(c).sel(provincia=codigos, sexo="Total") for c in ("nacimientos", "defunciones"))
+    poblacion = cubo("poblacion").sel(provincia=codigos, sexo="Total")
+
+    julios = poblacion.ejes["periodo"][poblacion.ejes["periodo"].month == 7]
+    años = nacimientos.ejes["periodo"].intersection(defunciones.ejes["periodo"])
+    años = años[años.year.isin(julios.year)].rename("año")
+
+    inmigracion = cubo("inmigracion").sel(sexo="Total").suma("edad")
+    posiciones = inmigracion.ejes["periodo"].get_indexer(años)
+    inmigrantes = np.full((len(años), len(codigos)), np.nan)
+    inmigrantes[posiciones >= 0, 0] = inmigracion.valores[posiciones[posiciones >= 0]]
+
+    recuentos = {
+        "Nacimientos": nacimientos.sel(periodo=años).valores,
+        "Defunciones": defunciones.sel(periodo=años).valores,
+        "Inmigrantes": inmigrantes,
+        "Población": _en_fechas(poblacion, años.start_time + pd.DateOffset(months=6)),
+        "Crecimiento": _en_fechas(poblacion, (años + 1).start_time) - _en_fechas(poblacion, años.start_time),
+    }
+    recuentos["Saldo natural"] = recuentos["Nacimientos"] - recuentos["Defunciones"]
+    recuentos["Saldo migratorio"] = recuentos["Crecimiento"] - recuentos["Saldo natural"]
+    valores = np.stack([recuentos[r] for r in RECUENTOS], axis=-1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        numeradores = valores[..., [RECUENTOS.index(r) for r in TASAS.values()]]
+        tasas = numeradores / recuentos["Población"][..., None] * POR_MIL
+    return Cubo(np.concatenate([valores, tasas], axis=-1),
+                {"año": años, "provincia": pd.Index(codigos, dtype="int16"), "indicador": pd.Index(INDICADORES)})
+
+
+def version_indicadores():
+    """Versiones de los libros de los que salen los indicadores."""
+    return tuple(version_tabla(tabla) for fuente in _FUENTES for tabla in CUBOS[fuente][1])
+
+
+@compartido(show_spinner=False)
+def _indicadores(versiones):
+    return calcular_indicadores()
+
+
+def indicadores():
+    """`calcular_indicadores()` compartido; se recalcula si cambia alguno de los libros de origen."""
+    return _indicadores(version_indicadores())
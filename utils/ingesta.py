@@ -0,0 +1,369 @@
+"""Conversión de los libros .xlsx del INE a tablas Parquet.
+
+Uso:
+    python -m utils.ingesta                    # convierte todos los libros de datasets/
+    python -m utils.ingesta PobTot NaciTot     # convierte solo los indicados
+    python -m utils.ingesta --actualizar ~/Descargas/NaciTot.xlsx
+    python -m utils.ingesta --actualizar Defunciones1975=~/Descargas/defun.xlsx
+
+Con --actualizar, cada descarga nueva del INE se valida contra el esquema de
+su libro y solo se añaden a la tabla procesada los periodos que aún no tenía;
+la descarga sustituye después al .xlsx de datasets/. En ambos casos los libros
+se leen en paralelo (-j procesos) y al final se reconstruyen solo los cubos
+de utils.cubo que dependen de las tablas modificadas y, si el shapefile de
+provincias es más reciente, el GeoParquet de utils.geometria.
+"""
+import argparse
+import os
+import re
+import shutil
+import threading
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from utils.cache_disco import huella
+from utils.provincias import PROVINCIAS, codigos_provincia
+
+DIRECTORIO_DATOS = Path(__file__).resolve().parent.parent / "datasets"
+DIRECTORIO_PROCESADOS = DIRECTORIO_DATOS / "procesados"
+
+# Se incrementa cuando cambia el formato de las tablas procesadas
+VERSION_INGESTA = 3
+
+FLUJO_INMIGRACION = "Flujo de inmigracion procedente del extranjero por año, sexo y edad2008"
+POBLACION_EDAD = "Poblacion residente por fecha, sexo y edad1971"
+POBLACION_MUNICIPIOS = "PobMunicipios"
+
+# Disposición de cada libro: fila (0-based) donde empieza la cabecera, número de
+# filas de cabecera, nombre(s) de la columna de etiquetas y si las filas vienen
+# agrupadas bajo filas-título sin valores (p. ej. "0 años" -> Ambos sexos/Hombres/Mujeres).
+# Las tablas provinciales se indexan por código INE (ver utils.provincias) y las
+# municipales por el código INE de cinco cifras del municipio ("44001 Ababuj" -> 44001).
+_PROVINCIAL = dict(fila_cabecera=6, filas_cabecera=1, etiquetas=["Provincia"], columnas=["Fecha"], provincial=True)
+
+ESQUEMAS = {
+    "PobTot": _PROVINCIAL,
+    "PobHomb": _PROVINCIAL,
+    "PobMuj": _PROVINCIAL,
+    "NaciTot": dict(_PROVINCIAL, columnas=["Año"]),
+    "NaciHomb": dict(_PROVINCIAL, columnas=["Año"]),
+    "NaciMuj": dict(_PROVINCIAL, columnas=["Año"]),
+    "DefunTot": dict(_PROVINCIAL, columnas=["Año"]),
+    "DefunHomb": dict(_PROVINCIAL, columnas=["Año"]),
+    "DefunMuj": dict(_PROVINCIAL, columnas=["Año"]),
+    "Nacimientos1975": dict(_PROVINCIAL, filas_cabecera=2, columnas=["Sexo", "Año"]),
+    "Defunciones1975": dict(_PROVINCIAL, filas_cabecera=2, columnas=["Sexo", "Año"]),
+    "EdadPob1971-PAños": dict(fila_cabecera=6, filas_cabecera=2, etiquetas=["Edad"], columnas=["Fecha", "Sexo"]),
+    "EdadPob2024-PAños": dict(fila_cabecera=6, filas_cabecera=2, etiquetas=["Edad"], columnas=["Fecha", "Sexo"]),
+    POBLACION_EDAD: dict(fila_cabecera=6, filas_cabecera=1, etiquetas=["Edad", "Sexo"], columnas=["Fecha"], agrupado=True),
+    FLUJO_INMIGRACION: dict(fila_cabecera=6, filas_cabecera=1, etiquetas=["Sexo", "Edad"], columnas=["Año"], agrupado=True),
+    POBLACION_MUNICIPIOS: dict(fila_cabecera=6, filas_cabecera=2, etiquetas=["Municipio"], columnas=["Sexo", "Año"],
+                               municipal=True),
+}
+
+# Libros que la app puede usar pero que no se distribuyen con ella: si faltan se omiten
+OPCIONALES = {POBLACION_MUNICIPIOS}
+
+
+# Valores admitidos en las cabeceras y etiquetas de cada tipo
+_PATRON_AÑO = re.compile(r"^\d{4}$")
+_PATRON_FECHA = re.compile(r"^\d{1,2} de [a-z]+ de \d{4}$", re.IGNORECASE)
+_SEXOS = {"Total", "Ambos sexos", "Hombres", "Mujeres"}
+_PATRON_MUNICIPIO = r"^(\d{5})\s"
+
+
+class EsquemaInvalido(ValueError):
+    """El libro no tiene la disposición que describe su entrada de ESQUEMAS."""
+
+
+def ruta_origen(nombre):
+    return DIRECTORIO_DATOS / f"{nombre}.xlsx"
+
+
+def ruta_procesada(nombre):
+    return DIRECTORIO_PROCESADOS / f"{nombre}.parquet"
+
+
+def libros_disponibles():
+    """Libros de ESQUEMAS salvo los OPCIONALES de los que no hay ni .xlsx ni Parquet."""
+    return [
+        nombre for nombre in ESQUEMAS
+        if nombre not in OPCIONALES or ruta_origen(nombre).exists() or ruta_procesada(nombre).exists()
+    ]
+
+
+def _texto_cabecera(valor):
+    # Los años llegan como 2023 o 2023.0; se guardan siempre como "2023"
+    if pd.isna(valor):
+        return ""
+    if isinstance(valor, (int, float, np.integer, np.floating)):
+        return str(int(valor))
+    return str(valor).strip()
+
+
+def _validar(nombre, esquema, niveles_cabecera, niveles_etiquetas, valores):
+    """Comprueba que lo leído en las filas del esquema tiene la forma esperada."""
+    problemas = []
+    if valores.shape[0] == 0 or valores.shape[1] == 0:
+        problemas.append(f"no hay datos a partir de la fila {esquema['fila_cabecera'] + esquema['filas_cabecera'] + 1}")
+
+    for tipo, textos in zip(esquema["columnas"], niveles_cabecera):
+        textos = pd.Series(textos)
+        if tipo == "Año":
+            malos = textos[~textos.str.match(_PATRON_AÑO)]
+        elif tipo == "Fecha":
+            malos = textos[~textos.str.match(_PATRON_FECHA)]
+        else:
+            malos = textos[~textos.isin(_SEXOS)]
+        if len(malos):
+            problemas.append(f"la cabecera '{tipo}' (fila {esquema['fila_cabecera'] + 1}) contiene {sorted(set(malos))[:3]}")
+
+    columnas = pd.MultiIndex.from_arrays(niveles_cabecera) if len(niveles_cabecera) > 1 else pd.Index(niveles_cabecera[0])
+    if columnas.has_duplicates:
+        problemas.append(f"periodos repetidos en la cabecera: {list(columnas[columnas.duplicated()])[:3]}")
+
+    for tipo, etiquetas in zip(esquema["etiquetas"], niveles_etiquetas):
+        if tipo == "Sexo" and not set(etiquetas) <= _SEXOS:
+            problemas.append(f"etiquetas de sexo desconocidas: {sorted(set(etiquetas) - _SEXOS)[:3]}")
+        if tipo == "Provincia":
+            faltan = set(PROVINCIAS.index) - set(codigos_provincia(etiquetas).dropna())
+            if faltan:
+                problemas.append(f"faltan provincias: {PROVINCIAS.loc[sorted(faltan), 'Provincia'].tolist()[:5]}")
+        if tipo == "Municipio" and not pd.Series(etiquetas, dtype="object").astype(str).str.match(_PATRON_MUNICIPIO).any():
+            problemas.append(f"ninguna etiqueta empieza por un código de municipio: {list(etiquetas)[:3]}")
+
+    if problemas:
+        raise EsquemaInvalido(f"{nombre}: " + "; ".join(problemas))
+
+
+def leer_libro(nombre, ruta=None):
+    """Lee un libro del INE y devuelve la tabla limpia (etiquetas en el índice, valores float).
+
+    `ruta` permite leer una descarga que aún no está en datasets/. Lanza
+    `EsquemaInvalido` si la disposición no coincide con ESQUEMAS[nombre].
+    """
+    esquema = ESQUEMAS[nombre]
+    raw = pd.read_excel(ruta or ruta_origen(nombre), sheet_name=0, header=None, dtype=object)
+    raw = raw.map(lambda x: np.nan if isinstance(x, str) and not x.strip() else x)
+
+    inicio = esquema["fila_cabecera"]
+    n_cab = esquema["filas_cabecera"]
+    cabecera = raw.iloc[inicio:inicio + n_cab, 1:].ffill(axis=1)
+
+    cuerpo = raw.iloc[inicio + n_cab:]
+    # La tabla termina en la primera fila sin etiqueta (después vienen notas y fuente)
+    fin = cuerpo[0].isna().to_numpy().argmax() if cuerpo[0].isna().any() else len(cuerpo)
+    cuerpo = cuerpo.iloc[:fin]
+
+    etiquetas = cuerpo[0].astype(str).str.strip()
+    valores = cuerpo.iloc[:, 1:].apply(pd.to_numeric, errors="coerce").astype("float64")
+
+    if esquema.get("agrupado"):
+        es_grupo = valores.isna().all(axis=1).to_numpy()
+        grupo = etiquetas.where(es_grupo).ffill()
+        indice = pd.MultiIndex.from_arrays(
+            [grupo[~es_grupo].to_numpy(), etiquetas[~es_grupo].to_numpy()],
+            names=esquema["etiquetas"],
+        )
+        valores = valores[~es_grupo]
+    else:
+        indice = pd.Index(etiquetas.to_numpy(), name=esquema["etiquetas"][0])
+
+    niveles = [[_texto_cabecera(v) for v in fila] for _, fila in cabecera.iterrows()]
+    _validar(nombre, esquema, niveles, [indice.get_level_values(i) for i in range(indice.nlevels)], valores)
+    if n_cab == 1:
+        columnas = pd.Index(niveles[0], name=esquema["columnas"][0])
+    else:
+        columnas = pd.MultiIndex.from_arrays(niveles, names=esquema["columnas"])
+
+    tabla = pd.DataFrame(valores.to_numpy(), index=indice, columns=columnas)
+    if esquema.get("provincial"):
+        tabla = _indexar_por_codigo(nombre, tabla)
+    if esquema.get("municipal"):
+        tabla = _indexar_por_municipio(nombre, tabla)
+    return tabla
+
+
+def _indexar_por_codigo(nombre, tabla):
+    codigos = codigos_provincia(tabla.index)
+    desconocidas = tabla.index[codigos.isna().to_numpy()]
+    if len(desconocidas):
+        warnings.warn(f"{nombre}: filas sin provincia reconocida, se descartan: {list(desconocidas)}")
+    tabla = tabla[codigos.notna().to_numpy()]
+    tabla.index = pd.Index(codigos.dropna().astype(int).to_numpy(), name="codigo")
+    return tabla
+
+
+def _indexar_por_municipio(nombre, tabla):
+    # Las filas de totales (nacional, provinciales) no llevan código de cinco cifras
+    codigos = tabla.index.to_series().astype(str).str.strip().str.extract(_PATRON_MUNICIPIO, expand=False)
+    otras = tabla.index[codigos.isna().to_numpy()]
+    if len(otras):
+        warnings.warn(f"{nombre}: {len(otras)} filas sin código de municipio, se descartan: {list(otras)[:5]}")
+    tabla = tabla[codigos.notna().to_numpy()]
+    tabla.index = pd.Index(codigos.dropna().astype(int).to_numpy(), name="codigo")
+    return tabla
+
+
+def _tipo_valores(valores):
+    # El tipo más pequeño que guarda exactamente todos los valores
+    if not np.isnan(valores).any() and np.array_equal(valores, np.round(valores)):
+        if valores.size == 0 or (valores.min() >= np.iinfo("int32").min and valores.max() <= np.iinfo("int32").max):
+            return "int32"
+        return "int64"
+    if np.array_equal(valores.astype("float32").astype("float64"), valores, equal_nan=True):
+        return "float32"
+    return "float64"
+
+
+def _tipo_codigo(codigos):
+    return "int16" if codigos.max() <= np.iinfo("int16").max else "int32"
+
+
+def compactar(tabla):
+    """La misma tabla con los tipos más pequeños que no pierden información.
+
+    Los recuentos sin huecos pasan a int32 (no a int8/int16, para que restar o
+    sumar dos tablas no desborde), los valores con decimales a float32 solo si
+    caben sin redondeo y los códigos INE del índice a int16/int32. Las
+    etiquetas de texto con varios niveles ya se guardan codificadas en el
+    MultiIndex, y las columnas siguen siendo textos porque Parquet no admite
+    otra cosa como nombre de columna.
+    """
+    tabla = tabla.astype(_tipo_valores(tabla.to_numpy(dtype="float64")))
+    if tabla.index.nlevels == 1 and pd.api.types.is_integer_dtype(tabla.index) and len(tabla.index):
+        tabla.index = tabla.index.astype(_tipo_codigo(tabla.index))
+    return tabla
+
+
+def _guardar(nombre, tabla):
+    tabla = compactar(tabla)
+    tabla.attrs["version_ingesta"] = VERSION_INGESTA
+    # Contenido del .xlsx del que sale la tabla; utils.datos lo compara para saber si sigue vigente
+    tabla.attrs["huella_origen"] = huella(ruta_origen(nombre))
+    DIRECTORIO_PROCESADOS.mkdir(parents=True, exist_ok=True)
+    # Se escribe aparte y se renombra: la precarga y las sesiones pueden leerla a la vez
+    temporal = ruta_procesada(nombre).with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+    tabla.to_parquet(temporal)
+    os.replace(temporal, ruta_procesada(nombre))
+    return tabla
+
+
+def ingerir(nombre):
+    """Convierte un libro a Parquet y devuelve la tabla resultante."""
+    return _guardar(nombre, leer_libro(nombre))
+
+
+def _forma_ingerida(nombre):
+    # Se ejecuta en los procesos hijos: devuelve solo la forma para no serializar la tabla
+    return ingerir(nombre).shape
+
+
+def ingerir_todo(nombres=None, procesos=None):
+    nombres = list(nombres or libros_disponibles())
+    with ProcessPoolExecutor(max_workers=procesos) as ejecutor:
+        for nombre, (filas, columnas) in zip(nombres, ejecutor.map(_forma_ingerida, nombres)):
+            print(f"{nombre}: {filas} filas x {columnas} columnas -> {ruta_procesada(nombre).name}")
+    return nombres
+
+
+def _tabla_procesada(nombre):
+    ruta = ruta_procesada(nombre)
+    if not ruta.exists():
+        return None
+    tabla = pd.read_parquet(ruta)
+    return tabla if tabla.attrs.get("version_ingesta") == VERSION_INGESTA else None
+
+
+def añadir_periodos(actual, nueva):
+    """`actual` más las columnas (periodos) de `nueva` que no tenía, en el orden de `nueva`.
+
+    Los periodos ya presentes conservan los valores de `actual`; las filas nuevas
+    se añaden al final.
+    """
+    nuevas = nueva.columns.difference(actual.columns, sort=False)
+    filas = actual.index.append(nueva.index.difference(actual.index, sort=False))
+    combinada = pd.concat([actual.reindex(filas), nueva[nuevas].reindex(filas)], axis=1)
+    orden = list(nueva.columns) + [c for c in actual.columns if c not in set(nueva.columns)]
+    return combinada[orden]
+
+
+def actualizar(nombre, nueva, ruta_descarga):
+    """Incorpora a la tabla procesada `nombre` los periodos nuevos de `nueva`.
+
+    `nueva` es la descarga ya leída y validada con `leer_libro`; tras guardar la
+    tabla, la descarga pasa a ser el .xlsx de datasets/. Devuelve los periodos añadidos.
+    """
+    actual = _tabla_procesada(nombre)
+    if actual is None and ruta_origen(nombre).exists():
+        actual = leer_libro(nombre)
+    añadidos = list(nueva.columns if actual is None else nueva.columns.difference(actual.columns, sort=False))
+    tabla = nueva if actual is None else añadir_periodos(actual, nueva)
+
+    # Primero el .xlsx y luego el Parquet, que guarda la huella del .xlsx ya copiado
+    ruta_descarga = Path(ruta_descarga)
+    if ruta_descarga.resolve() != ruta_origen(nombre).resolve():
+        shutil.copyfile(ruta_descarga, ruta_origen(nombre))
+    _guardar(nombre, tabla)
+    return añadidos
+
+
+def _nombre_y_ruta(argumento):
+    # "NaciTot=~/Descargas/x.xlsx" o directamente "~/Descargas/NaciTot.xlsx"
+    nombre, _, ruta = argumento.rpartition("=")
+    ruta = Path(ruta).expanduser()
+    nombre = nombre or ruta.stem
+    if nombre not in ESQUEMAS:
+        raise SystemExit(f"'{nombre}' no es un libro conocido; usa NOMBRE=ruta con uno de: {', '.join(ESQUEMAS)}")
+    return nombre, ruta
+
+
+def actualizar_todo(descargas, procesos=None):
+    pares = [_nombre_y_ruta(d) for d in descargas]
+    with ProcessPoolExecutor(max_workers=procesos) as ejecutor:
+        leidas = list(ejecutor.map(leer_libro, *zip(*pares)))
+    for (nombre, ruta), nueva in zip(pares, leidas):
+        añadidos = actualizar(nombre, nueva, ruta)
+        print(f"{nombre}: {len(añadidos)} periodos nuevos {[str(p) for p in añadidos][:5]}")
+    return [nombre for nombre, _ in pares]
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Convierte los libros del INE a Parquet.")
+    parser.add_argument("nombres", nargs="*", help="libros a convertir (por defecto, todos)")
+    parser.add_argument("--actualizar", nargs="+", metavar="[NOMBRE=]RUTA",
+                        help="descargas nuevas del INE de las que añadir solo los periodos nuevos")
+    parser.add_argument("-j", "--procesos", type=int, help="procesos en paralelo (por defecto, uno por CPU)")
+    args = parser.parse_args(argumentos)
+    desconocidos = [nombre for nombre in args.nombres if nombre not in ESQUEMAS]
+    if desconocidos:
+        raise SystemExit(f"Libros desconocidos: {', '.join(desconocidos)}; disponibles: {', '.join(ESQUEMAS)}")
+
+    try:
+        if args.actualizar:
+            modificadas = actualizar_todo(args.actualizar, args.procesos)
+        else:
+            modificadas = ingerir_todo(args.nombres, args.procesos)
+    except EsquemaInvalido as e:
+        raise SystemExit(f"Disposición inesperada en {e}")
+    except FileNotFoundError as e:
+        # También llega así desde los procesos que leen los libros
+        raise SystemExit(f"No existe el fichero {e.filename or e}")
+
+    from utils.cubo import reconstruir_cubos
+    from utils.geometria import RUTA_PAQUETE, actualizar_paquete
+
+    for nombre in reconstruir_cubos(modificadas):
+        print(f"cubo '{nombre}' reconstruido")
+    if actualizar_paquete():
+        print(f"límites provinciales empaquetados en {RUTA_PAQUETE.name}")
+    elif not RUTA_PAQUETE.exists():
+        print(f"aviso: sin {RUTA_PAQUETE.name} ni el shapefile de provincias; los mapas no se podrán dibujar")
+
+
+if __name__ == "__main__":
+    main()
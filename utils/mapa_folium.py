@@ -0,0 +1,201 @@
+"""Construcción con folium del mapa coroplético temporal (ver utils.mapas).
+
+Se importa solo cuando hay que generar un mapa nuevo: folium y branca no se
+cargan mientras el HTML esté en la caché.
+"""
+import json
+
+import folium
+import numpy as np
+from branca.colormap import StepColormap
+from branca.element import MacroElement, Template
+
+from utils.clasificacion import METODO_DEFECTO, PALETA, clasificar_tablas
+
+
+class ControlTemporal(MacroElement):
+    _template = Template("""
+        {% macro script(this, kwargs) %}
+        (function() {
+            var mapa = {{ this._parent.get_name() }};
+            var capa = {{ this.capa.get_name() }};
+            var datos = {{ this.datos }};
+            var estado = {sexo: datos.sexos[0], periodo: datos.periodos.length - 1, animacion: null};
+            var etiqueta;
+
+            function estilo(color) {
+                return {fillColor: color, color: "black", weight: 1, dashArray: "5, 5", fillOpacity: 0.7};
+            }
+
+            function formato(v) {
+                return v === null || isNaN(v) ? "Sin datos" : Math.round(v).toLocaleString("es-ES");
+            }
+
+            var leyenda = L.control({position: "bottomleft"});
+            leyenda.onAdd = function() {
+                this._div = L.DomUtil.create("div", "leyenda-temporal");
+                this._div.style.cssText = "background:white;padding:6px 8px;font:12px sans-serif;border-radius:4px";
+                return this._div;
+            };
+            leyenda.addTo(mapa);
+
+            function pintar() {
+                // Los colores vienen calculados en cada provincia: aquí solo se eligen
+                capa.setStyle(function(f) {
+                    return estilo(f.properties.colores[estado.sexo][estado.periodo]);
+                });
+                etiqueta.textContent = datos.periodos[estado.periodo];
+                var limites = datos.limites[estado.sexo][estado.periodo];
+                var filas = datos.paleta.map(function(c, k) {
+                    return "<i style='display:inline-block;width:14px;height:10px;background:" + c + "'></i> "
+                        + formato(limites[k]) + " – " + formato(limites[k + 1]);
+                });
+                leyenda._div.innerHTML = "<b>" + datos.titulo + " de " + estado.sexo.toLowerCase() + " en "
+                    + datos.periodos[estado.periodo] + "</b><br>" + filas.join("<br>");
+            }
+
+            capa.eachLayer(function(l) {
+                l.bindTooltip(function() {
+                    var v = datos.series[estado.sexo][estado.periodo][l.feature.properties.i];
+                    return "<b>" + l.feature.properties.Provincia + "</b><br>" + datos.titulo + ": " + formato(v);
+                }, {sticky: true});
+            });
+
+            var control = L.control({position: "topright"});
+            control.onAdd = function() {
+                var div = L.DomUtil.create("div");
+                div.style.cssText = "background:white;padding:6px 8px;font:13px sans-serif;border-radius:4px";
+                L.DomEvent.disableClickPropagation(div);
+                L.DomEvent.disableScrollPropagation(div);
+                var sexo = L.DomUtil.create("select", "", div);
+                datos.sexos.forEach(function(s) { sexo.add(new Option(s, s)); });
+                sexo.onchange = function() { estado.sexo = sexo.value; pintar(); };
+                L.DomUtil.create("br", "", div);
+                var deslizador = L.DomUtil.create("input", "", div);
+                deslizador.type = "range";
+                deslizador.min = 0;
+                deslizador.max = datos.periodos.length - 1;
+                deslizador.value = estado.periodo;
+                deslizador.style.width = "220px";
+                deslizador.oninput = function() { estado.periodo = +deslizador.value; pintar(); };
+                var boton = L.DomUtil.create("button", "", div);
+                boton.textContent = "▶";
+                boton.onclick = function() {
+                    if (estado.animacion) {
+                        clearInterval(estado.animacion);
+                        estado.animacion = null;
+                        boton.textContent = "▶";
+                        return;
+                    }
+                    boton.textContent = "❚❚";
+                    estado.animacion = setInterval(function() {
+                        estado.periodo = (estado.periodo + 1) % datos.periodos.length;
+                        deslizador.value = estado.periodo;
+                        pintar();
+                    }, 700);
+                };
+                L.DomUtil.create("br", "", div);
+                etiqueta = L.DomUtil.create("span", "", div);
+                return div;
+            };
+            control.addTo(mapa);
+            pintar();
+        })();
+        {% endmacro %}
+    """)
+
+    def __init__(self, capa, datos):
+        super().__init__()
+        self._name = "ControlTemporal"
+        self.capa = capa
+        self.datos = json.dumps(datos, ensure_ascii=False)
+
+
+class ColoresPrecalculados(MacroElement):
+    """Pinta cada provincia con el color guardado en su propiedad `color`."""
+
+    _template = Template("""
+        {% macro script(this, kwargs) %}
+        {{ this.capa.get_name() }}.setStyle(function(f) {
+            return {fillColor: f.properties.color, color: "black", weight: 1, dashArray: "5, 5", fillOpacity: 0.7};
+        });
+        {% endmacro %}
+    """)
+
+    def __init__(self, capa):
+        super().__init__()
+        self._name = "ColoresPrecalculados"
+        self.capa = capa
+
+
+def _nulos(matriz):
+    # NaN -> None para serializar a JSON
+    return np.where(np.isnan(matriz), None, np.round(matriz, 0)).tolist()
+
+
+def construir_mapa_temporal(gdf, tablas, periodos, titulo, metodo=METODO_DEFECTO):
+    """HTML de un mapa folium con deslizador de periodos y selector de sexo.
+
+    `gdf` tiene columnas codigo, Provincia y geometry; `tablas` asocia cada sexo
+    ("Total", "Hombres", "Mujeres") a un DataFrame indexado por código INE con
+    una columna por periodo; `periodos` fija el orden cronológico del deslizador.
+    Las clases y colores de todos los periodos y sexos se calculan aquí de una
+    vez (ver utils.clasificacion) y viajan como propiedades de cada provincia.
+    """
+    geo = gdf[['codigo', 'Provincia', 'geometry']].reset_index(drop=True)
+    geo['i'] = np.arange(len(geo))
+    codigos = geo['codigo'].tolist()
+    periodos = list(periodos)
+    sexos = list(tablas)
+
+    valores, limites, colores = clasificar_tablas(tablas, codigos, periodos, metodo)
+    # colores[provincia] = {sexo: [color de cada periodo]}
+    geo['colores'] = [
+        dict(zip(sexos, provincia.tolist())) for provincia in colores.transpose(2, 0, 1)
+    ]
+    datos = {
+        "titulo": titulo,
+        "periodos": periodos,
+        "sexos": sexos,
+        "paleta": PALETA,
+        "limites": dict(zip(sexos, _nulos(limites))),
+        "series": dict(zip(sexos, _nulos(valores))),
+    }
+
+    m = folium.Map(zoom_start=6)
+    bounds = geo.total_bounds
+    m.fit_bounds([[bounds[1], bounds[0]], [bounds[3], bounds[2]]])
+
+    capa = folium.GeoJson(geo.to_json())
+    capa.add_to(m)
+    ControlTemporal(capa, datos).add_to(m)
+    return m.get_root().render()
+
+
+def construir_mapa_periodo(gdf, periodo, leyenda, alias, colores, limites):
+    """HTML del mapa de un solo periodo.
+
+    `gdf` es la geometría ya unida a los datos (ver utils.provincias.unir_datos)
+    y `periodo` la columna que se muestra; `colores` trae el color de cada fila
+    de `gdf` y `limites` los de sus clases, ya calculados con utils.clasificacion.
+    """
+    geo = gdf.assign(color=colores)
+    m = folium.Map(zoom_start=6)
+    bounds = geo.total_bounds
+    m.fit_bounds([[bounds[1], bounds[0]], [bounds[3], bounds[2]]])
+
+    capa = folium.GeoJson(
+        geo.to_json(),
+        tooltip=folium.GeoJsonTooltip(
+            fields=["Provincia", periodo],
+            aliases=["Provincia:", alias],
+            localize=True
+        )
+    )
+    capa.add_to(m)
+    ColoresPrecalculados(capa).add_to(m)
+
+    escala = StepColormap(PALETA, index=list(limites), vmin=limites[0], vmax=limites[-1], caption=leyenda)
+    escala.options = {"position": "bottomleft"}
+    escala.add_to(m)
+    return m.get_root().render()
@@ -0,0 +1,129 @@
+"""Mapa coroplético sobre teselas vectoriales (ver utils.municipios).
+
+Lo dibuja MapLibre GL en el navegador a partir del fichero PMTiles, que pide
+por rangos solo las teselas a la vista; folium no sabe pintar teselas
+vectoriales con colores propios, por eso este mapa no lo usa. Los colores y
+valores llegan en diccionarios por código INE y la expresión de relleno los
+busca con la propiedad `codigo` de cada municipio.
+
+Todo se sirve desde `static/` (app/static/ con `server.enableStaticServing`),
+sin pedir nada fuera de la app: MapLibre GL 5.3.0 tal cual se publica y
+`pmtiles.js`, un lector mínimo del formato para el protocolo `pmtiles://`. No
+hay mapa base de teselas externas; debajo de los municipios solo hay un fondo
+liso.
+"""
+import json
+
+import numpy as np
+from branca.element import Template
+
+from utils.clasificacion import PALETA, SIN_DATO
+
+# Rutas relativas a la app, como la de las teselas (utils.municipios)
+MAPLIBRE = "app/static"
+PMTILES = "app/static/pmtiles.js"
+FONDO = "#f2efe9"
+
+_PLANTILLA = Template("""<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<link rel="stylesheet" href="{{ maplibre }}/maplibre-gl.css">
+<script src="{{ maplibre }}/maplibre-gl.js"></script>
+<script src="{{ pmtiles }}"></script>
+<style>
+    html, body, #mapa { margin: 0; height: 100%; }
+    #leyenda { position: absolute; left: 10px; bottom: 30px; background: white; padding: 6px 8px;
+               font: 12px sans-serif; border-radius: 4px; }
+</style>
+</head>
+<body>
+<div id="mapa"></div>
+<div id="leyenda"></div>
+<script>
+(function() {
+    var datos = {{ datos }};
+
+    function formato(v) {
+        return v === undefined || v === null ? "Sin datos" : Math.round(v).toLocaleString("es-ES");
+    }
+
+    var protocolo = new pmtiles.Protocol();
+    maplibregl.addProtocol("pmtiles", protocolo.tile);
+    // El mapa va en un iframe srcdoc: la ruta se resuelve contra la URL de la app
+    var url = new URL(datos.url, document.baseURI).href;
+
+    var mapa = new maplibregl.Map({
+        container: "mapa",
+        bounds: datos.limites_mapa,
+        style: {
+            version: 8,
+            sources: {
+                municipios: {type: "vector", url: "pmtiles://" + url}
+            },
+            layers: [
+                {id: "fondo", type: "background", paint: {"background-color": datos.fondo}},
+                {
+                    id: "municipios", type: "fill", source: "municipios", "source-layer": datos.capa,
+                    paint: {
+                        // color del municipio en datos.colores o, si no tiene, el de "sin dato"
+                        "fill-color": ["coalesce",
+                            ["get", ["to-string", ["get", "codigo"]], ["literal", datos.colores]], datos.sin_dato],
+                        "fill-opacity": 0.75,
+                        "fill-outline-color": "#555555"
+                    }
+                }
+            ]
+        }
+    });
+    mapa.addControl(new maplibregl.NavigationControl({showCompass: false}), "top-right");
+
+    var ventana = new maplibregl.Popup({closeButton: false, closeOnClick: false});
+    mapa.on("mousemove", "municipios", function(e) {
+        var p = e.features[0].properties;
+        mapa.getCanvas().style.cursor = "pointer";
+        ventana.setLngLat(e.lngLat)
+            .setHTML("<b>" + p.Municipio + "</b><br>" + datos.titulo + ": " + formato(datos.valores[p.codigo]))
+            .addTo(mapa);
+    });
+    mapa.on("mouseleave", "municipios", function() {
+        mapa.getCanvas().style.cursor = "";
+        ventana.remove();
+    });
+
+    var filas = datos.paleta.map(function(c, k) {
+        return "<i style='display:inline-block;width:14px;height:10px;background:" + c + "'></i> "
+            + formato(datos.limites[k]) + " – " + formato(datos.limites[k + 1]);
+    });
+    document.getElementById("leyenda").innerHTML = "<b>" + datos.leyenda + "</b><br>" + filas.join("<br>");
+})();
+</script>
+</body>
+</html>
+""")
+
+
+def construir_mapa_teselas(url, capa, limites_mapa, codigos, valores, colores, limites, titulo, leyenda):
+    """HTML del mapa de un periodo sobre las teselas de `url` (ruta relativa a la app).
+
+    `codigos`, `valores` y `colores` van alineados, uno por municipio, y
+    `limites` son los de las clases ya calculados con utils.clasificacion;
+    `limites_mapa` es la caja (oeste, sur, este, norte) que se encuadra al abrir.
+    """
+    valores = np.asarray(valores, dtype="float64")
+    con_dato = ~np.isnan(valores)
+    codigos = [str(c) for c in np.asarray(codigos)[con_dato]]
+    datos = {
+        "url": url,
+        "capa": capa,
+        "limites_mapa": [list(limites_mapa[:2]), list(limites_mapa[2:])],
+        "titulo": titulo,
+        "leyenda": leyenda,
+        "paleta": PALETA,
+        "sin_dato": SIN_DATO,
+        "fondo": FONDO,
+        "limites": np.where(np.isnan(limites), None, np.round(limites, 0)).tolist(),
+        "colores": dict(zip(codigos, np.asarray(colores)[con_dato].tolist())),
+        "valores": dict(zip(codigos, np.round(valores[con_dato], 0).tolist())),
+    }
+    return _PLANTILLA.render(maplibre=MAPLIBRE, pmtiles=PMTILES, datos=json.dumps(datos, ensure_ascii=False))
@@ -0,0 +1,86 @@
+"""Mapas coropléticos que cambian de fecha y sexo en el navegador.
+
+`mapa_temporal` envía la geometría una sola vez junto con los colores ya
+calculados de cada provincia en cada periodo y sexo (ver utils.clasificacion);
+el navegador solo elige cuál mostrar, así que mover el deslizador no provoca
+ninguna ejecución en Streamlit.
+El HTML generado se guarda además en la caché en disco, así que tras reiniciar
+el servidor no hace falta cargar la geometría ni folium para servirlo.
+
+`mapa_periodo` es el mapa de un solo periodo y sexo, coloreado en el servidor
+con las clases de la página calculadas de una vez para todos los periodos y
+sexos; se guarda en la caché de artefactos compartida por todas las sesiones.
+"""
+from functools import lru_cache
+
+from utils.artefactos import MAPAS, version_tabla
+from utils.cache_disco import cache_disco
+from utils.clasificacion import METODO_DEFECTO
+from utils.compartido import compartido
+from utils.geometria import FICHEROS_PROVINCIAS, TOLERANCIA_DEFECTO, geometria_provincias
+
+SEXOS = ("Total", "Hombres", "Mujeres")
+
+# Mapas temporales de las páginas: título -> libros con el total, los hombres y las mujeres
+MAPAS_PAGINAS = {
+    "Población": ("PobTot", "PobHomb", "PobMuj"),
+    "Natalidad": ("NaciTot", "NaciHomb", "NaciMuj"),
+    "Defunciones": ("DefunTot", "DefunHomb", "DefunMuj"),
+}
+
+
+def periodos_mapa(tabla):
+    """Columnas de valores de `tabla` como textos, de la más antigua a la más reciente."""
+    from utils.fechas import parsear_fechas
+
+    columnas = [str(c) for c in tabla.select_dtypes(include='number').columns]
+    fechas = parsear_fechas(columnas)
+    if fechas.isna().all():  # años sueltos: "1975", "1976"...
+        return sorted(columnas)
+    return [columna for _, columna in sorted(zip(fechas, columnas))]
+
+
+@compartido(show_spinner=False)
+@cache_disco(FICHEROS_PROVINCIAS)
+def mapa_temporal(tablas, periodos, titulo, tolerancia=TOLERANCIA_DEFECTO, metodo=METODO_DEFECTO):
+    """`construir_mapa_temporal` sobre la geometría compartida, cacheado entre reruns y reinicios."""
+    from utils.mapa_folium import construir_mapa_temporal
+
+    return construir_mapa_temporal(geometria_provincias(tolerancia), tablas, list(periodos), titulo, metodo)
+
+
+@lru_cache(maxsize=4 * len(MAPAS_PAGINAS))
+def _clases_pagina(titulo, metodo, _versiones):
+    # Límites y colores (sexo, periodo, provincia) de todo lo que puede mostrar la página
+    import pandas as pd
+
+    from utils.clasificacion import clasificar_tablas
+    from utils.datos import cargar_tabla
+
+    tablas = {sexo: cargar_tabla(libro) for sexo, libro in zip(SEXOS, MAPAS_PAGINAS[titulo])}
+    codigos = pd.Index(geometria_provincias()["codigo"])
+    periodos = pd.Index(periodos_mapa(tablas["Total"]))
+    _, limites, colores = clasificar_tablas(tablas, codigos, periodos, metodo)
+    return codigos, periodos, limites, colores
+
+
+def mapa_periodo(titulo, periodo, sexo, tolerancia=TOLERANCIA_DEFECTO, metodo=METODO_DEFECTO):
+    """HTML del mapa de `periodo` y `sexo` de la página `titulo` (ver MAPAS_PAGINAS)."""
+    libros = MAPAS_PAGINAS[titulo]
+    libro = libros[SEXOS.index(sexo)]
+
+    def construir():
+        from utils.datos import cargar_tabla
+        from utils.mapa_folium import construir_mapa_periodo
+        from utils.provincias import unir_datos
+
+        codigos, periodos, limites, colores = _clases_pagina(titulo, metodo, tuple(map(version_tabla, libros)))
+        s, p = SEXOS.index(sexo), periodos.get_loc(periodo)
+        gdf = unir_datos(geometria_provincias(tolerancia), cargar_tabla(libro))
+        leyenda = f"{titulo} de {sexo.lower()} en {periodo}"
+        return construir_mapa_periodo(
+            gdf, periodo, leyenda, f"{titulo} ({periodo}):",
+            colores[s, p, codigos.get_indexer(gdf["codigo"])], limites[s, p],
+        )
+
+    return MAPAS.obtener((titulo, libro, version_tabla(libro), periodo, sexo, tolerancia, metodo), construir)
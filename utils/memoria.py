@@ -0,0 +1,222 @@
+"""Cuentas de memoria: tablas, objetos compartidos y sesiones.
+
+Sirve para estimar cuántos usuarios simultáneos caben en un proceso del
+servidor. La memoria del proceso se reparte en
+
+    base         intérprete, librerías y datos compartidos por todas las
+                 sesiones (tablas, cubos, geometría, cachés de artefactos;
+                 ver utils.compartido)
+    por sesión   lo que añade cada sesión abierta (su session_state, los
+                 mensajes de sus elementos, las copias de st.cache_data...)
+
+`informe_tablas()` y `informe_compartido()` miden lo primero objeto a objeto;
+`medir_sesiones()` abre varias sesiones de una página con AppTest en este
+proceso y mide cuánto crece la memoria residente con cada una. Uso:
+
+    python -m utils.memoria                              # todas las páginas
+    python -m utils.memoria pages/7_📑_Relaciones.py --sesiones 8 --limite-mb 2048
+
+El panel de rendimiento (utils.rendimiento) muestra la memoria del proceso y
+la de la sesión actual.
+"""
+import argparse
+import mmap
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+MB = 1024 ** 2
+
+
+def rss_mb(pid="self"):
+    """Memoria residente actual de un proceso, por defecto este.
+
+    Para este proceso, si el sistema no da la actual, devuelve el pico; para
+    otro proceso, None.
+    """
+    try:
+        with open(f"/proc/{pid}/status", encoding="ascii") as estado:
+            for linea in estado:
+                if linea.startswith("VmRSS:"):
+                    return int(linea.split()[1]) / 1024
+    except OSError:
+        pass
+    if pid != "self":
+        return None
+    import resource
+
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return pico / (MB if sys.platform == "darwin" else 1024)
+
+
+def _mapeado(array):
+    # Cubo guarda np.asarray(memmap), una vista que ya no es np.memmap: se mira su cadena de bases
+    while array is not None:
+        if isinstance(array, (np.memmap, mmap.mmap)):
+            return True
+        array = getattr(array, "base", None)
+    return False
+
+
+def tamaño(objeto, _vistos=None):
+    """Bytes aproximados que ocupa `objeto`, contando lo que contiene.
+
+    Los objetos compartidos dentro de `objeto` se cuentan una vez y los arrays
+    mapeados en memoria (cubos con mmap) no cuentan: son del sistema de ficheros.
+    """
+    vistos = set() if _vistos is None else _vistos
+    if id(objeto) in vistos:
+        return 0
+    vistos.add(id(objeto))
+
+    from utils.cubo import Cubo
+
+    if isinstance(objeto, Cubo):
+        return tamaño(objeto.valores, vistos) + sum(tamaño(eje, vistos) for eje in objeto.ejes.values())
+    if isinstance(objeto, np.ndarray) and _mapeado(objeto):
+        return 0
+    if isinstance(objeto, np.ndarray):
+        return objeto.nbytes
+    if hasattr(objeto, "geometry") and isinstance(objeto, pd.DataFrame):
+        import shapely
+
+        geometrias = shapely.to_wkb(objeto.geometry.to_numpy())
+        return int(objeto.drop(columns=objeto.geometry.name).memory_usage(deep=True).sum()) + sum(map(len, geometrias))
+    if isinstance(objeto, pd.DataFrame):
+        return int(objeto.memory_usage(deep=True).sum())
+    if isinstance(objeto, (pd.Series, pd.Index)):
+        return int(objeto.memory_usage(deep=True))
+    if isinstance(objeto, dict):
+        return sys.getsizeof(objeto) + sum(tamaño(k, vistos) + tamaño(v, vistos) for k, v in objeto.items())
+    if isinstance(objeto, (list, tuple, set, frozenset)):
+        return sys.getsizeof(objeto) + sum(tamaño(v, vistos) for v in objeto)
+    return sys.getsizeof(objeto)
+
+
+def _tamaño_float64(tabla):
+    # Lo que ocuparía con los tipos de antes de utils.ingesta.compactar
+    indice = tabla.index.memory_usage(deep=True)
+    if tabla.index.nlevels == 1 and pd.api.types.is_integer_dtype(tabla.index):
+        indice = 8 * len(tabla.index)
+    return indice + 8 * tabla.size
+
+
+def informe_tablas():
+    """Una fila por tabla procesada: forma, tipo de los valores y kB ocupados frente a float64."""
+    from utils.datos import cargar_tabla
+    from utils.ingesta import libros_disponibles
+
+    filas = {}
+    for nombre in libros_disponibles():
+        tabla = cargar_tabla(nombre)
+        filas[nombre] = {
+            "filas": tabla.shape[0],
+            "columnas": tabla.shape[1],
+            "tipo": ", ".join(sorted(set(map(str, tabla.dtypes)))),
+            "indice": str(tabla.index.dtype) if tabla.index.nlevels == 1 else "MultiIndex",
+            "kB": round(tamaño(tabla) / 1024, 1),
+            "kB_float64": round(_tamaño_float64(tabla) / 1024, 1),
+        }
+    return pd.DataFrame.from_dict(filas, orient="index")
+
+
+def informe_compartido():
+    """kB de lo que se carga una vez por proceso y usan todas las sesiones."""
+    from utils.artefactos import CACHES
+    from utils.cubo import CUBOS, cubo
+    from utils.datos import cargar_tabla
+    from utils.geometria import TOLERANCIAS, geometria_provincias
+    from utils.ingesta import libros_disponibles
+
+    # Las vistas de cargar_tabla comparten los datos de la tabla del proceso
+    filas = {f"tabla {nombre}": tamaño(cargar_tabla(nombre)) for nombre in libros_disponibles()}
+    filas.update({f"cubo {nombre}": tamaño(cubo(nombre)) for nombre in CUBOS})
+    try:
+        vistos = set()
+        filas["geometría"] = sum(tamaño(geometria_provincias(t), vistos) for t in TOLERANCIAS)
+    except Exception:  # sin shapefile ni paquete: no hay geometría que medir
+        pass
+    for nombre, cache in CACHES.items():
+        filas[f"artefactos {nombre}"] = tamaño(list(cache._valores.values()))
+    return pd.Series(filas, name="kB").div(1024).round(1)
+
+
+def memoria_sesion(estado=None):
+    """Bytes del session_state de la sesión actual (o de `estado`)."""
+    if estado is None:
+        import streamlit as st
+
+        estado = st.session_state
+    return tamaño({clave: estado[clave] for clave in list(estado.keys())})
+
+
+def medir_sesiones(pagina, sesiones=5):
+    """Abre `sesiones` sesiones de `pagina` en este proceso y devuelve la memoria en MB.
+
+    La primera calienta las cachés compartidas; el resto se mantienen abiertas a
+    la vez y su crecimiento medio es el coste por sesión.
+    """
+    import gc
+
+    from streamlit.testing.v1 import AppTest
+
+    inicio = rss_mb()
+    abiertas = [AppTest.from_file(str(pagina), default_timeout=300).run()]
+    gc.collect()
+    base = rss_mb()
+    for _ in range(sesiones):
+        abiertas.append(AppTest.from_file(str(pagina), default_timeout=300).run())
+    gc.collect()
+    final = rss_mb()
+    errores = [str(e.value) for app in abiertas for e in app.exception]
+    return {
+        "rss_inicio_mb": round(inicio, 1),
+        "rss_base_mb": round(base, 1),
+        "rss_final_mb": round(final, 1),
+        "por_sesion_mb": round(max(final - base, 0) / sesiones, 2),
+        "error": errores[0] if errores else None,
+    }
+
+
+def capacidad(base_mb, por_sesion_mb, limite_mb):
+    """Sesiones simultáneas que caben en `limite_mb` con esa base y coste por sesión."""
+    if por_sesion_mb <= 0:
+        return None
+    return max(int((limite_mb - base_mb) // por_sesion_mb), 0)
+
+
+def main(argumentos=None):
+    from utils.benchmark import RAIZ, paginas_app
+
+    parser = argparse.ArgumentParser(description="Memoria de las tablas, los datos compartidos y cada sesión.")
+    parser.add_argument("paginas", nargs="*", type=Path, help="scripts a medir (por defecto, todos)")
+    parser.add_argument("--sesiones", type=int, default=5, help="sesiones simultáneas por página")
+    parser.add_argument("--limite-mb", type=float, default=1024, help="memoria disponible para el proceso")
+    args = parser.parse_args(argumentos)
+
+    with pd.option_context("display.width", 160, "display.max_columns", None):
+        print(informe_tablas(), end="\n\n")
+        print(informe_compartido().to_frame(), end="\n\n")
+
+    peor = None
+    for ruta in args.paginas or paginas_app():
+        ruta = Path(ruta).resolve()
+        medida = medir_sesiones(ruta, args.sesiones)
+        estado = f" ERROR: {medida['error']}" if medida["error"] else ""
+        print(f"{ruta.relative_to(RAIZ).as_posix()}: base {medida['rss_base_mb']} MB, "
+              f"{medida['por_sesion_mb']} MB por sesión{estado}")
+        if peor is None or medida["por_sesion_mb"] > peor["por_sesion_mb"]:
+            peor = medida
+
+    base = rss_mb()
+    sesiones = capacidad(base, peor["por_sesion_mb"], args.limite_mb)
+    print(f"\nProceso con todo cargado: {base:.1f} MB. Con {args.limite_mb:.0f} MB caben unas "
+          f"{sesiones if sesiones is not None else '∞'} sesiones de la página más costosa "
+          f"({peor['por_sesion_mb']} MB cada una).")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
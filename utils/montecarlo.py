@@ -0,0 +1,246 @@
+"""Simulación de Monte Carlo de la incertidumbre de la proyección (ver utils.proyeccion).
+
+Cada trayectoria es la proyección tendencial con multiplicadores de fecundidad,
+mortalidad y migración que cambian al azar cada año. En escala logarítmica
+siguen un proceso AR(1),
+
+    x(t) = persistencia · x(t - 1) + σ · ε(t),   multiplicador = exp(x(t))
+
+con σ la desviación de las variaciones anuales del logaritmo de los
+nacimientos, las defunciones y el flujo de inmigración nacionales en los
+últimos AÑOS_VOLATILIDAD años (ver `volatilidades()`). La fecundidad y la
+mortalidad son paseos aleatorios (persistencia 1); la migración vuelve a su
+nivel (0,8), porque sus olas duran unos pocos años.
+
+Las trayectorias se reparten en lotes de TAMAÑO_LOTE que se ejecutan en un
+grupo de procesos, uno por núcleo, dentro de un proceso aparte que devuelve
+los lotes por su salida estándar: el servidor de Streamlit tiene hilos y no
+debe hacer fork de sí mismo. Cada lote recibe su propia semilla derivada
+de la semilla global (`numpy.random.SeedSequence.spawn`), así que el resultado
+no depende del número de procesos ni del orden en que acaban los lotes. Como
+los lotes son independientes, el tiempo baja casi en proporción a los núcleos.
+`simular()` va devolviendo las trayectorias terminadas para que la página
+dibuje las bandas p5/p50/p95 mientras se calculan:
+
+    for avance in simular(2000, semilla=2024):
+        print(avance.hechas, bandas(avance.trayectorias, avance.años, provincia=28).iloc[-1])
+
+Solo se guardan los totales por provincia y año; la provincia CODIGO_NACIONAL
+es la suma. `simulacion()` guarda el resultado en la caché de artefactos
+compartida, de modo que cada combinación se simula una vez por proceso.
+"""
+import argparse
+import multiprocessing
+import os
+import pickle
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from utils.artefactos import SIMULACIONES as CACHE
+from utils.proyeccion import HORIZONTE, avanzar, calibrar, version_calibracion
+
+RAIZ = Path(__file__).resolve().parent.parent
+
+SIMULACIONES = 1000
+TAMAÑO_LOTE = 100
+SEMILLA = 2024
+PERCENTILES = (5, 50, 95)
+AÑOS_VOLATILIDAD = 20
+# Persistencia del AR(1) de (fecundidad, mortalidad, migración)
+PERSISTENCIA = np.array([1.0, 1.0, 0.8])
+
+
+@dataclass
+class Avance:
+    hechas: int
+    total: int
+    trayectorias: np.ndarray  # (trayectoria, año, provincia) de los lotes terminados, en su orden
+    años: pd.PeriodIndex
+
+    @property
+    def terminada(self):
+        return self.hechas == self.total
+
+
+def volatilidades():
+    """σ anual de (fecundidad, mortalidad, migración) estimada con las series nacionales."""
+    from utils.cubo import cubo
+    from utils.provincias import CODIGO_NACIONAL
+
+    series = [
+        cubo("nacimientos").sel(provincia=CODIGO_NACIONAL, sexo="Total").valores,
+        cubo("defunciones").sel(provincia=CODIGO_NACIONAL, sexo="Total").valores,
+        cubo("inmigracion").sel(sexo="Total").suma("edad").valores,
+    ]
+    return np.array([np.nanstd(np.diff(np.log(s[-AÑOS_VOLATILIDAD:]))) for s in series])
+
+
+def factores_aleatorios(azar, sigmas, trayectorias, horizonte):
+    """Multiplicadores (3, trayectoria, año) con la mediana en 1."""
+    choques = azar.standard_normal((3, trayectorias, horizonte)) * sigmas[:, None, None]
+    x = np.zeros((3, trayectorias))
+    factores = np.empty_like(choques)
+    for t in range(horizonte):
+        x = PERSISTENCIA[:, None] * x + choques[..., t]
+        factores[..., t] = np.exp(x)
+    return factores
+
+
+def _lote(calibracion, sigmas, semilla, trayectorias, horizonte):
+    # Se ejecuta en los procesos hijos: devuelve solo los totales por provincia
+    factores = factores_aleatorios(np.random.default_rng(semilla), sigmas, trayectorias, horizonte)
+    totales = np.empty((trayectorias, horizonte + 1, calibracion["poblacion"].shape[0] + 1), dtype="float32")
+    totales[:, 0, 1:] = calibracion["poblacion"].sum(axis=(1, 2))
+    for t, (poblacion, _) in enumerate(avanzar(calibracion, factores)):
+        totales[:, t + 1, 1:] = poblacion.sum(axis=(2, 3))
+    totales[..., 0] = totales[..., 1:].sum(axis=-1)
+    return totales
+
+
+def _tamaños(simulaciones):
+    return [min(TAMAÑO_LOTE, simulaciones - inicio) for inicio in range(0, simulaciones, TAMAÑO_LOTE)]
+
+
+def _en_serie(simulaciones, horizonte, semilla):
+    calibracion, sigmas = calibrar(), volatilidades()
+    tamaños = _tamaños(simulaciones)
+    for i, (s, n) in enumerate(zip(np.random.SeedSequence(semilla).spawn(len(tamaños)), tamaños)):
+        yield i, _lote(calibracion, sigmas, s, n, horizonte)
+
+
+def _en_grupo(simulaciones, horizonte, semilla, procesos):
+    # Solo desde la línea de órdenes (`--flujo`): con spawn, cada hijo importa el
+    # __main__ del padre, y dentro de Streamlit ese __main__ es la página
+    calibracion, sigmas = calibrar(), volatilidades()
+    tamaños = _tamaños(simulaciones)
+    semillas = np.random.SeedSequence(semilla).spawn(len(tamaños))
+    contexto = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=procesos, mp_context=contexto) as ejecutor:
+        futuros = {
+            ejecutor.submit(_lote, calibracion, sigmas, s, n, horizonte): i
+            for i, (s, n) in enumerate(zip(semillas, tamaños))
+        }
+        for futuro in as_completed(futuros):
+            yield futuros[futuro], futuro.result()
+
+
+def _en_subproceso(simulaciones, horizonte, semilla, procesos):
+    # El hijo envía por su salida estándar un pickle (índice, lote) por lote y None al terminar
+    orden = [sys.executable, "-m", "utils.montecarlo", "--flujo", "--simulaciones", str(simulaciones),
+             "--horizonte", str(horizonte), "--semilla", str(semilla), "--procesos", str(procesos)]
+    with tempfile.TemporaryFile() as errores:
+        proceso = subprocess.Popen(orden, cwd=RAIZ, stdout=subprocess.PIPE, stderr=errores)
+        try:
+            while True:
+                try:
+                    mensaje = pickle.load(proceso.stdout)
+                except EOFError:
+                    proceso.wait()
+                    errores.seek(0)
+                    raise RuntimeError(f"La simulación terminó con código {proceso.returncode}:\n"
+                                       f"{errores.read().decode(errors='replace')[-2000:]}") from None
+                if mensaje is None:
+                    break
+                yield mensaje
+        finally:
+            # Si la página deja de consumir el generador (otro rerun), no queda el hijo calculando
+            if proceso.poll() is None:
+                proceso.kill()
+            proceso.wait()
+            proceso.stdout.close()
+
+
+def simular(simulaciones=SIMULACIONES, horizonte=HORIZONTE, semilla=SEMILLA, procesos=None):
+    """Generador de `Avance`, uno por lote terminado; el último tiene todas las trayectorias.
+
+    Con más de un proceso, los lotes se calculan en un proceso aparte
+    (`python -m utils.montecarlo --flujo`) con su propio grupo de procesos, de
+    modo que el servidor nunca hace fork de sí mismo.
+    """
+    años = pd.period_range(str(calibrar()["base"].year), periods=horizonte + 1, freq="Y")
+    tamaños = _tamaños(simulaciones)
+    procesos = min(procesos or os.cpu_count() or 1, len(tamaños))
+    if procesos == 1:
+        terminados = _en_serie(simulaciones, horizonte, semilla)
+    else:
+        terminados = _en_subproceso(simulaciones, horizonte, semilla, procesos)
+
+    lotes = [None] * len(tamaños)
+    for indice, lote in terminados:
+        lotes[indice] = lote
+        hechos = [l for l in lotes if l is not None]
+        yield Avance(sum(len(l) for l in hechos), simulaciones, np.concatenate(hechos), años)
+
+
+def _clave(simulaciones, horizonte, semilla):
+    return ("montecarlo", version_calibracion(), simulaciones, horizonte, semilla)
+
+
+def simulacion_guardada(simulaciones=SIMULACIONES, horizonte=HORIZONTE, semilla=SEMILLA):
+    return _clave(simulaciones, horizonte, semilla) in CACHE
+
+
+def simulacion(simulaciones=SIMULACIONES, horizonte=HORIZONTE, semilla=SEMILLA, al_avanzar=None):
+    """El último `Avance` de `simular`, compartido entre sesiones.
+
+    Si hay que calcularlo, llama a `al_avanzar(avance)` con cada lote terminado.
+    """
+    def construir():
+        for avance in simular(simulaciones, horizonte, semilla):
+            if al_avanzar is not None:
+                al_avanzar(avance)
+        avance.trayectorias.flags.writeable = False
+        return avance
+
+    return CACHE.obtener(_clave(simulaciones, horizonte, semilla), construir)
+
+
+def bandas(trayectorias, años, provincia):
+    """Percentiles PERCENTILES de la población de `provincia` en cada año."""
+    from utils.provincias import CODIGO_NACIONAL, PROVINCIAS
+
+    columna = 0 if provincia == CODIGO_NACIONAL else 1 + PROVINCIAS.index.get_loc(provincia)
+    valores = np.percentile(trayectorias[:, :, columna], PERCENTILES, axis=0)
+    return pd.DataFrame(valores.T, index=años.year, columns=[f"p{p}" for p in PERCENTILES])
+
+
+def main(argumentos=None):
+    from utils.provincias import CODIGO_NACIONAL
+
+    parser = argparse.ArgumentParser(description="Bandas de incertidumbre de la proyección por Monte Carlo.")
+    parser.add_argument("--simulaciones", type=int, default=SIMULACIONES)
+    parser.add_argument("--horizonte", type=int, default=HORIZONTE)
+    parser.add_argument("--semilla", type=int, default=SEMILLA)
+    parser.add_argument("--procesos", type=int, help="por defecto, uno por núcleo")
+    parser.add_argument("--provincia", type=int, default=CODIGO_NACIONAL)
+    parser.add_argument("--flujo", action="store_true", help=argparse.SUPPRESS)  # lo usa `simular`
+    args = parser.parse_args(argumentos)
+
+    if args.flujo:
+        procesos = args.procesos or os.cpu_count() or 1
+        salida = sys.stdout.buffer
+        for mensaje in _en_grupo(args.simulaciones, args.horizonte, args.semilla, procesos):
+            pickle.dump(mensaje, salida)
+            salida.flush()
+        pickle.dump(None, salida)
+        salida.flush()
+        return 0
+
+    inicio = time.perf_counter()
+    for avance in simular(args.simulaciones, args.horizonte, args.semilla, args.procesos):
+        pass
+    print(f"{avance.hechas} trayectorias en {time.perf_counter() - inicio:.1f} s")
+    print(bandas(avance.trayectorias, avance.años, args.provincia).round(0).to_string())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,104 @@
+"""Mapa municipal servido como teselas vectoriales.
+
+Los ~8.100 términos municipales no viajan como GeoJSON en cada rerun: la
+geometría se empaqueta una vez en `static/municipios.pmtiles`, un único
+fichero de teselas vectoriales que Streamlit sirve como estático
+(`server.enableStaticServing` en .streamlit/config.toml) y del que el navegador
+pide por rangos solo las teselas a la vista. Cada municipio lleva su código
+INE de cinco cifras; la página envía solo el color y el valor de cada código
+en el periodo elegido y el cruce con la geometría se hace en el navegador
+(ver utils.mapa_teselas).
+
+Las teselas se generan a partir del shapefile municipal del IGN con
+
+    python -m utils.municipios
+
+y los datos salen del libro opcional PobMunicipios (ver utils.ingesta).
+"""
+from pathlib import Path
+
+from utils.artefactos import MAPAS, version_tabla
+from utils.cache_disco import huella
+from utils.clasificacion import METODO_DEFECTO
+from utils.ingesta import DIRECTORIO_DATOS, POBLACION_MUNICIPIOS, ruta_origen, ruta_procesada
+
+RUTA_MUNICIPIOS = DIRECTORIO_DATOS / "recintos_municipales_inspire_peninbal_etrs89.shp"
+RUTA_TESELAS = Path(__file__).resolve().parent.parent / "static" / "municipios.pmtiles"
+URL_TESELAS = "app/static/municipios.pmtiles"
+CAPA = "municipios"
+ZOOM_MINIMO = 4
+ZOOM_MAXIMO = 12
+# Caja (oeste, sur, este, norte) que encuadra la península, Baleares y Canarias
+LIMITES_ESPAÑA = (-18.2, 27.6, 4.4, 43.9)
+
+
+def empaquetar_teselas(ruta=RUTA_TESELAS):
+    """Escribe el PMTiles con el código INE y el nombre de cada municipio."""
+    import geopandas as gpd
+
+    municipios = gpd.read_file(RUTA_MUNICIPIOS).to_crs("EPSG:4326")
+    # NATCODE = 34 + comunidad (2) + provincia (2) + código INE del municipio (5)
+    municipios['codigo'] = municipios['NATCODE'].str[-5:].astype(int)
+    municipios = municipios.rename(columns={'NAMEUNIT': 'Municipio'})[['codigo', 'Municipio', 'geometry']]
+    ruta.parent.mkdir(parents=True, exist_ok=True)
+    ruta.unlink(missing_ok=True)  # GDAL no sobrescribe el fichero
+    municipios.to_file(ruta, driver="PMTiles", layer=CAPA, MINZOOM=ZOOM_MINIMO, MAXZOOM=ZOOM_MAXIMO)
+    return ruta
+
+
+def faltan_ficheros():
+    """Ficheros que hacen falta para el mapa municipal y no están."""
+    faltan = [] if RUTA_TESELAS.exists() else [RUTA_TESELAS]
+    if not ruta_origen(POBLACION_MUNICIPIOS).exists() and not ruta_procesada(POBLACION_MUNICIPIOS).exists():
+        faltan.append(ruta_origen(POBLACION_MUNICIPIOS))
+    return faltan
+
+
+def periodos_municipales(sexo="Total"):
+    """Años del libro municipal para `sexo`, del más antiguo al más reciente."""
+    from utils.datos import cargar_tabla
+
+    return sorted(cargar_tabla(POBLACION_MUNICIPIOS)[sexo].columns)
+
+
+def mapa_municipal(periodo, sexo="Total", metodo=METODO_DEFECTO):
+    """HTML del mapa de población municipal de `periodo` y `sexo`, compartido entre sesiones."""
+    def construir():
+        from utils.clasificacion import PALETA, colores, cortes
+        from utils.datos import cargar_tabla
+        from utils.mapa_teselas import construir_mapa_teselas
+
+        serie = cargar_tabla(POBLACION_MUNICIPIOS)[sexo][periodo]
+        valores = serie.to_numpy(dtype="float64")
+        limites = cortes(valores, metodo)
+        return construir_mapa_teselas(
+            URL_TESELAS, CAPA, LIMITES_ESPAÑA, serie.index, valores, colores(valores, limites, PALETA)[0],
+            limites[0], "Población", f"Población de {sexo.lower()} en {periodo}",
+        )
+
+    clave = ("municipios", version_tabla(POBLACION_MUNICIPIOS), huella(RUTA_TESELAS), periodo, sexo, metodo)
+    return MAPAS.obtener(clave, construir)
+
+
+def mostrar_mapa_municipal(sexo="Total", metodo=METODO_DEFECTO, key=None):
+    """Selector de año y mapa municipal, o un aviso con lo que falta para dibujarlo."""
+    import streamlit as st
+    import streamlit.components.v1 as components
+
+    faltan = faltan_ficheros()
+    if faltan:
+        st.warning(
+            "No se puede dibujar el mapa municipal: faltan "
+            + " y ".join(f"`{ruta.relative_to(DIRECTORIO_DATOS.parent)}`" for ruta in faltan)
+            + ", que no se incluyen en el repositorio. Las teselas se generan con `python -m utils.municipios` "
+            f"a partir del shapefile municipal del IGN (`{RUTA_MUNICIPIOS.name}`) y los datos son la población por municipios y sexo del INE guardada como "
+            f"`{ruta_origen(POBLACION_MUNICIPIOS).name}`."
+        )
+        return
+    periodos = periodos_municipales(sexo)
+    periodo = st.select_slider("Año del mapa municipal", periodos, value=periodos[-1], key=key)
+    components.html(mapa_municipal(periodo, sexo, metodo), height=600)
+
+
+if __name__ == "__main__":
+    print(f"Escrito {empaquetar_teselas()}")
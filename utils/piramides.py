@@ -0,0 +1,126 @@
+"""Figuras de las pirámides poblacionales nacionales (página 6).
+
+Viven aquí y no en la página para que la precarga (utils.precarga) construya
+las mismas entradas de caché que la primera visita:
+
+    piramides_quinquenales()        fechas, grupos quinquenales y el array
+                                    (fecha, sexo, grupo), compartido entre sesiones
+    figura_fecha(fecha, titulo)     pirámide de una fecha
+    figura_comparacion(a, b)        `a` en barras y `b` en contorno
+    figura_evolucion()              pirámide animada con todas las fechas
+
+Las figuras se devuelven como diccionarios de Plotly y las dos primeras se
+guardan en GRAFICOS (utils.artefactos).
+"""
+import plotly.graph_objects as go
+
+from utils.artefactos import GRAFICOS, version_tabla
+from utils.compartido import compartido
+from utils.cubo import CUBOS, cubo
+from utils.fechas import texto_fecha
+from utils.tiempos import cache_data
+
+COLORES = {"Hombres": "steelblue", "Mujeres": "salmon"}
+
+
+@compartido
+def piramides_quinquenales():
+    """Hombres y mujeres por grupo quinquenal de edad en todas las fechas publicadas.
+
+    Devuelve las fechas, las etiquetas de los grupos y un array (fecha, sexo, grupo)
+    calculado de una vez sobre el cubo de población por edad.
+    """
+    piramides = cubo("poblacion_edad").sel(sexo=["Hombres", "Mujeres"]).agrupar("edad", 5)
+    grupos = [f"{inicio}-{inicio + 4}" for inicio in piramides.ejes["edad"]]
+    return texto_fecha(piramides.ejes["periodo"]), grupos, piramides.valores
+
+
+def barras(fecha, sufijo="", contorno=False):
+    """Las dos barras (hombres a la izquierda, mujeres a la derecha) de `fecha`."""
+    fechas, grupos, valores = piramides_quinquenales()
+    indice = fechas.index(fecha)
+    trazas = []
+    for posicion, (sexo, signo) in enumerate([("Hombres", -1), ("Mujeres", 1)]):
+        color = COLORES[sexo]
+        trazas.append(go.Bar(
+            y=grupos,
+            x=signo * valores[indice, posicion],
+            name=f"{sexo}{sufijo}",
+            orientation="h",
+            marker=dict(color="rgba(0,0,0,0)", line=dict(color=color, width=2)) if contorno else dict(color=color),
+            hovertemplate="%{y}<br>" + sexo + ": %{x:.0f}<extra></extra>"
+        ))
+    return trazas
+
+
+def figura_piramide(trazas, titulo, barmode="relative"):
+    limite = piramides_quinquenales()[2].max() * 1.05
+    fig = go.Figure(trazas)
+    fig.update_layout(
+        title_text=titulo,
+        barmode=barmode,
+        xaxis=dict(
+            title="Población",
+            tickvals=[-2000000, -1000000, 0, 1000000, 2000000],
+            ticktext=["2 M", "1 M", "0", "1 M", "2 M"],
+            range=[-limite, limite]
+        ),
+        yaxis=dict(title="Rango de edad"),
+        plot_bgcolor="white",
+        template="simple_white",
+        margin=dict(l=80, r=80, t=50, b=50)
+    )
+    return fig
+
+
+def figura_compartida(clave, construir):
+    """Figura de `construir()` como diccionario de Plotly, compartida entre sesiones (utils.artefactos)."""
+    version = tuple(version_tabla(tabla) for tabla in CUBOS["poblacion_edad"][1])
+    return GRAFICOS.obtener(("Pirámide", version, *clave), lambda: construir().to_plotly_json())
+
+
+def figura_fecha(fecha, titulo):
+    return figura_compartida((fecha,), lambda: figura_piramide(barras(fecha), titulo))
+
+
+def figura_comparacion(fecha_a, fecha_b):
+    return figura_compartida((fecha_a, fecha_b), lambda: figura_piramide(
+        barras(fecha_a, f" ({fecha_a})") + barras(fecha_b, f" ({fecha_b})", contorno=True),
+        f"España - {fecha_a} frente a {fecha_b}",
+        barmode="overlay",
+    ))
+
+
+@cache_data
+def figura_evolucion():
+    """Pirámide animada con un fotograma por fecha; se mueve en el navegador sin volver a Streamlit."""
+    fechas, _, valores = piramides_quinquenales()
+    fig = figura_piramide(barras(fechas[0]), f"España - Pirámide Poblacional ({fechas[0]})")
+    fig.frames = [
+        go.Frame(
+            name=fecha,
+            data=[dict(type="bar", x=-valores[i, 0]), dict(type="bar", x=valores[i, 1])],
+            layout=dict(title_text=f"España - Pirámide Poblacional ({fecha})"),
+        )
+        for i, fecha in enumerate(fechas)
+    ]
+    animar = dict(frame=dict(duration=150, redraw=False), transition=dict(duration=0), mode="immediate")
+    fig.update_layout(
+        updatemenus=[dict(
+            type="buttons", direction="left", x=0, y=-0.12, xanchor="left", yanchor="top", showactive=False,
+            buttons=[
+                dict(label="▶ Reproducir", method="animate", args=[None, dict(animar, fromcurrent=True)]),
+                dict(label="⏸ Pausa", method="animate", args=[[None], dict(animar, frame=dict(duration=0, redraw=False))]),
+            ],
+        )],
+        sliders=[dict(
+            x=0.2, y=-0.08, len=0.8, currentvalue=dict(visible=False),
+            steps=[
+                dict(method="animate", args=[[fecha], animar],
+                     label=fecha[-4:] if fecha.startswith("1 de enero") and int(fecha[-4:]) % 5 == 0 else "")
+                for fecha in fechas
+            ],
+        )],
+        margin=dict(l=80, r=80, t=50, b=120),
+    )
+    return fig.to_plotly_json()
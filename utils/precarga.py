@@ -0,0 +1,165 @@
+"""Precarga de datos y cachés al arrancar el servidor.
+
+La primera ejecución de cualquier página llama a `iniciar_precarga()`, que
+lanza (una sola vez por proceso) un hilo en segundo plano que importa las
+librerías pesadas y rellena, en este orden, las tablas procesadas, los cubos,
+los indicadores provinciales y de edad, la geometría simplificada, los mapas
+temporales de las páginas, las figuras de las pirámides y la proyección por
+defecto. Así la primera visita tras un despliegue no tiene que construir nada
+que no esté ya en marcha.
+El avance se escribe en el log del servidor y la portada lo muestra con
+`mostrar_precarga()`. Con PRECARGA=0 no se lanza.
+
+También se puede ejecutar antes de arrancar el servidor, lo que deja listas
+las tablas y la caché en disco:
+
+    python -m utils.precarga
+"""
+import importlib
+import os
+import threading
+import time
+from functools import partial
+
+from streamlit.logger import get_logger
+
+_LOG = get_logger(__name__)
+
+# Las importa el hilo para que la primera página no tenga que hacerlo
+BIBLIOTECAS = ["numpy", "pandas", "pyarrow", "altair", "plotly.graph_objects", "plotly.express"]
+
+
+class Precarga:
+    """Avance de la precarga: pasos hechos, el que está en curso y los que fallaron."""
+
+    def __init__(self, pasos):
+        self.pasos = pasos
+        self.hechos = 0
+        self.actual = None
+        self.errores = {}
+        self.inicio = time.perf_counter()
+        self.segundos = None
+
+    @property
+    def terminada(self):
+        return self.segundos is not None
+
+    @property
+    def fraccion(self):
+        return self.hechos / len(self.pasos) if self.pasos else 1.0
+
+    def ejecutar(self, informar=_LOG.info):
+        for descripcion, paso in self.pasos:
+            self.actual = descripcion
+            try:
+                paso()
+            except Exception as e:  # un paso que falla no impide los demás; la página mostrará el error
+                self.errores[descripcion] = f"{type(e).__name__}: {e}"
+                informar(f"Precarga: {descripcion} falló ({self.errores[descripcion]})")
+            self.hechos += 1
+            informar(f"Precarga {self.hechos}/{len(self.pasos)}: {descripcion}")
+        self.actual = None
+        self.segundos = time.perf_counter() - self.inicio
+        informar(f"Precarga terminada en {self.segundos:.1f} s ({len(self.errores)} errores)")
+
+
+def _importar(modulos):
+    for modulo in modulos:
+        importlib.import_module(modulo)
+
+
+def _mapa(titulo):
+    from utils.clasificacion import METODO_DEFECTO
+    from utils.datos import cargar_tabla
+    from utils.mapas import MAPAS_PAGINAS, mapa_temporal, periodos_mapa
+
+    total, hombres, mujeres = (cargar_tabla(libro) for libro in MAPAS_PAGINAS[titulo])
+    # Mismos argumentos que en la página, para que la clave de la caché coincida
+    mapa_temporal(
+        {"Total": total, "Hombres": hombres, "Mujeres": mujeres}, periodos_mapa(total), titulo, metodo=METODO_DEFECTO
+    )
+
+
+def _piramides():
+    from utils.piramides import figura_comparacion, figura_evolucion, figura_fecha, piramides_quinquenales
+
+    # Las figuras que pinta la página 6 al abrirla, con sus mismas claves
+    fechas = piramides_quinquenales()[0]
+    for año in (1971, 2024):
+        figura_fecha(f"1 de enero de {año}", f"España - Pirámide Poblacional {año}")
+    figura_comparacion(fechas[0], fechas[-1])
+    figura_evolucion()
+
+
+def _proyeccion():
+    from utils.proyeccion import ESCENARIOS, HORIZONTE, proyeccion
+
+    # La página 9 añade el escenario propio con los deslizadores al 100 %
+    proyeccion({**ESCENARIOS, "Propio": (1.0, 1.0, 1.0)}, HORIZONTE)
+
+
+def pasos_precarga():
+    """Lista de (descripción, función) que recorre la precarga."""
+    from utils.cubo import CUBOS, cubo
+    from utils.datos import cargar_tabla
+    from utils.estructura_edad import indicadores_edad
+    from utils.geometria import TOLERANCIAS, geometria_provincias
+    from utils.indicadores import indicadores
+    from utils.ingesta import libros_disponibles
+    from utils.mapas import MAPAS_PAGINAS
+
+    return [
+        ("librerías", partial(_importar, BIBLIOTECAS)),
+        *((f"tabla {nombre}", partial(cargar_tabla, nombre)) for nombre in libros_disponibles()),
+        *((f"cubo {nombre}", partial(cubo, nombre)) for nombre in CUBOS),
+        ("indicadores", indicadores),
+        ("indicadores de edad", indicadores_edad),
+        *((f"geometría {tolerancia}", partial(geometria_provincias, tolerancia)) for tolerancia in TOLERANCIAS),
+        *((f"mapa {titulo}", partial(_mapa, titulo)) for titulo in MAPAS_PAGINAS),
+        ("pirámides", _piramides),
+        ("proyección", _proyeccion),
+    ]
+
+
+_precarga = None
+_hilo = None
+_cerrojo = threading.Lock()
+
+
+def _en_hilo():
+    global _precarga
+    _precarga = Precarga(pasos_precarga())
+    _precarga.ejecutar()
+
+
+def iniciar_precarga():
+    """Lanza la precarga en segundo plano si aún no se ha lanzado en este proceso."""
+    global _hilo
+    if os.environ.get("PRECARGA", "1") == "0":
+        return
+    with _cerrojo:
+        if _hilo is None:
+            _hilo = threading.Thread(target=_en_hilo, name="precarga", daemon=True)
+            _hilo.start()
+
+
+def estado_precarga():
+    """La `Precarga` en curso o terminada, o None si no se ha lanzado."""
+    return _precarga
+
+
+def mostrar_precarga():
+    """Barra de avance mientras la precarga sigue en marcha; nada una vez terminada."""
+    import streamlit as st
+
+    precarga = estado_precarga()
+    if _hilo is None or (precarga is not None and precarga.terminada):
+        return
+    if precarga is None:
+        st.progress(0.0, text="Preparando los datos en segundo plano…")
+    else:
+        st.progress(precarga.fraccion, text=f"Preparando los datos en segundo plano: {precarga.actual or ''}")
+
+
+if __name__ == "__main__":
+    Precarga(pasos_precarga()).ejecutar(informar=print)
@@ -0,0 +1,76 @@
+"""Dimensión de provincias indexada por código INE.
+
+Todas las tablas provinciales y la geometría se traducen a este código en la
+ingesta, de modo que los cruces entre ellas son uniones por entero y no por
+nombres retocados a mano.
+"""
+import pandas as pd
+
+# Filas de los libros del INE que no son provincias pero se conservan
+CODIGO_NACIONAL = 0
+CODIGO_NO_RESIDENTE = 99
+
+PROVINCIAS = pd.DataFrame(
+    [
+        (1, "Araba/Álava"), (2, "Albacete"), (3, "Alicante/Alacant"), (4, "Almería"),
+        (5, "Ávila"), (6, "Badajoz"), (7, "Illes Balears"), (8, "Barcelona"),
+        (9, "Burgos"), (10, "Cáceres"), (11, "Cádiz"), (12, "Castellón/Castelló"),
+        (13, "Ciudad Real"), (14, "Córdoba"), (15, "A Coruña"), (16, "Cuenca"),
+        (17, "Girona"), (18, "Granada"), (19, "Guadalajara"), (20, "Gipuzkoa"),
+        (21, "Huelva"), (22, "Huesca"), (23, "Jaén"), (24, "León"),
+        (25, "Lleida"), (26, "La Rioja"), (27, "Lugo"), (28, "Madrid"),
+        (29, "Málaga"), (30, "Murcia"), (31, "Navarra"), (32, "Ourense"),
+        (33, "Asturias"), (34, "Palencia"), (35, "Las Palmas"), (36, "Pontevedra"),
+        (37, "Salamanca"), (38, "Santa Cruz de Tenerife"), (39, "Cantabria"), (40, "Segovia"),
+        (41, "Sevilla"), (42, "Soria"), (43, "Tarragona"), (44, "Teruel"),
+        (45, "Toledo"), (46, "Valencia/València"), (47, "Valladolid"), (48, "Bizkaia"),
+        (49, "Zamora"), (50, "Zaragoza"), (51, "Ceuta"), (52, "Melilla"),
+    ],
+    columns=["codigo", "Provincia"],
+).astype({"codigo": "int16", "Provincia": "category"}).set_index("codigo")
+
+
+def normalizar_nombre(nombres):
+    """Minúsculas, sin tildes y con "Coruña, A" -> "a coruña" (vectorizado)."""
+    s = pd.Series(nombres, dtype="object").astype(str).str.strip().str.lower()
+    s = s.str.normalize("NFKD").str.replace("[\u0300-\u036f]", "", regex=True)
+    return s.str.replace(r"^(.+?),\s*(.+)$", r"\2 \1", regex=True)
+
+
+def _alias():
+    codigos, variantes = [], []
+    for codigo, nombre in PROVINCIAS["Provincia"].items():
+        partes = nombre.split("/")
+        for variante in [nombre, "/".join(partes[::-1]), *partes]:
+            codigos.append(codigo)
+            variantes.append(variante)
+    # Una sola normalización para todas: se ejecuta al importar el módulo
+    alias = dict(zip(normalizar_nombre(variantes), codigos))
+    return {"total": CODIGO_NACIONAL, "no residente": CODIGO_NO_RESIDENTE, **alias}
+
+
+_ALIAS = _alias()
+_CODIGOS_VALIDOS = set(PROVINCIAS.index) | {CODIGO_NACIONAL, CODIGO_NO_RESIDENTE}
+
+
+def codigos_provincia(etiquetas):
+    """Código INE de cada etiqueta ("02 Albacete", "Balears, Illes", "Total"...).
+
+    Usa el prefijo numérico cuando existe y, si no, el nombre normalizado.
+    Devuelve una Serie Int64 con <NA> donde la etiqueta no se reconoce.
+    """
+    s = pd.Series(etiquetas, dtype="object").astype(str).str.strip()
+    codigo = pd.to_numeric(s.str.extract(r"^(\d{1,2})\s", expand=False), errors="coerce")
+    por_nombre = normalizar_nombre(s.str.replace(r"^\d+\s*", "", regex=True)).map(_ALIAS)
+    codigo = codigo.fillna(por_nombre).astype("Int64")
+    return codigo.where(codigo.isin(_CODIGOS_VALIDOS))
+
+
+def unir_datos(gdf, tabla):
+    """Une a la geometría (columna `codigo`) una tabla indexada por código INE."""
+    return gdf.merge(tabla, left_on="codigo", right_index=True, how="left")
+
+
+def provincias_sin_datos(gdf, tabla):
+    """Nombres de las provincias del mapa que no tienen fila en `tabla`."""
+    return gdf.loc[~gdf["codigo"].isin(tabla.index), "Provincia"].tolist()
@@ -0,0 +1,236 @@
+"""Proyección de la población por el método de componentes por cohortes.
+
+Cada paso avanza un año la población por (provincia, sexo, edad) con sus tres
+componentes: los supervivientes envejecen un año, los nacimientos entran en la
+edad 0 y se suma el saldo migratorio. En forma matricial es la matriz de Leslie,
+
+    P(t + 1) = L · P(t) + M
+
+con las probabilidades de supervivencia en la subdiagonal de L, la fecundidad
+en su primera fila y los migrantes netos en M. L no se construye como matriz
+densa edad × edad: se aplica por bandas sobre un array (escenario, provincia,
+sexo, edad), así que las 52 provincias y todos los escenarios avanzan juntos
+en cada operación de NumPy.
+
+Los libros no traen edades por provincia ni tasas por edad, así que el punto
+de partida se calibra con lo que hay:
+
+    estructura por edad   la última pirámide nacional (cubo poblacion_edad),
+                          repartida entre provincias según su población por sexo
+    mortalidad            un patrón por edad tipo (Gompertz-Makeham) escalado en
+                          cada provincia y sexo para reproducir sus defunciones
+                          de los últimos AÑOS_CALIBRACION años (estandarización
+                          indirecta)
+    fecundidad            un calendario tipo por edad de la madre escalado del
+                          mismo modo con los nacimientos; el reparto por sexo de
+                          los recién nacidos es el observado en la provincia
+    migración             el saldo neto de cada provincia y sexo: lo que cambió
+                          su población menos el crecimiento natural, repartido
+                          por edad con el perfil del flujo de inmigración
+
+Un escenario multiplica la fecundidad, la mortalidad y la migración de la
+calibración (ver ESCENARIOS):
+
+    resultado = proyeccion(ESCENARIOS, horizonte=25)
+    resultado["poblacion"].sel(escenario="Tendencial", provincia=28, sexo="Total").suma("edad")
+"""
+import numpy as np
+import pandas as pd
+
+from utils.artefactos import version_tabla
+from utils.compartido import compartido
+from utils.cubo import CUBOS, SEXOS, Cubo, cubo
+from utils.provincias import CODIGO_NACIONAL, PROVINCIAS
+
+EDAD_MAXIMA = 100  # grupo abierto "100 y más"
+AÑOS_CALIBRACION = 5
+HORIZONTE = 25
+COMPONENTES = ["Nacimientos", "Defunciones", "Migración neta"]
+
+# Escenario -> multiplicadores de (fecundidad, mortalidad, migración)
+ESCENARIOS = {
+    "Tendencial": (1.0, 1.0, 1.0),
+    "Fecundidad baja": (0.8, 1.0, 1.0),
+    "Fecundidad alta": (1.2, 1.0, 1.0),
+    "Mortalidad baja": (1.0, 0.85, 1.0),
+    "Sin migración": (1.0, 1.0, 0.0),
+    "Migración alta": (1.0, 1.0, 1.5),
+}
+
+_FUENTES = ["poblacion", "poblacion_edad", "nacimientos", "defunciones", "inmigracion"]
+_SEXOS = ["Hombres", "Mujeres"]
+
+
+def patron_mortalidad(edades):
+    """Tasas de mortalidad tipo por edad: Gompertz-Makeham más la mortalidad infantil.
+
+    Solo importa su forma; el nivel lo fija la calibración de cada provincia.
+    """
+    tasas = 1e-4 + 2e-5 * np.exp(0.097 * edades)
+    return tasas + np.where(edades == 0, 2.7e-3, 0.0)
+
+
+def patron_fecundidad(edades):
+    """Calendario tipo de la fecundidad por edad de la madre (15-49 años), de suma 1."""
+    forma = np.where((edades >= 15) & (edades <= 49), np.exp(-0.5 * ((edades - 32) / 5.5) ** 2), 0.0)
+    return forma / forma.sum()
+
+
+def _grupo_abierto(valores):
+    # Acumula en EDAD_MAXIMA las edades que la superan (último eje)
+    valores = np.nan_to_num(valores)
+    resultado = np.zeros(valores.shape[:-1] + (EDAD_MAXIMA + 1,))
+    hasta = min(valores.shape[-1], EDAD_MAXIMA + 1)
+    resultado[..., :hasta] = valores[..., :hasta]
+    resultado[..., -1] += valores[..., EDAD_MAXIMA + 1:].sum(axis=-1)
+    return resultado
+
+
+def calibrar():
+    """Población de partida y tasas de cada provincia y sexo, como arrays (provincia, sexo, edad)."""
+    edades = np.arange(EDAD_MAXIMA + 1)
+    codigos = PROVINCIAS.index
+    piramides = cubo("poblacion_edad")
+    base = piramides.ejes["periodo"][-1]
+    piramide = _grupo_abierto(piramides.sel(periodo=base, sexo=_SEXOS).valores)
+
+    # Reparto de cada edad y sexo nacional entre provincias según su población más reciente
+    poblacion = cubo("poblacion").sel(provincia=list(codigos), sexo=_SEXOS)
+    reciente = np.nan_to_num(poblacion.valores[-1])
+    inicial = (reciente / reciente.sum(axis=0))[..., None] * piramide
+
+    # Años con nacimientos, defunciones y la población a 1 de enero del año y del siguiente
+    eneros = poblacion.ejes["periodo"][(poblacion.ejes["periodo"].month == 1) & (poblacion.ejes["periodo"].day == 1)]
+    nacimientos, defunciones = (cubo(c).sel(provincia=list(codigos), sexo=_SEXOS) for c in ("nacimientos", "defunciones"))
+    ultimo = min(nacimientos.ejes["periodo"][-1].year, eneros[-1].year - 1)
+    años = pd.period_range(end=str(ultimo), periods=AÑOS_CALIBRACION, freq="Y")
+    nacidos = np.nan_to_num(nacimientos.sel(periodo=años).valores)        # (año, provincia, sexo)
+    fallecidos = np.nan_to_num(defunciones.sel(periodo=años).valores)
+    principio = np.nan_to_num(poblacion.sel(periodo=años.start_time).valores)
+    final = np.nan_to_num(poblacion.sel(periodo=(años + 1).start_time).valores)
+    saldo = (final - principio - (nacidos - fallecidos)).mean(axis=0)
+
+    mortalidad_tipo = patron_mortalidad(edades)
+    esperadas = (inicial * mortalidad_tipo).sum(axis=-1)
+    mortalidad = (fallecidos.mean(axis=0) / esperadas)[..., None] * mortalidad_tipo
+
+    fecundidad_tipo = patron_fecundidad(edades)
+    nacidos_medios = nacidos.mean(axis=0)
+    madres = (inicial[:, 1] * fecundidad_tipo).sum(axis=-1)
+    fecundidad = (nacidos_medios.sum(axis=1) / madres)[:, None] * fecundidad_tipo
+
+    inmigracion = cubo("inmigracion").sel(sexo=_SEXOS)
+    perfil = _grupo_abierto(inmigracion.valores[-AÑOS_CALIBRACION:].mean(axis=0))
+    perfil /= perfil.sum(axis=-1, keepdims=True)
+
+    return {
+        "base": base,
+        "años_calibracion": años,
+        "codigos": codigos,
+        "poblacion": inicial,                                   # (provincia, sexo, edad)
+        "mortalidad": mortalidad,                               # (provincia, sexo, edad)
+        "fecundidad": fecundidad,                               # (provincia, edad de la madre)
+        "reparto_sexo": nacidos_medios / nacidos_medios.sum(axis=1, keepdims=True),  # (provincia, sexo)
+        "migrantes": saldo[..., None] * perfil,                 # (provincia, sexo, edad)
+    }
+
+
+def _por_escenario(factores, array):
+    # (escenario,) x (...) -> (escenario, ...)
+    return factores.reshape((-1,) + (1,) * array.ndim) * array[None]
+
+
+def avanzar(calibracion, factores):
+    """Generador de la proyección año a año, con multiplicadores que pueden cambiar cada año.
+
+    `factores` es un array (3, escenario, año) con los de fecundidad, mortalidad
+    y migración. Produce, tras cada año, la población (escenario, provincia,
+    sexo, edad) a 1 de enero del siguiente y los flujos del año (escenario,
+    provincia, componente).
+    """
+    factores = np.asarray(factores, dtype="float64")
+    poblacion = np.broadcast_to(calibracion["poblacion"], factores.shape[1:2] + calibracion["poblacion"].shape).copy()
+    reparto_sexo = calibracion["reparto_sexo"][None]                                # (1, p, s)
+    for fecundidad, mortalidad, migracion in np.moveaxis(factores, 2, 0):
+        tasas = _por_escenario(mortalidad, calibracion["mortalidad"])               # (e, p, s, edad)
+        supervivencia = np.exp(-tasas)
+        migrantes = _por_escenario(migracion, calibracion["migrantes"])             # (e, p, s, edad)
+        madres = np.einsum("epa,pa->ep", poblacion[:, :, 1], calibracion["fecundidad"])
+        nacidos = (fecundidad[:, None] * madres)[..., None] * reparto_sexo          # (e, p, s)
+        siguiente = np.empty_like(poblacion)
+        siguiente[..., 1:] = poblacion[..., :-1] * supervivencia[..., :-1]
+        siguiente[..., -1] += poblacion[..., -1] * supervivencia[..., -1]
+        siguiente[..., 0] = nacidos * np.exp(-tasas[..., 0] / 2)
+        defunciones = poblacion.sum(axis=-1) - siguiente[..., 1:].sum(axis=-1) + nacidos - siguiente[..., 0]
+        siguiente += migrantes
+        np.maximum(siguiente, 0, out=siguiente)
+        poblacion = siguiente
+        yield poblacion, np.stack(
+            [nacidos.sum(axis=-1), defunciones.sum(axis=-1), migrantes.sum(axis=(-2, -1))], axis=-1
+        )
+
+
+def proyectar(calibracion, escenarios, horizonte=HORIZONTE):
+    """Proyecta todos los escenarios y provincias a la vez.
+
+    `escenarios` asocia cada nombre a sus multiplicadores (fecundidad,
+    mortalidad, migración). Devuelve dos cubos: "poblacion" a 1 de enero
+    (escenario, año, provincia, sexo, edad) y "componentes" de cada año
+    (escenario, año, provincia, componente); la provincia CODIGO_NACIONAL y el
+    sexo "Total" son las sumas.
+    """
+    nombres = list(escenarios)
+    factores = np.array([escenarios[n] for n in nombres], dtype="float64").T       # (3, e)
+    factores = np.repeat(factores[..., None], horizonte, axis=2)
+
+    inicial = calibracion["poblacion"]
+    serie = np.empty((horizonte + 1, len(nombres)) + inicial.shape, dtype="float32")
+    componentes = np.empty((horizonte, len(nombres), inicial.shape[0], len(COMPONENTES)), dtype="float32")
+    serie[0] = inicial
+    for t, (poblacion, flujos) in enumerate(avanzar(calibracion, factores)):
+        serie[t + 1] = poblacion
+        componentes[t] = flujos
+
+    # Total nacional y de ambos sexos, como en el resto de cubos
+    serie = np.moveaxis(serie, 0, 1)                                                # (e, año, p, s, edad)
+    serie = np.concatenate([serie.sum(axis=3, keepdims=True), serie], axis=3)
+    serie = np.concatenate([serie.sum(axis=2, keepdims=True), serie], axis=2)
+    componentes = np.moveaxis(componentes, 0, 1)
+    componentes = np.concatenate([componentes.sum(axis=2, keepdims=True), componentes], axis=2)
+
+    base = calibracion["base"].year
+    provincias = pd.Index([CODIGO_NACIONAL, *calibracion["codigos"]], dtype="int16")
+    escenario = pd.Index(nombres)
+    return {
+        "poblacion": Cubo(serie, {
+            "escenario": escenario,
+            "año": pd.period_range(str(base), periods=horizonte + 1, freq="Y"),
+            "provincia": provincias,
+            "sexo": SEXOS,
+            "edad": pd.Index(np.arange(EDAD_MAXIMA + 1)),
+        }),
+        "componentes": Cubo(componentes, {
+            "escenario": escenario,
+            "año": pd.period_range(str(base), periods=horizonte, freq="Y"),
+            "provincia": provincias,
+            "componente": pd.Index(COMPONENTES),
+        }),
+    }
+
+
+def version_calibracion():
+    """Versiones de los libros de los que sale la calibración."""
+    return tuple(version_tabla(tabla) for fuente in _FUENTES for tabla in CUBOS[fuente][1])
+
+
+@compartido(show_spinner=False, max_entries=16)
+def _proyeccion(escenarios, horizonte, versiones):
+    return proyectar(calibrar(), escenarios, horizonte)
+
+
+def proyeccion(escenarios=None, horizonte=HORIZONTE):
+    """`proyectar` sobre la calibración actual, compartida entre sesiones y reruns.
+
+    Se recalcula si cambia alguno de los libros de los que salen los cubos.
+    """
+    return _proyeccion(dict(escenarios or ESCENARIOS), horizonte, version_calibracion())
@@ -0,0 +1,100 @@
+"""Panel de rendimiento para desarrollo.
+
+Se activa con la variable de entorno PANEL_RENDIMIENTO=1, para todas las
+sesiones, o con PANEL_RENDIMIENTO=url, que lo activa solo en las sesiones que
+abran la app con `?rendimiento=1` en la URL (queda activo para el resto de la
+sesión). Sin la variable el parámetro no hace nada: medir envuelve para todo el
+proceso `__import__` y varias funciones de librerías (utils.tiempos), algo que
+una URL de un servidor en producción no debe poder provocar. Muestra en
+la barra lateral lo que ha tardado la última ejecución de la página, desglosado
+por fase (ver utils.tiempos), y los aciertos y fallos de las funciones
+cacheadas con `utils.tiempos.cache_data`, tanto de esa ejecución como de toda
+la sesión, el estado de las cachés de artefactos (utils.artefactos), que es
+común a todas las sesiones, y la memoria del proceso y de la sesión (ver
+utils.memoria).
+
+Cada página llama a `iniciar_panel()` tras los imports y a `mostrar_panel()`
+al final. Con el panel desactivado ninguna de las dos hace nada.
+"""
+import os
+import time
+
+import pandas as pd
+import streamlit as st
+
+from utils import tiempos
+
+_ACTIVO = "_rendimiento_activo"
+_CACHE_SESION = "_rendimiento_cache"
+
+
+def panel_activo():
+    modo = os.environ.get("PANEL_RENDIMIENTO", "").lower()
+    if modo in ("1", "true", "si", "sí"):
+        return True
+    if modo != "url":
+        return False
+    if st.query_params.get("rendimiento") in ("1", "true"):
+        st.session_state[_ACTIVO] = True
+    return st.session_state.get(_ACTIVO, False)
+
+
+def iniciar_panel():
+    """Empieza a medir la ejecución actual de la página si el panel está activo."""
+    if not panel_activo():
+        # Por si una ejecución anterior en este hilo terminó con st.stop()
+        tiempos.desactivar_en_hilo()
+        return
+    tiempos.instrumentar()
+    tiempos.activar_en_hilo()
+
+
+def _tabla_cache(ejecucion, sesion):
+    filas = {
+        nombre: {
+            "llamadas": ejecucion.get(nombre, {}).get("llamadas", 0),
+            "aciertos": ejecucion.get(nombre, {}).get("aciertos", 0),
+            "fallos": ejecucion.get(nombre, {}).get("fallos", 0),
+            "aciertos (sesión)": cuenta["aciertos"],
+            "fallos (sesión)": cuenta["fallos"],
+        }
+        for nombre, cuenta in sesion.items()
+    }
+    return pd.DataFrame.from_dict(filas, orient="index")
+
+
+def mostrar_panel():
+    """Dibuja el panel con lo medido desde `iniciar_panel()`."""
+    registro = tiempos.desactivar_en_hilo()
+    if registro is None:
+        return
+    total = time.perf_counter() - registro.inicio
+
+    ejecucion = registro.resumen_cache()
+    sesion = st.session_state.setdefault(_CACHE_SESION, {})
+    for nombre, cuenta in ejecucion.items():
+        acumulado = sesion.setdefault(nombre, {"aciertos": 0, "fallos": 0})
+        acumulado["aciertos"] += cuenta["aciertos"]
+        acumulado["fallos"] += cuenta["fallos"]
+
+    with st.sidebar.expander("⏱️ Rendimiento", expanded=True):
+        st.metric("Ejecución de la página", f"{total * 1000:.0f} ms")
+        fases = pd.DataFrame.from_dict(registro.resumen(), orient="index")
+        if fases.empty:
+            st.caption("Ninguna fase instrumentada en esta ejecución.")
+        else:
+            fases["ms"] = (fases.pop("segundos") * 1000).round(1)
+            st.dataframe(fases.sort_values("ms", ascending=False)[["ms", "llamadas"]])
+        if sesion:
+            st.dataframe(_tabla_cache(ejecucion, sesion))
+
+        from utils.artefactos import estadisticas
+
+        st.caption("Artefactos renderizados (todas las sesiones)")
+        st.dataframe(pd.DataFrame.from_dict(estadisticas(), orient="index"))
+
+        from utils.memoria import memoria_sesion, rss_mb
+
+        columna_proceso, columna_sesion = st.columns(2)
+        columna_proceso.metric("Memoria del proceso", f"{rss_mb():.0f} MB")
+        columna_sesion.metric("Estado de la sesión", f"{memoria_sesion() / 1024:.0f} kB")
@@ -0,0 +1,238 @@
+"""Medición de las fases costosas de las páginas (lecturas, merge, GeoJSON, gráficos).
+
+`instrumentar()` envuelve, una sola vez por proceso, las funciones de las
+librerías listadas en FASES. No importa nada: las de módulos ya cargados se
+envuelven en el momento y las demás en cuanto se importa su módulo, desde el
+propio `__import__` instrumentado, así que la importación en frío de esas
+librerías también se mide. Mientras haya un `Registro` activo, cada llamada
+suma su duración a la fase correspondiente; sin registro activo el único coste
+es una comprobación. Los tiempos son inclusivos y las llamadas anidadas a una
+misma fase (p. ej. `px.scatter` -> `go.Figure`) se cuentan una sola vez.
+
+Hay dos ámbitos de registro: el global (`activar`), que usa el benchmark para
+medir lo que ocurra en cualquier hilo, y el del hilo actual (`activar_en_hilo`),
+que usa el panel de rendimiento para medir solo la ejecución de su sesión.
+`cache_data` y `cache_resource` sustituyen a las de Streamlit y anotan además
+aciertos y fallos; otras cachés (utils.artefactos) los anotan con `anotar_cache`.
+"""
+import builtins
+import functools
+import sys
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+import streamlit as st
+
+# (módulo, atributo, fase)
+FASES = [
+    ("builtins", "__import__", "importacion"),
+    ("json", "loads", "json"),
+    ("pandas", "read_excel", "carga_excel"),
+    ("pandas", "read_parquet", "carga_parquet"),
+    ("pandas", "DataFrame.merge", "merge"),
+    ("geopandas.base", "GeoPandasBase.simplify", "simplify"),
+    ("geopandas", "GeoDataFrame.to_json", "to_json"),
+    ("folium", "GeoJson.__init__", "folium_geojson"),
+    ("branca.element", "Figure.render", "mapa_html"),
+    ("plotly.graph_objects", "Figure.__init__", "graficos"),
+    ("plotly.express", "scatter", "graficos"),
+    ("plotly.express", "line", "graficos"),
+    ("plotly.express", "bar", "graficos"),
+    ("streamlit", "altair_chart", "graficos"),
+    ("streamlit", "plotly_chart", "graficos"),
+    ("streamlit", "line_chart", "graficos"),
+    ("streamlit", "vega_lite_chart", "graficos"),
+    # Sustituye a st_folium desde que los mapas se envían como HTML
+    ("streamlit.components.v1", "html", "componente_html"),
+]
+
+
+class Registro:
+    """Segundos y número de llamadas por fase, y llamadas/fallos por función cacheada."""
+
+    def __init__(self):
+        self.inicio = time.perf_counter()
+        self.segundos = defaultdict(float)
+        self.llamadas = defaultdict(int)
+        self.cache = defaultdict(lambda: {"llamadas": 0, "fallos": 0})
+        self._profundidad = defaultdict(int)
+
+    def resumen(self):
+        return {
+            fase: {"segundos": round(self.segundos[fase], 4), "llamadas": self.llamadas[fase]}
+            for fase in sorted(self.segundos)
+        }
+
+    def resumen_cache(self):
+        return {
+            nombre: dict(cuenta, aciertos=cuenta["llamadas"] - cuenta["fallos"])
+            for nombre, cuenta in sorted(self.cache.items())
+        }
+
+
+_activo = None
+_hilo = threading.local()
+
+
+def _registros():
+    return [r for r in (_activo, getattr(_hilo, "registro", None)) if r is not None]
+
+
+def activar(registro=None):
+    """Empieza a acumular en `registro` (uno nuevo si no se indica) y lo devuelve."""
+    global _activo
+    _activo = registro if registro is not None else Registro()
+    return _activo
+
+
+def desactivar():
+    global _activo
+    registro, _activo = _activo, None
+    return registro
+
+
+def activar_en_hilo(registro=None):
+    """Como `activar`, pero solo para lo que se ejecute en el hilo actual."""
+    _hilo.registro = registro if registro is not None else Registro()
+    return _hilo.registro
+
+
+def desactivar_en_hilo():
+    registro, _hilo.registro = getattr(_hilo, "registro", None), None
+    return registro
+
+
+@contextmanager
+def fase(nombre):
+    registros = _registros()
+    if not registros:
+        yield
+        return
+    for registro in registros:
+        registro._profundidad[nombre] += 1
+    inicio = time.perf_counter()
+    try:
+        yield
+    finally:
+        duracion = time.perf_counter() - inicio
+        for registro in registros:
+            registro._profundidad[nombre] -= 1
+            if registro._profundidad[nombre] == 0:
+                registro.segundos[nombre] += duracion
+                registro.llamadas[nombre] += 1
+
+
+def anotar_cache(nombre, fallo=False):
+    """Cuenta una consulta (y, si `fallo`, un fallo) de la caché `nombre` en los registros activos."""
+    for registro in _registros():
+        registro.cache[nombre]["llamadas"] += 1
+        if fallo:
+            registro.cache[nombre]["fallos"] += 1
+
+
+def _cache(decorador, funcion, opciones):
+    nombre = funcion.__qualname__
+
+    @functools.wraps(funcion)
+    def calcular(*args, **kwargs):
+        # Solo se ejecuta cuando el valor no está en la caché
+        for registro in _registros():
+            registro.cache[nombre]["fallos"] += 1
+        return funcion(*args, **kwargs)
+
+    cacheada = decorador(**opciones)(calcular)
+
+    @functools.wraps(funcion)
+    def llamar(*args, **kwargs):
+        for registro in _registros():
+            registro.cache[nombre]["llamadas"] += 1
+        return cacheada(*args, **kwargs)
+
+    llamar.clear = cacheada.clear
+    return llamar
+
+
+def cache_data(funcion=None, **opciones):
+    """`st.cache_data` que anota llamadas y fallos en los registros activos.
+
+    Se usa igual: `@cache_data` o `@cache_data(show_spinner=False)`.
+    """
+    if funcion is None:
+        return lambda f: cache_data(f, **opciones)
+    return _cache(st.cache_data, funcion, opciones)
+
+
+def cache_resource(funcion=None, **opciones):
+    """Lo mismo sobre `st.cache_resource` (ver utils.compartido)."""
+    if funcion is None:
+        return lambda f: cache_resource(f, **opciones)
+    return _cache(st.cache_resource, funcion, opciones)
+
+
+def _envolver(funcion, nombre):
+    @functools.wraps(funcion)
+    def medida(*args, **kwargs):
+        with fase(nombre):
+            return funcion(*args, **kwargs)
+
+    medida._fase = nombre
+    return medida
+
+
+_pendientes = []
+_parcheando = threading.local()
+_cerrojo_pendientes = threading.RLock()
+
+
+def _parchear(modulo, ruta, nombre):
+    """Envuelve `modulo.ruta`; False si el módulo (o el atributo) aún no está cargado."""
+    propietario = sys.modules.get(modulo)
+    *contenedores, atributo = ruta.split(".")
+    for contenedor in contenedores:
+        propietario = getattr(propietario, contenedor, None)
+    if propietario is None:
+        return False
+    original = getattr(propietario, atributo, None)
+    if original is None:
+        return False
+    if not getattr(original, "_fase", None):
+        setattr(propietario, atributo, _envolver(original, nombre))
+    return True
+
+
+def _parchear_pendientes():
+    # Los getattr pueden importar (módulos con __getattr__ perezoso): no se reentra
+    if getattr(_parcheando, "activo", False):
+        return
+    _parcheando.activo = True
+    try:
+        with _cerrojo_pendientes:
+            _pendientes[:] = [entrada for entrada in _pendientes if not _parchear(*entrada)]
+    finally:
+        _parcheando.activo = False
+
+
+def _envolver_importacion(importar, nombre):
+    @functools.wraps(importar)
+    def importacion(*args, **kwargs):
+        with fase(nombre):
+            modulo = importar(*args, **kwargs)
+        if _pendientes:
+            _parchear_pendientes()
+        return modulo
+
+    importacion._fase = nombre
+    return importacion
+
+
+def instrumentar():
+    """Envuelve las funciones de FASES, las de módulos aún no importados al importarse. Es idempotente."""
+    with _cerrojo_pendientes:
+        for modulo, ruta, nombre in FASES:
+            if (modulo, ruta) == ("builtins", "__import__"):
+                if not getattr(builtins.__import__, "_fase", None):
+                    builtins.__import__ = _envolver_importacion(builtins.__import__, nombre)
+            elif (modulo, ruta, nombre) not in _pendientes and not _parchear(modulo, ruta, nombre):
+                _pendientes.append((modulo, ruta, nombre))